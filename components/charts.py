@@ -0,0 +1,79 @@
+import numpy as np
+import plotly.graph_objects as go
+import streamlit as st
+from src.decimation import decimate, quantile_bands
+
+# Points per line sent to the browser, about one per horizontal pixel of a wide chart
+POINT_BUDGET = 1200
+
+# --- Style variables ---
+line_colors = ["#E30A13", "#3366CC", "#FF9900", "#109618", "#990099", "#0099C6", "#DC3912", "#66AA00"]
+band_color = "51, 102, 204"
+
+
+def _figure(x_title, y_title, height):
+    fig = go.Figure()
+    fig.update_layout(
+        height=height,
+        margin=dict(l=0, r=0, t=30, b=0),
+        legend=dict(orientation="h", yanchor="bottom", y=1.0, x=0),
+        xaxis_title=x_title,
+        yaxis_title=y_title,
+        hovermode="x unified",
+    )
+    return fig
+
+
+def time_series_chart(x, series, x_title="Day", y_title=None, method="lttb", point_budget=POINT_BUDGET, height=360, key=None):
+    """
+    Lines of `series` over `x`, decimated on the server and drawn with WebGL.
+
+    series -> {name: values over x}
+    method -> "lttb" keeps each line's shape, "minmax" keeps every spike
+    """
+    fig = _figure(x_title, y_title, height)
+    for i, (name, y) in enumerate(series.items()):
+        xs, ys = decimate(x, y, point_budget, method)
+        fig.add_trace(
+            go.Scattergl(x=xs, y=ys, mode="lines", name=str(name), line=dict(color=line_colors[i % len(line_colors)]))
+        )
+    st.plotly_chart(fig, use_container_width=True, key=key)
+
+
+def series_band_chart(x, values, highlight=None, x_title="Day", y_title=None, point_budget=POINT_BUDGET, height=360, key=None):
+    """
+    Spread of many series over `x` as quantile bands, instead of one line per series.
+
+    Every step is reduced to its 5/25/50/75/95th percentile across the series
+    on the server, and each band edge is min/max decimated so spikes survive,
+    so the browser gets a few thousand points whatever the number of series.
+
+    values -> (len(x), n_series) array, e.g. a SimulationResult series
+    highlight -> {name: values over x} drawn as lines on top of the bands
+    """
+    fig = _figure(x_title, y_title, height)
+    p05, p25, p50, p75, p95 = quantile_bands(values, [0.05, 0.25, 0.5, 0.75, 0.95])
+    for lower, upper, name, opacity in [(p05, p95, "5-95th percentile", 0.15), (p25, p75, "25-75th percentile", 0.3)]:
+        # One closed polygon per band: the upper edge left to right, the lower edge back
+        x_upper, y_upper = decimate(x, upper, point_budget, "minmax")
+        x_lower, y_lower = decimate(x, lower, point_budget, "minmax")
+        fig.add_trace(
+            go.Scattergl(
+                x=np.concatenate([x_upper, x_lower[::-1]]),
+                y=np.concatenate([y_upper, y_lower[::-1]]),
+                fill="toself",
+                fillcolor=f"rgba({band_color}, {opacity})",
+                line=dict(width=0),
+                mode="lines",
+                name=name,
+                hoverinfo="skip",
+            )
+        )
+    xs, ys = decimate(x, p50, point_budget, "lttb")
+    fig.add_trace(go.Scattergl(x=xs, y=ys, mode="lines", name="Median", line=dict(color=f"rgb({band_color})")))
+    for i, (name, y) in enumerate((highlight or {}).items()):
+        xs, ys = decimate(x, y, point_budget, "lttb")
+        fig.add_trace(
+            go.Scattergl(x=xs, y=ys, mode="lines", name=str(name), line=dict(color=line_colors[i % len(line_colors)]))
+        )
+    st.plotly_chart(fig, use_container_width=True, key=key)
@@ -1,5 +1,7 @@
 import os
+import streamlit as st
 import streamlit.components.v1 as components
+from src.chunked_upload import CHUNK_SIZE, ChunkedUploadReceiver
 
 # Absolute path to frontend/build
 parent_dir = os.path.dirname(os.path.abspath(__file__))
@@ -9,6 +11,35 @@ build_dir = os.path.join(parent_dir, "frontend", "build")
 print("📁 Custom component build path:", build_dir)
 
 # Declare the component
-file_manager_component = components.declare_component(
+_file_manager_component = components.declare_component(
     "file_manager", path=build_dir  # This uses the built frontend
-)
\ No newline at end of file
+)
+
+
+def file_manager_component(key):
+    """
+    Upload button streaming the file in raw byte frames.
+
+    Returns {"type": "upload", "filename", "path", "md5", "size"} on the run the
+    last frame arrives, None otherwise. Older builds sending the whole file as
+    base64 {"type": "upload", "filename", "content"} are passed through.
+    """
+    receiver_key = f"__upload_receiver_{key}"
+    if receiver_key not in st.session_state:
+        st.session_state[receiver_key] = ChunkedUploadReceiver()
+    receiver = st.session_state[receiver_key]
+
+    # Ingest the latest frame before rendering, so this run already acknowledges it
+    value = st.session_state.get(key)
+    upload = None
+    if isinstance(value, (bytes, bytearray)):
+        try:
+            upload = receiver.receive(value)
+        except ValueError as e:
+            receiver.discard()
+            st.error(f"❌ Upload failed: {e}")
+
+    action = _file_manager_component(key=key, ack=receiver.ack, chunk_size=CHUNK_SIZE, default=None)
+    if upload is not None:
+        return upload
+    return None if isinstance(action, (bytes, bytearray)) else action
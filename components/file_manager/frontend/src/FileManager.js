@@ -1,16 +1,64 @@
-import React, { useEffect } from "react";
+import React, { useEffect, useRef } from "react";
 import { Streamlit } from "streamlit-component-lib";
 import UploadIcon from "./assets/UploadIcon.svg";
 
+const DEFAULT_CHUNK_SIZE = 4 * 1024 * 1024;
+
+// Frame: 4-byte big-endian header length, JSON header, raw chunk bytes
+const buildFrame = (header, chunk) => {
+  const headerBytes = new TextEncoder().encode(JSON.stringify(header));
+  const frame = new Uint8Array(4 + headerBytes.length + chunk.byteLength);
+  new DataView(frame.buffer).setUint32(0, headerBytes.length);
+  frame.set(headerBytes, 4);
+  frame.set(new Uint8Array(chunk), 4 + headerBytes.length);
+  return frame;
+};
+
 const FileUploader = () => {
+  const uploadRef = useRef(null);
+  const chunkSizeRef = useRef(DEFAULT_CHUNK_SIZE);
+
+  const sendChunk = async (upload) => {
+    const start = upload.index * upload.chunkSize;
+    const chunk = await upload.file.slice(start, start + upload.chunkSize).arrayBuffer();
+    Streamlit.setComponentValue(
+      buildFrame(
+        {
+          upload_id: upload.id,
+          filename: upload.file.name,
+          index: upload.index,
+          total_chunks: upload.totalChunks,
+          size: upload.file.size,
+        },
+        chunk
+      )
+    );
+  };
+
   useEffect(() => {
     Streamlit.setComponentReady();
     Streamlit.setFrameHeight(40);
-  }, []);
 
-  const sendToStreamlit = (type, payload = {}) => {
-    Streamlit.setComponentValue({ type, ...payload });
-  };
+    // Python acknowledges every frame through the component args, then the next one is sent
+    const onRender = (event) => {
+      const { ack, chunk_size } = event.detail.args;
+      if (chunk_size) {
+        chunkSizeRef.current = chunk_size;
+      }
+      const upload = uploadRef.current;
+      if (!upload || !ack || ack.upload_id !== upload.id || ack.index !== upload.index) {
+        return;
+      }
+      if (upload.index + 1 >= upload.totalChunks) {
+        uploadRef.current = null;
+        return;
+      }
+      upload.index += 1;
+      sendChunk(upload);
+    };
+    Streamlit.events.addEventListener(Streamlit.RENDER_EVENT, onRender);
+    return () => Streamlit.events.removeEventListener(Streamlit.RENDER_EVENT, onRender);
+  }, []);
 
   const handleUpload = () => {
     const input = document.createElement("input");
@@ -18,15 +66,16 @@ const FileUploader = () => {
     input.onchange = (e) => {
       const file = e.target.files[0];
       if (file) {
-        const reader = new FileReader();
-        reader.onload = () => {
-          const data = reader.result;
-          sendToStreamlit("upload", {
-            filename: file.name,
-            content: data.split(",")[1],
-          });
+        const chunkSize = chunkSizeRef.current;
+        const upload = {
+          id: `${Date.now()}-${Math.random().toString(36).slice(2)}`,
+          file,
+          chunkSize,
+          index: 0,
+          totalChunks: Math.max(1, Math.ceil(file.size / chunkSize)),
         };
-        reader.readAsDataURL(file);
+        uploadRef.current = upload;
+        sendChunk(upload);
       }
     };
     input.click();
@@ -2,6 +2,7 @@ import streamlit as st
 import pandas as pd
 import base64
 import hashlib
+import os
 from io import BytesIO
 from streamlit_extras.stylable_container import stylable_container
 from PIL import Image
@@ -9,14 +10,37 @@ from components.file_manager import file_manager_component
 from .ui_helpers import container_css_styles
 from .session_state_manager import init_session_state, reset_session_state
 from components.ui_helpers import get_default_network_tables
-from src.simulation_check import SimulationExecutionCheck
+from src.simulation_check import SimulationExecutionCheck, sort_report
+from src.network_model import NetworkModel
+from src.incremental_validation import (
+    LEVEL_DEPENDENCIES,
+    IncrementalValidator,
+    has_edits,
+    report_statuses,
+)
+from src.validation_cache import NETWORK, ValidationCache
+from src.compact_tables import expand_table
+from src.table_window import filter_labels, filter_options, merge_window
+from src.workbook_ingest import read_level_table, read_network_workbook
+from src.table_export import EXPORT_FORMATS, export_file_name, export_tables
 
 # ---------- Helpers ----------
 def _is_upload(d):
-    return isinstance(d, dict) and d.get("type") == "upload" and "content" in d
-
-def _md5_from_b64(b64_str: str) -> str:
-    return hashlib.md5(base64.b64decode(b64_str)).hexdigest()
+    return isinstance(d, dict) and d.get("type") == "upload" and ("path" in d or "content" in d)
+
+def _upload_source(action: dict):
+    """(md5, excel source) of an upload, streamed uploads arrive hashed in a temp file."""
+    if "path" in action:
+        return action["md5"], action["path"]
+    # Older component builds send the whole file base64 encoded
+    file_bytes = base64.b64decode(action["content"])
+    return hashlib.md5(file_bytes).hexdigest(), BytesIO(file_bytes)
+
+def _release_upload(action: dict):
+    """Remove a streamed upload's temp file once it has been ingested."""
+    path = action.get("path")
+    if path and os.path.exists(path):
+        os.remove(path)
 
 def _editor_key_for(tab_name: str) -> str:
     return f"editor_{tab_name.replace(' ', '_')}"
@@ -26,69 +50,70 @@ def _sync_latest(tab_name: str):
     df_key = _editor_key_for(tab_name)
     buf_df = st.session_state.get(df_key)
     if isinstance(buf_df, pd.DataFrame):
-        st.session_state.tables[tab_name] = buf_df.copy()
-
-def _build_single_sheet(tab: str) -> bytes:
-    _sync_latest(tab)
-    buf = BytesIO()
-    st.session_state.tables.get(tab, pd.DataFrame()).to_excel(buf, index=False)
-    buf.seek(0)
-    return buf.getvalue()
-
-def _build_all_sheets(tabs_in_order: list[str]) -> bytes:
-    buf = BytesIO()
-    with pd.ExcelWriter(buf, engine="xlsxwriter") as writer:
-        for sheet in tabs_in_order:
+        st.session_state.tables[tab_name] = buf_df
+
+def _lazy_download(sheets: list[str], name: str, key: str):
+    """Format picker & download button, the file is only built once it is requested."""
+    fmt = st.radio("Format", list(EXPORT_FORMATS), key=f"format_{key}", horizontal=True)
+    prepared_key = f"__export_{key}"
+    if st.button("Prepare download", key=f"prepare_{key}", icon=":material/build:"):
+        st.session_state[prepared_key] = True
+    if st.session_state.get(prepared_key):
+        # Memoized by table content, unchanged tables are not serialized again
+        for sheet in sheets:
             _sync_latest(sheet)
-            df = st.session_state.tables.get(sheet, pd.DataFrame())
-            df.to_excel(writer, sheet_name=sheet[:31], index=False)
-    buf.seek(0)
-    return buf.getvalue()
+        file_name, mime = export_file_name(name, fmt)
+        st.download_button(
+            label="Download",
+            data=export_tables(st.session_state.tables, fmt, sheets),
+            file_name=file_name,
+            mime=mime,
+            key=f"download_btn_{key}",
+            on_click="ignore",
+            icon=":material/download:",
+        )
 
 # ---------- Validation ----------
 def run_validations():
     """Run all validation checks and store results in session_state."""
-    sim_checker = SimulationExecutionCheck()
-
-    # Current tables
-    factory_level = st.session_state.tables.get("Factory Level", pd.DataFrame())
-    warehouse_level = st.session_state.tables.get("Warehouse Level", pd.DataFrame())
-    factory_product_level = st.session_state.tables.get("Factory Product Level", pd.DataFrame())
-    warehouse_factory_level = st.session_state.tables.get("Warehouse Factory Level", pd.DataFrame())
-    warehouse_product_level = st.session_state.tables.get("Warehouse Product Level", pd.DataFrame())
-
-    # Run checks
-    factory_level_check = sim_checker.factory_level_check(factory_level)
-    warehouse_level_check = sim_checker.warehouse_level_check(warehouse_level)
-
-    if factory_level_check == "Passed":
-        factory_product_level_check = sim_checker.factory_product_level_check(factory_product_level, factory_level)
-
-        if (
-            factory_level_check == "Passed"
-            and warehouse_level_check == "Passed"
-            and factory_product_level_check == "Passed"
-        ):
-            warehouse_factory_level_check = sim_checker.warehouse_factory_level_check(
-                warehouse_factory_level, warehouse_level, factory_level, factory_product_level
-            )
-            if (
-                warehouse_level_check == "Passed"
-                and factory_product_level_check == "Passed"
-                and warehouse_factory_level_check == "Passed"
-            ):
-                warehouse_product_level_check = sim_checker.warehouse_product_level_check(
-                    warehouse_product_level, warehouse_level, factory_product_level, warehouse_factory_level
-                )
-            else:
-                warehouse_product_level_check = "Not-checked"
-        else:
-            warehouse_factory_level_check = "Not-checked"
-            warehouse_product_level_check = "Not-checked"
-    else:
-        factory_product_level_check = "Not-checked"
-        warehouse_factory_level_check = "Not-checked"
-        warehouse_product_level_check = "Not-checked"
+    # Current tables, shallow copies so nothing below changes the stored ones
+    tables = {name: df.copy(deep=False) for name, df in st.session_state.tables.items()}
+
+    # Issues of levels whose tables (and upstream tables) did not change are reused
+    if "validation_cache" not in st.session_state:
+        st.session_state.validation_cache = ValidationCache()
+    cache = st.session_state.validation_cache
+    keys = cache.keys(st.session_state.tables)
+    cached = {level: cache.get(level, keys[level]) for level in LEVEL_DEPENDENCIES}
+    stale = [level for level, entry in cached.items() if entry is None]
+
+    # Compile the network once, validation & simulation both read from it
+    model = cache.get(NETWORK, keys[NETWORK])
+    if model is None:
+        try:
+            model = NetworkModel(tables)
+        except Exception:
+            model = None
+    sim_checker = SimulationExecutionCheck(model, vectorized=True)
+
+    # Every issue across all levels, so users can fix them in one go
+    fresh = sim_checker.validation_report(tables, {level: None for level in stale})
+    issues = {
+        level: entry if entry is not None else fresh[fresh["Level"] == level]
+        for level, entry in cached.items()
+    }
+    st.session_state.validation_report = sort_report(pd.concat(issues.values(), ignore_index=True))
+    if "validator" not in st.session_state:
+        st.session_state.validator = IncrementalValidator()
+    st.session_state.validator.reset(st.session_state.validation_report)
+
+    # Statuses follow from the report, a level passes when it has no issues
+    statuses = report_statuses(st.session_state.validation_report)
+    factory_level_check = statuses["Factory Level"]
+    warehouse_level_check = statuses["Warehouse Level"]
+    factory_product_level_check = statuses["Factory Product Level"]
+    warehouse_factory_level_check = statuses["Warehouse Factory Level"]
+    warehouse_product_level_check = statuses["Warehouse Product Level"]
     # Show results in the UI
     st.subheader("Validation Results")
     st.write(f"🏭 Factory Level: {factory_level_check}")
@@ -99,6 +124,7 @@ def run_validations():
 
 
     # Save results
+    st.session_state.network_model = model
     st.session_state.validation_results = {
         "Factory Level": factory_level_check,
         "Warehouse Level": warehouse_level_check,
@@ -107,10 +133,33 @@ def run_validations():
         "Warehouse Product Level": warehouse_product_level_check,
     }
 
+    for level in LEVEL_DEPENDENCIES:
+        cache.put(level, keys[level], issues[level])
+    if model is not None:
+        cache.put(NETWORK, keys[NETWORK], model)
+
+
+def revalidate_edits(tab_name: str, previous_df: pd.DataFrame, editor_state: dict):
+    """Recheck only the rows touched by a data_editor delta and refresh the results."""
+    validator = st.session_state.validator
+    report = validator.apply_edits(st.session_state.tables, tab_name, previous_df, editor_state)
+    st.session_state.validation_report = report
+    # Statuses follow from the updated report, as in a full run
+    st.session_state.validation_results = report_statuses(report)
+    cache = st.session_state.validation_cache
+    keys = cache.keys(st.session_state.tables)
+    for level in LEVEL_DEPENDENCIES:
+        cache.put(level, keys[level], report[report["Level"] == level])
+    # Tables changed, the simulation compiles a fresh model on demand
+    st.session_state.network_model = None
+
 
 # --- Style variables ---
 text_color = "#E30A13"
 
+# Rows the table editor shows at a time
+PAGE_SIZES = [100, 500, 1000, 5000]
+
 def render_network_design():
     # --- Header ---
     with stylable_container(key="network_design_page", css_styles=container_css_styles):
@@ -151,6 +200,9 @@ def render_network_design():
             if tab not in st.session_state.tables:
                 st.session_state.tables[tab] = pd.DataFrame()
 
+        if "validator" not in st.session_state:
+            run_validations()  # ✅ run once per session, edits are rechecked incrementally
+
         # --- Top bar: Upload / Download All / Clear ---
         with st.container():
             _, col1, col2, col3 = st.columns([0.8, 0.05, 0.05, 0.05])
@@ -163,16 +215,13 @@ def render_network_design():
             action = st.session_state.get("action")
             if _is_upload(action):
                 try:
-                    fp = _md5_from_b64(action["content"])
+                    fp, source = _upload_source(action)
                     if st.session_state.get("_main_upload_md5") != fp:
-                        file_bytes = base64.b64decode(action["content"])
-                        excel_file = BytesIO(file_bytes)
-                        excel = pd.ExcelFile(excel_file)
-                        uploaded_sheets = {s: excel.parse(s) for s in excel.sheet_names}
+                        uploaded_sheets = read_network_workbook(source)
                         if uploaded_sheets:
                             for sheet_name, df in uploaded_sheets.items():
                                 if sheet_name in tabs:
-                                    st.session_state.tables[sheet_name] = df.copy()
+                                    st.session_state.tables[sheet_name] = df
                             run_validations()  # ✅ run after upload
                             st.session_state["_main_upload_md5"] = fp
                         else:
@@ -181,20 +230,13 @@ def render_network_design():
                     st.error("❌ Error reading Excel file. Please try again.")
                     st.exception(e)
                 finally:
+                    _release_upload(action)
                     st.session_state["action"] = None
 
             # Download All
             with col2:
-                clicked = st.download_button(
-                    label="",
-                    data=_build_all_sheets(tabs),
-                    file_name="network_new_data.xlsx",
-                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                    help="Download all edited data",
-                    icon=":material/download:"
-                )
-                if clicked:
-                    print("📤 Downloading all sheet data as Excel.")
+                with st.popover("", help="Download all edited data", icon=":material/download:"):
+                    _lazy_download(tabs, "network_new_data", "all")
 
             with col3:
                 if st.button("", help="Clear all uploaded data", icon=":material/delete:"):
@@ -203,13 +245,14 @@ def render_network_design():
                         k = _editor_key_for(t)
                         if k in st.session_state:
                             del st.session_state[k]
+                    run_validations()  # ✅ run after clear
                     st.toast("🗑️ All data cleared")
 
-        # --- Center tabs using CSS ---
+        # --- Center level selector using CSS ---
         st.markdown(
             """
             <style>
-            .stTabs [data-baseweb="tab-list"] {
+            .st-key-active_tab [role="radiogroup"] {
                 justify-content: center;
                 padding: 0.5em 0;
                 border-radius: 1em;
@@ -219,87 +262,109 @@ def render_network_design():
             unsafe_allow_html=True,
         )
 
-        # --- Tabs ---
-        tab_objects = st.tabs(tabs)
-        for tab_obj, tab_name in zip(tab_objects, tabs):
-            with tab_obj:
-                df_key = _editor_key_for(tab_name)
-
-                # Toolbar
-                with st.container():
-                    _, c1, c2, c3 = st.columns([0.8, 0.05, 0.05, 0.06])
-                    with c1:
-                        per_table_action = file_manager_component(key=f"file_manager_{df_key}")
-                        if _is_upload(per_table_action):
-                            try:
-                                fp = _md5_from_b64(per_table_action["content"])
-                                guard_key = f"__md5_{df_key}"
-                                if st.session_state.get(guard_key) != fp:
-                                    file_bytes = base64.b64decode(per_table_action["content"])
-                                    excel_file = BytesIO(file_bytes)
-                                    df_up = pd.read_excel(excel_file)
-                                    st.session_state.tables[tab_name] = df_up.copy()
-                                    run_validations()  # ✅ run after per-tab upload
-                                    st.session_state[guard_key] = fp
-                            except Exception as e:
-                                st.error(f"❌ Failed to upload {tab_name}")
-                                st.exception(e)
-
-                    with c2:
-                        clicked_tab = st.download_button(
-                            label="",
-                            data=_build_single_sheet(tab_name),
-                            file_name=f"{tab_name.replace(' ', '_')}.xlsx",
-                            mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                            key=f"download_btn_{df_key}",
-                            icon=":material/download:"
-                        )
-
-                    with c3:
-                        if st.button("", key=f"delete_{df_key}", icon=":material/delete:"):
-                            defaults = get_default_network_tables()
-                            st.session_state.tables[tab_name] = defaults.get(tab_name, pd.DataFrame())
-                            if df_key in st.session_state:
-                                del st.session_state[df_key]
-
-                # Table editor
-                container_css_table_styles = """
-                { padding-left: 2em; padding-right: 2em; }
-                """
-                with stylable_container(key=f"design_tables_{tab_name.replace(' ', '_')}",
-                                        css_styles=container_css_table_styles):
-
-                    df = st.session_state.tables.get(tab_name, pd.DataFrame())
-                    if df.empty:
-                        st.info("📂 No data available for this tab.")
+        # --- Active level, only its toolbar & editor are built ---
+        tab_name = st.radio("Level", tabs, key="active_tab", horizontal=True, label_visibility="collapsed")
+        df_key = _editor_key_for(tab_name)
+
+        # Toolbar
+        with st.container():
+            _, c1, c2, c3 = st.columns([0.8, 0.05, 0.05, 0.06])
+            with c1:
+                per_table_action = file_manager_component(key=f"file_manager_{df_key}")
+                if _is_upload(per_table_action):
+                    try:
+                        fp, source = _upload_source(per_table_action)
+                        guard_key = f"__md5_{df_key}"
+                        if st.session_state.get(guard_key) != fp:
+                            df_up = read_level_table(source, tab_name)
+                            st.session_state.tables[tab_name] = df_up
+                            run_validations()  # ✅ run after per-tab upload
+                            st.session_state[guard_key] = fp
+                    except Exception as e:
+                        st.error(f"❌ Failed to upload {tab_name}")
+                        st.exception(e)
+                    finally:
+                        _release_upload(per_table_action)
+
+            with c2:
+                with st.popover("", help=f"Download {tab_name}", icon=":material/download:"):
+                    _lazy_download([tab_name], tab_name, df_key)
+
+            with c3:
+                if st.button("", key=f"delete_{df_key}", icon=":material/delete:"):
+                    defaults = get_default_network_tables()
+                    st.session_state.tables[tab_name] = defaults.get(tab_name, pd.DataFrame())
+                    if df_key in st.session_state:
+                        del st.session_state[df_key]
+                    run_validations()  # ✅ run after tab reset
+
+        # Table editor
+        container_css_table_styles = """
+        { padding-left: 2em; padding-right: 2em; }
+        """
+        with stylable_container(key=f"design_tables_{tab_name.replace(' ', '_')}",
+                                css_styles=container_css_table_styles):
+
+            table = st.session_state.tables.get(tab_name, pd.DataFrame())
+            if table.empty:
+                st.info("📂 No data available for this tab.")
+            else:
+                # Window of the table: rows matching the filters, one page at a time
+                options = filter_options(table)
+                filter_cols = st.columns(len(options) + 2, vertical_alignment="bottom")
+                filters = {
+                    col: filter_col.multiselect(col, values, key=f"filter_{col}_{df_key}")
+                    for filter_col, (col, values) in zip(filter_cols, options.items())
+                }
+                page_size = filter_cols[-2].selectbox("Rows per page", PAGE_SIZES, key=f"page_size_{df_key}")
+                matching = filter_labels(table, filters)
+                n_pages = max(1, -(-len(matching) // page_size))
+                page_key = f"page_{df_key}"
+                # The page lives in session state only, a widget default as well makes Streamlit warn
+                st.session_state[page_key] = min(st.session_state.get(page_key, 1), n_pages)
+                page = filter_cols[-1].number_input(
+                    f"Page (of {n_pages})", min_value=1, max_value=n_pages, step=1, key=page_key
+                )
+                labels = matching[(page - 1) * page_size : page * page_size]
+
+                # The editor works on plain columns, session state keeps the compact table
+                window = expand_table(table.loc[labels])
+                df = window.reset_index(drop=True)
+                column_config = {}
+                for col in df.columns:
+                    dtype = df[col].dtype
+                    if pd.api.types.is_integer_dtype(dtype):
+                        column_config[col] = st.column_config.NumberColumn(label=col, format="%d", step=1)
+                    elif pd.api.types.is_float_dtype(dtype):
+                        column_config[col] = st.column_config.NumberColumn(label=col, format="%.2f")
+                    elif pd.api.types.is_bool_dtype(dtype):
+                        column_config[col] = st.column_config.CheckboxColumn(label=col)
                     else:
-                        column_config = {}
-                        for col in df.columns:
-                            dtype = df[col].dtype
-                            if pd.api.types.is_integer_dtype(dtype):
-                                column_config[col] = st.column_config.NumberColumn(label=col, format="%d", step=1)
-                            elif pd.api.types.is_float_dtype(dtype):
-                                column_config[col] = st.column_config.NumberColumn(label=col, format="%.2f")
-                            elif pd.api.types.is_bool_dtype(dtype):
-                                column_config[col] = st.column_config.CheckboxColumn(label=col)
-                            else:
-                                column_config[col] = st.column_config.TextColumn(label=col)
-
-                        edited_df = st.data_editor(
-                            df,
-                            key=df_key,
-                            column_config=column_config,
-                            hide_index=True,
-                            use_container_width=True,
-                            num_rows="dynamic",
-                        )
-                        if isinstance(edited_df, pd.DataFrame):
-                            st.session_state.tables[tab_name] = edited_df.copy()
-                            run_validations()  # ✅ run after edits
+                        column_config[col] = st.column_config.TextColumn(label=col)
+
+                edited_df = st.data_editor(
+                    df,
+                    key=df_key,
+                    column_config=column_config,
+                    hide_index=True,
+                    use_container_width=True,
+                    num_rows="dynamic",
+                )
+                editor_state = st.session_state.get(df_key)
+                if isinstance(edited_df, pd.DataFrame) and has_edits(editor_state):
+                    # The store only takes the table (and bumps its version) if its content changed
+                    version = st.session_state.tables.version(tab_name)
+                    st.session_state.tables[tab_name] = merge_window(table, labels, edited_df)
+                    if st.session_state.tables.version(tab_name) != version:
+                        revalidate_edits(tab_name, window, editor_state)  # ✅ recheck edited rows
 
         # --- Show Validation Results ---
         if "validation_results" in st.session_state:
             st.subheader("Validation Results")
             for level, result in st.session_state.validation_results.items():
                 color = "green" if result == "Passed" else "red" if result == "Failed" else "gray"
-                st.markdown(f"**{level}:** <span style='color:{color}'>{result}</span>", unsafe_allow_html=True)
\ No newline at end of file
+                st.markdown(f"**{level}:** <span style='color:{color}'>{result}</span>", unsafe_allow_html=True)
+            report = st.session_state.get("validation_report")
+            if report is not None and not report.empty:
+                with st.expander(f"All validation issues ({len(report)})"):
+                    st.dataframe(report, hide_index=True, use_container_width=True)
\ No newline at end of file
@@ -1,5 +1,84 @@
+import numpy as np
+import pandas as pd
 import streamlit as st
+from streamlit_extras.stylable_container import stylable_container
+from .charts import series_band_chart
+from .ui_helpers import container_css_styles, get_network_model, network_is_valid
+
+# --- Style variables ---
+text_color = "#E30A13"
+
+
+def _sourcing_lanes(model, row):
+    """Feasible sources of one SKU-location read from the lane graph, cheapest first."""
+    graph = model.lane_graph
+    edges = graph.sources(row)
+    lanes = graph.lane_row[edges]
+    return pd.DataFrame(
+        {
+            "Factory": model.factory_names[model.lane_factory[lanes]],
+            "Distance": model.lane_distance[lanes],
+            "Production Cost Per Unit": graph.production_cost[edges],
+            "Transportation Cost Per Unit": graph.transport_cost[edges],
+            "Total Cost Per Unit": graph.unit_cost[edges],
+        }
+    )
+
 
 def render_network_visualization():
-    st.title("Network Visualization Page")
-    st.write("This is a placeholder for the Network Visualization functionality.")
\ No newline at end of file
+    # --- Header ---
+    with stylable_container(key="network_visualization_page", css_styles=container_css_styles):
+        st.markdown(
+            f'<h3 style="color: {text_color}; margin: 0;">Network Visualization</h3>',
+            unsafe_allow_html=True,
+        )
+
+    if not network_is_valid():
+        st.warning(
+            "⚠️ Network data has not passed validation. Review it in Network Design before exploring it."
+        )
+        return
+
+    model = get_network_model()
+    graph = model.lane_graph
+    warehouses, products = model.sku_names
+
+    # --- Network summary ---
+    c1, c2, c3 = st.columns(3)
+    c1.metric("SKU-locations", f"{model.n_sku:,}")
+    c2.metric("Sourcing options", f"{len(graph.lane_row):,}")
+    c3.metric("Avg. options per SKU-location", f"{graph.degree.mean():.2f}" if model.n_sku else "-")
+
+    # --- Sourcing lanes of one SKU-location ---
+    c1, c2 = st.columns(2)
+    with c1:
+        warehouse = st.selectbox("Warehouse", sorted(pd.unique(warehouses), key=str))
+    with c2:
+        product = st.selectbox(
+            "Product", sorted(pd.unique(products[warehouses == warehouse]), key=str)
+        )
+    rows = np.flatnonzero((warehouses == warehouse) & (products == product))
+    if len(rows) == 0:
+        return
+    lanes = _sourcing_lanes(model, rows[0])
+    st.caption(
+        "Cheapest option first. Greedy sourcing tries the options in this order, "
+        "Optimal (LP) picks the cheapest mix across all of a day's orders."
+    )
+    st.dataframe(lanes, hide_index=True, use_container_width=True)
+
+    # --- Simulated series across every SKU-location ---
+    result = st.session_state.get("simulation_result")
+    if result is None or not result.series:
+        st.info("ℹ️ Run a simulation in Simulate Scenario to see inventory over time here.")
+        return
+    st.subheader("Simulated Series")
+    column = st.selectbox("Series", list(result.series), key="visualization_series")
+    values = result.series[column]
+    skus = np.flatnonzero((result.warehouses == warehouse) & (result.products == product))
+    highlight = {f"{warehouse} · {product}": values[:, skus[0]]} if len(skus) else None
+    series_band_chart(np.arange(1, result.horizon + 1), values, highlight, y_title=column)
+    st.caption(
+        f"Bands show the spread across all {values.shape[1]:,} SKU-locations of the last run, "
+        "the line the selected warehouse-product."
+    )
@@ -1,5 +1,203 @@
 import streamlit as st
+from streamlit_extras.stylable_container import stylable_container
+from .charts import time_series_chart
+from .simulate_scenario_tab import ENGINES, SOURCING_METHODS
+from .ui_helpers import container_css_styles, get_job_manager, get_scenario_store
+from src.network_model import NetworkModel
+from src.scenario_comparison import compare_scenarios
+
+# --- Style variables ---
+text_color = "#E30A13"
+
+
+def _scenario_args(scenario):
+    """(model, sourcing, engine class) of a saved scenario for compare_scenarios."""
+    return (
+        NetworkModel(scenario["tables"]),
+        SOURCING_METHODS[scenario["sourcing"]],
+        ENGINES[scenario["engine"]],
+    )
+
+
+@st.fragment(run_every=1)
+def _render_comparison_status():
+    """Progress of the session's background comparison, polled without rerunning the page."""
+    pending = st.session_state.get("comparison_job")
+    if pending is None:
+        return
+    jobs = get_job_manager()
+    job = jobs.get(pending["id"])
+    if job is not None and not job.finished:
+        c1, c2 = st.columns([0.85, 0.15], vertical_alignment="bottom")
+        with c1:
+            status = "Cancelling" if job.cancelled() else job.status.capitalize()
+            st.progress(job.progress, text=f"{status} {job.label} ({job.done}/{job.total or '?'})")
+        with c2:
+            st.button("Cancel", key="cancel_comparison", icon=":material/stop:", on_click=job.cancel)
+        if job.partial is not None:
+            st.markdown("**Running Paired Differences**")
+            st.dataframe(job.partial, use_container_width=True)
+        return
+
+    # Hand the finished job over to the session and redraw the whole tab
+    jobs.collect(pending["id"])
+    st.session_state["comparison_job"] = None
+    st.session_state["comparison_job_outcome"] = job
+    if job is not None and job.status == "done":
+        st.session_state["comparison_result"] = (pending["baseline"], pending["alternative"], job.result)
+    st.rerun()
+
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def _series_totals(runs, column):
+    # Runs are keyed by their inputs, so stored results never change under a key
+    return get_scenario_store().series_totals(list(runs), [column])
+
 
 def render_scenario_comparison():
-    st.title("Scenario Comparison Page")
-    st.write("This is a placeholder for the Scenario Comparison functionality.")
\ No newline at end of file
+    # --- Header ---
+    with stylable_container(key="scenario_comparison_page", css_styles=container_css_styles):
+        st.markdown(
+            f'<h3 style="color: {text_color}; margin: 0;">Scenario Comparison</h3>',
+            unsafe_allow_html=True,
+        )
+
+    st.subheader("Paired Replications")
+    _render_paired_comparison()
+    st.subheader("Stored Runs")
+    _render_stored_runs()
+
+
+def _render_paired_comparison():
+    scenarios = st.session_state.get("scenarios", {})
+    if len(scenarios) < 2:
+        st.info("ℹ️ Save at least two scenarios in Simulate Scenario to compare them.")
+        return
+
+    # --- Parameters ---
+    names = list(scenarios)
+    c1, c2 = st.columns(2)
+    with c1:
+        baseline = st.selectbox("Baseline", names, index=0)
+    with c2:
+        alternative = st.selectbox("Alternative", names, index=1)
+    c1, c2, c3, c4, c5 = st.columns([0.2, 0.2, 0.2, 0.2, 0.2], vertical_alignment="bottom")
+    with c1:
+        horizon = st.number_input("Horizon (days)", min_value=1, max_value=3650, value=365, step=1, key="comparison_horizon")
+    with c2:
+        seed = st.number_input("Random seed", min_value=0, value=42, step=1, key="comparison_seed")
+    with c3:
+        n_replications = st.number_input("Replications", min_value=2, max_value=10000, value=20, step=1)
+    with c4:
+        antithetic = st.checkbox(
+            "Antithetic variates",
+            help="Run replications in pairs on mirrored random numbers, each pair counts as one observation.",
+        )
+    with c5:
+        run_clicked = st.button(
+            "Compare", icon=":material/compare_arrows:", disabled=baseline == alternative
+        )
+
+    if run_clicked:
+        try:
+            jobs = get_job_manager()
+            # A new comparison replaces the session's comparison still in the background
+            pending = st.session_state.get("comparison_job")
+            previous = jobs.get(pending["id"]) if pending is not None else None
+            if previous is not None:
+                previous.cancel()
+            job = jobs.submit(
+                f"{int(n_replications)} paired replications",
+                compare_scenarios,
+                _scenario_args(scenarios[baseline]),
+                _scenario_args(scenarios[alternative]),
+                n_replications=int(n_replications),
+                horizon=int(horizon),
+                master_seed=int(seed),
+                antithetic=antithetic,
+            )
+            st.session_state["comparison_job"] = {"id": job.id, "baseline": baseline, "alternative": alternative}
+        except Exception as e:
+            st.error("❌ Comparison failed.")
+            st.exception(e)
+
+    # --- Background comparison ---
+    if st.session_state.get("comparison_job") is not None:
+        _render_comparison_status()
+    outcome = st.session_state.pop("comparison_job_outcome", None)
+    if outcome is not None and outcome.status == "failed":
+        st.error("❌ Comparison failed.")
+        st.exception(outcome.error)
+    elif outcome is not None and outcome.status == "cancelled":
+        st.info("⏹️ Comparison cancelled.")
+
+    if st.session_state.get("comparison_result") is None:
+        st.info("▶️ Pick two scenarios and run the comparison.")
+        return
+    baseline, alternative, comparison = st.session_state["comparison_result"]
+
+    # --- Paired differences ---
+    summary = comparison.summary
+    total = summary.loc["total_cost"]
+    m1, m2, m3 = st.columns(3)
+    m1.metric(f"Total Cost - {baseline}", f"{total['Baseline']:,.0f}")
+    m2.metric(f"Total Cost - {alternative}", f"{total['Alternative']:,.0f}")
+    m3.metric(
+        "Difference",
+        f"{total['Difference']:,.0f}",
+        f"± {total['Half Width']:,.0f}",
+        delta_color="off",
+    )
+    st.markdown(f"**Paired Differences ({alternative} - {baseline})**")
+    st.dataframe(summary, use_container_width=True)
+    st.caption(
+        "Both scenarios run on common random numbers: each warehouse-product sees the same "
+        "demand in both. Independent Half Width is the interval independent runs would give."
+    )
+
+
+def _render_stored_runs():
+    runs = get_scenario_store().runs()
+    if runs.empty:
+        st.info("ℹ️ Save simulation runs in Simulate Scenario to compare their results here.")
+        return
+
+    # The short input hash tells runs of a scenario apart
+    runs["Run"] = (
+        runs["scenario"] + " · seed " + runs["seed"] + " · " + runs["horizon"] + " days · "
+        + runs["input_hash"].str[:6]
+    )
+    c1, c2 = st.columns([0.75, 0.25])
+    with c1:
+        labels = st.multiselect("Runs", runs["Run"].tolist(), default=runs["Run"].tolist()[:2])
+    with c2:
+        column = st.selectbox("Series", ["on_hand", "demand", "fulfilled", "lost", "shipped"])
+    if not labels:
+        return
+    selected = runs.set_index("Run").loc[labels]
+    keys = tuple(zip(selected["scenario"], selected["input_hash"]))
+
+    # --- KPIs ---
+    kpi_columns = ["fill_rate", "holding_cost", "transportation_cost", "production_cost", "opportunity_cost", "total_cost"]
+    st.dataframe(selected[["sourcing", "engine", *kpi_columns]], use_container_width=True)
+
+    # --- Daily totals, read from the runs' daily partitions only ---
+    store = get_scenario_store()
+    daily = store.daily(list(keys), [column])
+    daily["Run"] = daily["scenario"].astype(str) + daily["input_hash"].astype(str)
+    names = dict(zip(selected["scenario"] + selected["input_hash"], labels))
+    daily["Run"] = daily["Run"].map(names)
+    daily = daily.pivot_table(index="day", columns="Run", values=column)
+    time_series_chart(daily.index, {run: daily[run] for run in daily.columns}, y_title=column)
+
+    # --- Warehouse product totals, streamed from the runs' series partitions ---
+    with st.spinner("Reading stored series..."):
+        totals = _series_totals(keys, column)
+    if totals.empty:
+        st.info("ℹ️ The selected runs were saved without per warehouse-product series.")
+        return
+    totals["Run"] = (totals["scenario"] + totals["input_hash"]).map(names)
+    st.dataframe(
+        totals.pivot_table(index=["warehouse", "product"], columns="Run", values=column),
+        use_container_width=True,
+    )
@@ -7,6 +7,7 @@ import sys
 from datetime import datetime
 import pandas as pd
 from components.ui_helpers import get_default_network_tables
+from src.table_store import TableStore
 
 def init_session_state():
     # Session state
@@ -43,7 +44,7 @@ def init_session_state():
 
     # --- Network Design Tab Session States ---
     if "tables" not in st.session_state:
-        st.session_state["tables"] = get_default_network_tables().copy()
+        st.session_state["tables"] = TableStore(get_default_network_tables())
     if "active_tab" not in st.session_state:
         st.session_state["active_tab"] = "Factory Level"
     if "file_uploaded_once" not in st.session_state:
@@ -57,8 +58,12 @@ def init_session_state():
     if "_main_upload_md5" not in st.session_state:
         st.session_state["_main_upload_md5"] = None
 
+    # --- Scenario Comparison Session States ---
+    if "scenarios" not in st.session_state:
+        st.session_state["scenarios"] = {}
+
 def reset_session_state():
-    st.session_state["tables"] = get_default_network_tables().copy()
+    st.session_state["tables"] = TableStore(get_default_network_tables())
     st.session_state["active_tab"] = "Factory Level"
     st.session_state["file_uploaded_once"] = False
     st.session_state["show_download_button"] = False
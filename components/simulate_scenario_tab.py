@@ -1,5 +1,289 @@
+from concurrent.futures import CancelledError
+
 import streamlit as st
+from streamlit_extras.stylable_container import stylable_container
+from .charts import time_series_chart
+from .ui_helpers import (
+    container_css_styles,
+    get_job_manager,
+    get_network_model,
+    get_run_cache,
+    get_scenario_store,
+    network_is_valid,
+)
+from src.event_engine import EventDrivenEngine
+from src.replication_runner import run_recorded, run_replications
+from src.scenario_store import run_input_hash
+from src.simulation_engine import SimulationEngine
+
+# Sourcing label -> allocate_orders method, saved scenarios store the label
+SOURCING_METHODS = {"Greedy": "greedy", "Optimal (LP)": "linprog"}
+# Engine label -> engine class, saved scenarios store the label
+ENGINES = {"Daily step": SimulationEngine, "Event-driven": EventDrivenEngine}
+
+# --- Style variables ---
+text_color = "#E30A13"
+
+
+def _simulate(
+    model,
+    engine_class,
+    sourcing,
+    horizon,
+    seed,
+    n_replications,
+    tolerances,
+    run_cache,
+    cache_key,
+    executor,
+    progress,
+    partial,
+    cancelled,
+):
+    """Background job: the recorded run, then the replications, both on the shared process pool."""
+    total = 1 + (n_replications if n_replications > 1 else 0)
+    progress(0, total)
+    result = run_recorded(
+        model, horizon=horizon, seed=seed, sourcing=sourcing, engine=engine_class, executor=executor, cancelled=cancelled
+    )
+    progress(1, total)
+    replication_result = None
+    if n_replications > 1:
+        if cancelled():
+            raise CancelledError()
+        replication_result = run_replications(
+            model,
+            n_replications=n_replications,
+            horizon=horizon,
+            master_seed=seed,
+            sourcing=sourcing,
+            engine=engine_class,
+            executor=executor,
+            progress=lambda done, _: progress(1 + done, total),
+            cancelled=cancelled,
+            tolerances=tolerances,
+            partial=partial,
+        )
+    run_cache.put(cache_key, (result, replication_result))
+    return result, replication_result
+
+
+def _tolerances(target_half_width):
+    """Early stopping tolerances of the service level & cost KPIs, None runs every replication."""
+    if not target_half_width:
+        return None
+    return {"fill_rate": target_half_width / 100, "total_cost": target_half_width / 100}
+
+
+@st.fragment(run_every=1)
+def _render_job_status():
+    """Progress of the session's background run, polled without rerunning the page."""
+    pending = st.session_state.get("simulation_job")
+    if pending is None:
+        return
+    jobs = get_job_manager()
+    job = jobs.get(pending["id"])
+    if job is not None and not job.finished:
+        c1, c2 = st.columns([0.85, 0.15], vertical_alignment="bottom")
+        with c1:
+            status = "Cancelling" if job.cancelled() else job.status.capitalize()
+            st.progress(job.progress, text=f"{status} {job.label} ({job.done}/{job.total or '?'})")
+        with c2:
+            st.button("Cancel", key="cancel_simulation", icon=":material/stop:", on_click=job.cancel)
+        if job.partial is not None:
+            st.markdown("**Running Monte Carlo Summary**")
+            st.dataframe(job.partial, use_container_width=True)
+        return
+
+    # Hand the finished job over to the session and redraw the whole tab
+    jobs.collect(pending["id"])
+    st.session_state["simulation_job"] = None
+    st.session_state["simulation_job_outcome"] = job
+    if job is not None and job.status == "done":
+        st.session_state["simulation_result"], st.session_state["replication_result"] = job.result
+        st.session_state["simulation_run"] = pending["run"]
+    st.rerun()
+
 
 def render_simulate_scenario():
-    st.title("Simulate Scenario Page")
-    st.write("This is a placeholder for the Simulate Scenario functionality.")
\ No newline at end of file
+    # --- Header ---
+    with stylable_container(key="simulate_scenario_page", css_styles=container_css_styles):
+        st.markdown(
+            f'<h3 style="color: {text_color}; margin: 0;">Simulate Scenario</h3>',
+            unsafe_allow_html=True,
+        )
+
+    if not network_is_valid():
+        st.warning(
+            "⚠️ Network data has not passed validation. Review it in Network Design before simulating."
+        )
+        return
+
+    # --- Parameters ---
+    c1, c2, c3, c4, c5, c6, c7 = st.columns(
+        [0.13, 0.13, 0.13, 0.13, 0.16, 0.16, 0.16], vertical_alignment="bottom"
+    )
+    with c1:
+        horizon = st.number_input("Horizon (days)", min_value=1, max_value=3650, value=365, step=1)
+    with c2:
+        seed = st.number_input("Random seed", min_value=0, value=42, step=1)
+    with c3:
+        n_replications = st.number_input("Replications", min_value=1, max_value=10000, value=1, step=1)
+    with c4:
+        target_half_width = st.number_input(
+            "Target half width (%)",
+            min_value=0.0,
+            max_value=100.0,
+            value=0.0,
+            step=0.5,
+            format="%.1f",
+            help="Stop replications early once the confidence intervals of fill rate & total cost "
+            "are within ± this % of their means. 0 runs every replication.",
+        )
+    with c5:
+        sourcing_label = st.selectbox(
+            "Sourcing",
+            list(SOURCING_METHODS),
+            help="Greedy ships from the cheapest factory with stock first, "
+            "Optimal solves a minimum cost allocation of each day's orders.",
+        )
+        sourcing = SOURCING_METHODS[sourcing_label]
+    with c6:
+        engine_label = st.selectbox(
+            "Engine",
+            list(ENGINES),
+            help="Daily step simulates every day. Event-driven jumps between orders & arrivals "
+            "and is faster when SKU-locations reorder rarely over long horizons, other runs "
+            "step through the days. Both give the same results.",
+        )
+        engine_class = ENGINES[engine_label]
+    with c7:
+        run_clicked = st.button("Run Simulation", icon=":material/play_arrow:")
+
+    if run_clicked:
+        try:
+            params = {
+                "horizon": int(horizon),
+                "seed": int(seed),
+                "sourcing": sourcing_label,
+                "engine": engine_label,
+            }
+            run = {"params": params, "input_hash": run_input_hash(st.session_state.tables, params)}
+            # Identical tables & parameters give identical results, whichever session ran them
+            cache_key = run_input_hash(
+                st.session_state.tables,
+                {**params, "replications": int(n_replications), "target_half_width": float(target_half_width)},
+            )
+            run_cache = get_run_cache()
+            jobs = get_job_manager()
+            # A new run replaces the session's run still in the background
+            pending = st.session_state.get("simulation_job")
+            previous = jobs.get(pending["id"]) if pending is not None else None
+            if previous is not None:
+                previous.cancel()
+            st.session_state["simulation_job"] = None
+            cached = run_cache.get(cache_key)
+            if cached is not None:
+                st.session_state["simulation_result"], st.session_state["replication_result"] = cached
+                st.session_state["simulation_run"] = run
+                st.toast("⚡ Loaded an identical earlier run from the cache.")
+            else:
+                label = f"{engine_label} run"
+                if n_replications > 1:
+                    label += f" & {int(n_replications)} replications"
+                job = jobs.submit(
+                    label,
+                    _simulate,
+                    get_network_model(),
+                    engine_class,
+                    sourcing,
+                    int(horizon),
+                    int(seed),
+                    int(n_replications),
+                    _tolerances(target_half_width),
+                    run_cache,
+                    cache_key,
+                )
+                st.session_state["simulation_job"] = {"id": job.id, "run": run}
+        except Exception as e:
+            st.error("❌ Simulation failed.")
+            st.exception(e)
+
+    # --- Background run ---
+    if st.session_state.get("simulation_job") is not None:
+        _render_job_status()
+    outcome = st.session_state.pop("simulation_job_outcome", None)
+    if outcome is not None and outcome.status == "failed":
+        st.error("❌ Simulation failed.")
+        st.exception(outcome.error)
+    elif outcome is not None and outcome.status == "cancelled":
+        st.info("⏹️ Simulation cancelled.")
+
+    # --- Save scenario for comparison ---
+    scenarios = st.session_state.scenarios
+    with st.popover("Save as Scenario", icon=":material/bookmark_add:"):
+        default_name = f"Scenario {len(scenarios) + 1}"
+        name = st.text_input(
+            "Scenario name", key="scenario_name", help="Scenarios without a name are numbered."
+        ).strip() or default_name
+        if st.button("Save", key="save_scenario"):
+            # Snapshots share the stored tables, later edits do not change the scenario
+            scenarios[name] = {
+                "tables": st.session_state.tables.snapshot(),
+                "sourcing": sourcing_label,
+                "engine": engine_label,
+            }
+            st.toast(f"✅ Saved scenario '{name}'.")
+
+    result = st.session_state.get("simulation_result")
+    if result is None:
+        st.info("▶️ Set the parameters and run the simulation.")
+        return
+
+    # --- Save run to the scenario store ---
+    run = st.session_state.get("simulation_run")
+    if run is not None:
+        with st.popover("Save Run", icon=":material/save:"):
+            run_name = st.text_input(
+                "Scenario name", key="run_scenario_name", help="Runs without a name are saved as 'Unnamed'."
+            ).strip() or "Unnamed"
+            if st.button("Save", key="save_run"):
+                with st.spinner("Saving run..."):
+                    get_scenario_store().save_run(run_name, run["input_hash"], result, run["params"])
+                st.toast(f"✅ Saved run of '{run_name}' for Scenario Comparison.")
+
+    # --- KPIs ---
+    kpis = result.kpis
+    m1, m2, m3, m4, m5, m6 = st.columns(6)
+    m1.metric("Fill Rate", f"{kpis['fill_rate']:.1%}")
+    m2.metric("Holding Cost", f"{kpis['holding_cost']:,.0f}")
+    m3.metric("Transportation Cost", f"{kpis['transportation_cost']:,.0f}")
+    m4.metric("Production Cost", f"{kpis['production_cost']:,.0f}")
+    m5.metric("Opportunity Cost", f"{kpis['opportunity_cost']:,.0f}")
+    m6.metric("Total Cost", f"{kpis['total_cost']:,.0f}")
+
+    # --- Monte Carlo summary ---
+    replication_result = st.session_state.get("replication_result")
+    if replication_result is not None:
+        st.subheader(f"Monte Carlo Summary ({len(replication_result.replications)} replications)")
+        st.dataframe(replication_result.summary, use_container_width=True)
+        if replication_result.stopped_early:
+            st.caption("Stopped early: fill rate & total cost reached the target half width.")
+        st.caption("KPIs above and charts below show the single run for the selected seed.")
+
+    # --- Daily totals ---
+    daily = result.daily_totals().set_index("Day")
+    st.subheader("Network Inventory & Demand")
+    time_series_chart(
+        daily.index, {col: daily[col] for col in ["on_hand", "demand", "fulfilled", "lost"]}, y_title="Units"
+    )
+    st.subheader("Daily Costs")
+    time_series_chart(
+        daily.index,
+        {col: daily[col] for col in ["holding_cost", "transportation_cost", "production_cost", "opportunity_cost"]},
+        y_title="Cost",
+    )
+
+    # --- SKU-location summary ---
+    st.subheader("Warehouse Product Summary")
+    st.dataframe(result.sku_summary(), hide_index=True, use_container_width=True)
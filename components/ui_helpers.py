@@ -3,6 +3,12 @@ import os
 import base64
 import matplotlib.colors as mcolors
 import pandas as pd
+from src.compact_tables import compact_tables
+from src.incremental_validation import LEVEL_DEPENDENCIES
+from src.job_manager import JobManager
+from src.network_model import NetworkModel
+from src.run_cache import RunCache
+from src.scenario_store import ScenarioStore
 
 SAMPLE_FILE_PATH = os.path.join(os.path.dirname(__file__), "..", "sample_data", "Input_Data.xlsx")
 
@@ -195,14 +201,17 @@ def display_saved_plot(plot_path: str, bg_color="#f0f2f6"):
             unsafe_allow_html=True,
         )
 
+@st.cache_data(max_entries=1, show_spinner=False)
+def _load_default_network_tables(path: str, mtime: float):
+    """Parse the sample workbook once per process, a new mtime reloads it. Every call gets its own copy."""
+    xls = pd.ExcelFile(path)
+    return compact_tables({sheet: pd.read_excel(xls, sheet_name=sheet) for sheet in xls.sheet_names})
+
+
 def get_default_network_tables():
     if os.path.exists(SAMPLE_FILE_PATH):
-        xls = pd.ExcelFile(SAMPLE_FILE_PATH)
-        sheets = xls.sheet_names
-        data = {}
-        for sheet in sheets:
-            data[sheet] = pd.read_excel(xls, sheet_name=sheet)
-        return data
+        # A session's own copy, in-place edits never reach the cached tables of other sessions
+        return _load_default_network_tables(SAMPLE_FILE_PATH, os.path.getmtime(SAMPLE_FILE_PATH))
     else:
         return {
             "Factory Level": pd.DataFrame(),
@@ -211,3 +220,33 @@ def get_default_network_tables():
             "Warehouse Factory Level": pd.DataFrame(),
             "Warehouse Product Level": pd.DataFrame(),
         }
+
+
+def network_is_valid():
+    results = st.session_state.get("validation_results")
+    return bool(results) and all(results.get(level) == "Passed" for level in LEVEL_DEPENDENCIES)
+
+
+def get_network_model():
+    """Compiled model of the current tables, rebuilt after edits cleared it."""
+    if st.session_state.get("network_model") is None:
+        st.session_state.network_model = NetworkModel(st.session_state.tables)
+    return st.session_state.network_model
+
+
+@st.cache_resource(show_spinner=False)
+def get_scenario_store():
+    """Scenario result store on local disk, shared by every session."""
+    return ScenarioStore()
+
+
+@st.cache_resource(show_spinner=False)
+def get_run_cache():
+    """Cache of simulation runs on local disk, shared by every session."""
+    return RunCache()
+
+
+@st.cache_resource(show_spinner=False)
+def get_job_manager():
+    """Background simulation jobs & their process pool, shared by every session."""
+    return JobManager()
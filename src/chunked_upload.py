@@ -0,0 +1,116 @@
+import hashlib
+import json
+import os
+import struct
+import tempfile
+
+# Bytes per frame sent by the file manager component
+CHUNK_SIZE = 4 * 1024 * 1024
+# Header fields the receiver relies on
+FRAME_HEADER_KEYS = ["upload_id", "filename", "index", "total_chunks"]
+
+
+def parse_frame(frame):
+    """
+    Split an upload frame into its header and chunk.
+
+    Frame layout: 4-byte big-endian header length, UTF-8 JSON header
+    (upload_id, filename, index, total_chunks, size), raw chunk bytes. Raises
+    ValueError for frames that do not follow it.
+    """
+    if len(frame) < 4:
+        raise ValueError("Upload frame is too short for its header length")
+    (header_length,) = struct.unpack(">I", frame[:4])
+    if len(frame) < 4 + header_length:
+        raise ValueError("Upload frame is shorter than its header")
+    try:
+        header = json.loads(bytes(frame[4 : 4 + header_length]).decode("utf-8"))
+    except UnicodeDecodeError as e:
+        raise ValueError("Upload frame header is not UTF-8") from e
+    missing = [key for key in FRAME_HEADER_KEYS if not isinstance(header, dict) or key not in header]
+    if missing:
+        raise ValueError(f"Upload frame header is missing {', '.join(missing)}")
+    return header, memoryview(frame)[4 + header_length :]
+
+
+class ChunkedUpload:
+    """A file being received, chunks are hashed and appended to a temp file as they arrive."""
+
+    def __init__(self, upload_id, filename, total_chunks):
+        self.upload_id = upload_id
+        self.filename = filename
+        self.total_chunks = total_chunks
+        self.next_index = 0
+        self.size = 0
+        self._md5 = hashlib.md5()
+        fd, self.path = tempfile.mkstemp(suffix=os.path.splitext(filename)[1])
+        self._file = os.fdopen(fd, "wb")
+
+    def write(self, chunk):
+        self._md5.update(chunk)
+        self._file.write(chunk)
+        self.size += len(chunk)
+        self.next_index += 1
+
+    @property
+    def done(self):
+        return self.next_index >= self.total_chunks
+
+    def close(self):
+        self._file.close()
+        return {
+            "type": "upload",
+            "filename": self.filename,
+            "path": self.path,
+            "md5": self._md5.hexdigest(),
+            "size": self.size,
+        }
+
+    def discard(self):
+        self._file.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+
+
+class ChunkedUploadReceiver:
+    """
+    Reassembles uploads sent as a sequence of frames.
+
+    The component sends frame i + 1 only after `ack` names frame i, so frames
+    arrive in order; a frame seen again on a rerun is ignored. The finished
+    upload's temp file belongs to the caller, who removes it once ingested.
+    """
+
+    def __init__(self):
+        self.upload = None
+        self.ack = None
+        self._finished = set()
+
+    def receive(self, frame):
+        """Ingest a frame, returns the finished upload after its last chunk, else None."""
+        header, chunk = parse_frame(frame)
+        upload_id, index = header["upload_id"], header["index"]
+        if upload_id in self._finished:
+            return None
+        if self.upload is None or self.upload.upload_id != upload_id:
+            if index != 0:
+                return None
+            # A new file replaces an interrupted upload
+            self.discard()
+            self.upload = ChunkedUpload(upload_id, header["filename"], max(1, header["total_chunks"]))
+        if index != self.upload.next_index:
+            return None
+        self.upload.write(chunk)
+        self.ack = {"upload_id": upload_id, "index": index}
+        if not self.upload.done:
+            return None
+        finished = self.upload.close()
+        self._finished.add(upload_id)
+        self.upload = None
+        return finished
+
+    def discard(self):
+        """Drop a partially received upload."""
+        if self.upload is not None:
+            self.upload.discard()
+            self.upload = None
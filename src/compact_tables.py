@@ -0,0 +1,51 @@
+import pandas as pd
+
+from src.simulation_check import LEVEL_COLUMNS
+
+
+def _with_columns(df, columns):
+    # Untouched columns share memory with df, columns are only ever replaced whole
+    df = df.copy(deep=False)
+    for col, values in columns.items():
+        df[col] = values
+    return df
+
+
+def compact_table(df, level):
+    """
+    Memory-lean version of a level table for session state.
+
+    Text columns become Categorical, so every distinct key, distribution or
+    parameter string is stored once instead of once per row, and integer
+    columns are downcast to the smallest integer type that holds them. Float
+    columns keep float64 so costs are not rounded.
+    """
+    columns = LEVEL_COLUMNS.get(level, {})
+    compact = {}
+    for col in df.columns:
+        values = df[col]
+        if columns.get(col) is str and values.dtype == object:
+            compact[col] = values.astype("category")
+        elif values.dtype == "int64":
+            compact[col] = pd.to_numeric(values, downcast="integer")
+    return _with_columns(df, compact)
+
+
+def expand_table(df):
+    """Plain object & int64 columns, as the data editor needs free-text cells."""
+    expanded = {}
+    for col in df.columns:
+        dtype = df[col].dtype
+        if isinstance(dtype, pd.CategoricalDtype):
+            expanded[col] = df[col].astype(object)
+        elif pd.api.types.is_integer_dtype(dtype) and dtype != "int64":
+            expanded[col] = df[col].astype("int64")
+    return _with_columns(df, expanded)
+
+
+def compact_tables(tables):
+    """Compact every level table, other sheets are shared as they are."""
+    return {
+        name: compact_table(df, name) if name in LEVEL_COLUMNS else df.copy(deep=False)
+        for name, df in tables.items()
+    }
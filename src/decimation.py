@@ -0,0 +1,78 @@
+import numpy as np
+
+
+def lttb_indices(x, y, n_out):
+    """
+    Indices of `n_out` points that keep the visual shape of a line (Largest-Triangle-Three-Buckets).
+
+    The first and last points are always kept. In between, the points are split
+    into n_out - 2 buckets, and each bucket keeps the point that forms the
+    largest triangle with the point kept before it and the average of the next bucket.
+    """
+    n = len(y)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    # n_out - 2 buckets over points 1 .. n - 2, at least one point each since n_out < n
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        indices[i + 1] = a
+    return indices
+
+
+def minmax_indices(y, n_out):
+    """Indices of the lowest & highest point of each of n_out / 2 buckets, in order."""
+    n = len(y)
+    n_buckets = n_out // 2
+    if n_out >= n or n_buckets < 1:
+        return np.arange(n)
+    y = np.asarray(y, dtype=float)
+    # Pad the last bucket to a full row so every bucket reduces in one call
+    size = -(-n // n_buckets)
+    n_buckets = -(-n // size)
+    padded = np.full(n_buckets * size, np.nan)
+    padded[:n] = y
+    rows = padded.reshape(n_buckets, size)
+    offsets = np.arange(n_buckets) * size
+    low = offsets + np.nanargmin(rows, axis=1)
+    high = offsets + np.nanargmax(rows, axis=1)
+    return np.unique(np.concatenate([low, high]))
+
+
+def decimate(x, y, n_out, method="lttb"):
+    """
+    At most `n_out` points of the line (x, y) to draw instead of all of them.
+
+    method -> "lttb" keeps the line's shape, "minmax" keeps every bucket's extremes
+    """
+    x = np.asarray(x)
+    y = np.asarray(y)
+    if method == "lttb":
+        indices = lttb_indices(x, y, n_out)
+    elif method == "minmax":
+        indices = minmax_indices(y, n_out)
+    else:
+        raise ValueError(f"Unknown decimation method '{method}'")
+    return x[indices], y[indices]
+
+
+def quantile_bands(values, quantiles):
+    """
+    Quantiles of many series at every step, one row per quantile.
+
+    values -> (steps, n_series) array, e.g. a SimulationResult series
+    """
+    values = np.asarray(values, dtype=float)
+    if values.shape[1] == 0:
+        return np.full((len(quantiles), values.shape[0]), np.nan)
+    return np.quantile(values, quantiles, axis=1)
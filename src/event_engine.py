@@ -0,0 +1,251 @@
+import numpy as np
+
+from src.simulation_engine import SimulationEngine
+
+# Days of the daily loop an event step costs about as much as, runs whose busiest
+# SKU-location has more events than horizon / _STEP_DAYS step through the days instead
+_STEP_DAYS = 8
+
+
+class EventDrivenEngine(SimulationEngine):
+    """
+    Event-driven version of the daily engine for sparse, long-horizon networks.
+
+    Between its own events, an order placement or a shipment arrival, a
+    SKU-location only sells down its stock, so the day its inventory position
+    reaches the reorder point is found by one binary search over its cumulative
+    demand instead of stepping through the days in between. Every SKU-location
+    runs on its own event clock and all of them advance one event at a time in
+    vectorized steps, so a run takes as many steps as the busiest SKU-location
+    has events rather than one per day. Per-day totals are summed from the
+    orders and the stockout stretches found on the way.
+
+    SKU-locations only interact through factory stock. The fast path assumes
+    every order ships whole from its cheapest source and checks afterwards that
+    no factory was asked for more than it held on any day; runs where that does
+    not hold, or with LP sourcing, step through the days like the daily engine.
+    Random streams are sampled exactly like the daily engine, so both engines
+    produce the same results for the same seed.
+    """
+
+    def run(self, horizon=365, seed=None, record=True, antithetic=False):
+        """
+        Simulate `horizon` days and return a SimulationResult.
+
+        antithetic -> Mirror the random numbers of `seed`, only with common random numbers
+        """
+        model = self.model
+        demand_paths, lead_time_paths = self._sample_paths(seed, horizon, antithetic)
+        result = None
+        if self._uncoupled():
+            # A replenishment cycle sells at least max - min units and takes an order & an arrival
+            cycles = demand_paths.sum(axis=0) / (model.sku_max - model.sku_min)
+            if (2 * cycles.max(initial=0) + 2) * _STEP_DAYS < horizon:
+                result = self._run_events(horizon, demand_paths, lead_time_paths, record)
+        if result is None:
+            result = self._run_days(horizon, demand_paths, lead_time_paths, record)
+        return result
+
+    def _uncoupled(self):
+        """Whether SKU-locations can run on their own clocks until factory stock is checked."""
+        model = self.model
+        # Whole-unit orders ship in full from the cheapest source when its factory has the stock
+        return (
+            self.sourcing == "greedy"
+            and (model.sku_start >= 0).all()
+            and (model.sku_start == np.floor(model.sku_start)).all()
+            and (model.sku_max == np.floor(model.sku_max)).all()
+            and (model.sku_max > model.sku_min).all()
+        )
+
+    def _run_events(self, horizon, demand_paths, lead_time_paths, record):
+        """Event-driven run, None when factories were short on some day."""
+        model = self.model
+        graph = model.lane_graph
+        n_sku = model.n_sku
+        # Slot of a pending shipment that is not in use
+        free = horizon + 1
+
+        # cum_demand[t, i] -> Demand of SKU-location i on the days before t
+        cum_demand = np.empty((horizon + 1, n_sku))
+        cum_demand[0] = 0
+        np.cumsum(demand_paths, axis=0, out=cum_demand[1:])
+        flat_demand = cum_demand.ravel()
+
+        def demand_before(skus, days):
+            return flat_demand[days * n_sku + skus]
+
+        def reaches(skus, target, first_day):
+            """First day from `first_day` on whose cumulative demand reaches `target`, horizon if none."""
+            # Bisection on each SKU-location's own column, all of them at once
+            lo = first_day + 1
+            hi = np.full(len(skus), horizon + 1)
+            searching = lo < hi
+            while searching.any():
+                mid = np.minimum((lo + hi) // 2, horizon)
+                below = demand_before(skus, mid) < target
+                lo = np.where(searching & below, mid + 1, lo)
+                hi = np.where(searching & ~below, mid, hi)
+                searching = lo < hi
+            return lo - 1
+
+        # SKU-location state: on hand at the start of day anchor, shipments since included
+        anchor = np.zeros(n_sku, dtype=int)
+        anchor_on_hand = model.sku_start.astype(float)
+        in_transit = np.zeros(n_sku)
+        review_from = np.zeros(n_sku, dtype=int)
+        # Shipments on their way, one column per shipment a SKU-location has in flight
+        pending_day = np.full((n_sku, 1), free)
+        pending_units = np.zeros((n_sku, 1))
+        orders, stretches = [], []
+        sourced = graph.degree > 0
+
+        def next_order(skus):
+            """Day each SKU-location's position reaches its reorder point, horizon if not before its next arrival."""
+            # Position stays above the reorder point while it is above it on in transit alone
+            room = model.sku_min[skus] - in_transit[skus]
+            target = demand_before(skus, anchor[skus]) + anchor_on_hand[skus] - room
+            day = reaches(skus, target, review_from[skus])
+            # Orders of a SKU-location without sources never ship, its position does not change
+            return np.where((room >= 0) & sourced[skus], day, horizon)
+
+        skus = np.arange(n_sku)
+        order_day = next_order(skus)
+        while len(skus):
+            arrival_day = pending_day[skus].min(axis=1)
+            busy = np.minimum(order_day, arrival_day) < horizon
+            skus, order_day, arrival_day = skus[busy], order_day[busy], arrival_day[busy]
+            if len(skus) == 0:
+                break
+            # Arrivals come first on a day with both, the review follows the day's sales
+            ordering = order_day < arrival_day
+
+            # Min/Max orders, shipped whole from the cheapest source
+            ordered, t = skus[ordering], order_day[ordering]
+            if len(ordered):
+                sold = demand_before(ordered, t + 1) - demand_before(ordered, anchor[ordered])
+                position = np.maximum(anchor_on_hand[ordered] - sold, 0) + in_transit[ordered]
+                units = model.sku_max[ordered] - position
+                edges = graph.indptr[ordered]
+                arrival = np.minimum(t + lead_time_paths[t, graph.lane_row[edges]], horizon)
+                slots = pending_day[ordered]
+                slot = (slots == free).argmax(axis=1)
+                full = slots[np.arange(len(ordered)), slot] != free
+                if full.any():
+                    slot[full] = pending_day.shape[1]
+                    pending_day = np.hstack([pending_day, np.full((n_sku, 1), free)])
+                    pending_units = np.hstack([pending_units, np.zeros((n_sku, 1))])
+                pending_day[ordered, slot] = arrival
+                pending_units[ordered, slot] = units
+                in_transit[ordered] += units
+                review_from[ordered] = t + 1
+                orders.append((ordered, t, edges, units, arrival))
+
+            # Arrivals, the stock sold since the anchor is settled and a new stretch starts
+            arriving, t = skus[~ordering], arrival_day[~ordering]
+            if len(arriving):
+                due = pending_day[arriving] == t[:, None]
+                received = np.where(due, pending_units[arriving], 0).sum(axis=1)
+                pending_day[arriving] = np.where(due, free, pending_day[arriving])
+                stretches.append((arriving, anchor[arriving], t, anchor_on_hand[arriving]))
+                sold = demand_before(arriving, t) - demand_before(arriving, anchor[arriving])
+                anchor_on_hand[arriving] = np.maximum(anchor_on_hand[arriving] - sold, 0) + received
+                anchor[arriving] = t
+                in_transit[arriving] -= received
+                review_from[arriving] = t
+
+            order_day = next_order(skus)
+        stretches.append((np.arange(n_sku), anchor, np.full(n_sku, horizon), anchor_on_hand))
+
+        if orders:
+            order_sku, order_day, order_edge, order_units, order_arrival = map(np.concatenate, zip(*orders))
+        else:
+            order_sku = order_day = order_edge = order_arrival = np.zeros(0, dtype=int)
+            order_units = np.zeros(0)
+        fp_end, fp_produced = self._factory_stock(horizon, order_day, graph.fp_row[order_edge], order_units)
+        if fp_end is None:
+            return None
+
+        # Stockouts: a stretch runs out on the first day its demand reaches its opening stock,
+        # sells part of that day's demand and loses all demand after it until the next arrival
+        sku, start, end, stock = map(np.concatenate, zip(*stretches))
+        out_day = reaches(sku, demand_before(sku, start) + stock, start)
+        runs_out = out_day < end
+        sku, out_day, end = sku[runs_out], out_day[runs_out], end[runs_out]
+        short = demand_before(sku, out_day + 1) - demand_before(sku, start[runs_out]) - stock[runs_out]
+        days_lost = end - out_day - 1
+        lost_sku = np.concatenate([sku, np.repeat(sku, days_lost)])
+        ends = np.cumsum(days_lost)
+        lost_day = np.concatenate(
+            [out_day, np.repeat(out_day + 1 - (ends - days_lost), days_lost) + np.arange(ends[-1] if len(ends) else 0)]
+        )
+        lost_units = np.concatenate([short, demand_paths[lost_day[len(sku) :], lost_sku[len(sku) :]]])
+
+        def by_day(days, weights, length=horizon):
+            return np.bincount(days, weights=weights, minlength=length + 1)[:length]
+
+        demand_total = demand_paths.sum(axis=1)
+        lost_total = by_day(lost_day, lost_units)
+        arrived = order_arrival < horizon
+        arrival_total = by_day(order_arrival[arrived], order_units[arrived])
+        # On hand changes by what arrives, less what sells, i.e. the demand that was not lost
+        on_hand_total = model.sku_start.sum() + np.cumsum(arrival_total - demand_total + lost_total)
+        sku_holding = model.sku_start @ self.sku_holding + np.cumsum(
+            by_day(order_arrival[arrived], order_units[arrived] * self.sku_holding[order_sku[arrived]])
+            - demand_paths @ self.sku_holding
+            + by_day(lost_day, lost_units * self.sku_holding[lost_sku])
+        )
+        daily = {
+            "demand": demand_total,
+            "fulfilled": demand_total - lost_total,
+            "lost": lost_total,
+            "shipped": by_day(order_day, order_units),
+            "on_hand": on_hand_total,
+            "holding_cost": sku_holding + fp_end @ self.fp_holding,
+            "transportation_cost": by_day(order_day, order_units * graph.transport_cost[order_edge]),
+            "production_cost": fp_produced @ model.fp_unit_cost,
+            "opportunity_cost": by_day(lost_day, lost_units * model.sku_opportunity_cost[lost_sku]),
+        }
+        series = {}
+        if record:
+            # Recorded runs return every day of every SKU-location, so these are dense anyway
+            shape = (horizon, n_sku)
+            lost = np.zeros(shape)
+            lost[lost_day, lost_sku] = lost_units
+            shipped = np.zeros(shape)
+            shipped[order_day, order_sku] = order_units
+            arrivals = np.zeros((horizon + 1, n_sku))
+            np.add.at(arrivals, (order_arrival, order_sku), order_units)
+            on_hand = np.cumsum(arrivals[:horizon] - demand_paths + lost, axis=0) + model.sku_start
+            series = {
+                "on_hand": on_hand,
+                "demand": demand_paths,
+                "fulfilled": demand_paths - lost,
+                "lost": lost,
+                "shipped": shipped,
+            }
+        return self._result(horizon, daily, series)
+
+    def _factory_stock(self, horizon, order_day, order_fp, order_units):
+        """
+        End-of-day stock & production of every factory product, (None, None) when short.
+
+        Factories produce back up to their starting inventory within capacity, so
+        stock follows s[t] = min(start, s[t - 1] + capacity) - shipped[t], whose
+        closed form is a running minimum over the days stock last hit its start.
+        """
+        model = self.model
+        n_fp = len(model.fp_product)
+        shipped = np.bincount(order_day * n_fp + order_fp, weights=order_units, minlength=horizon * n_fp)
+        shipped_before = np.cumsum(shipped.reshape(horizon, n_fp), axis=0)
+        days = np.arange(horizon)[:, None]
+        capacity = days * model.fp_capacity
+        # s[t] = start + t * capacity - shipped[0..t] + min over k <= t of (shipped[0..k-1] - k * capacity)
+        refill = np.vstack([np.zeros(n_fp), shipped_before[:-1]]) - capacity
+        stock = model.fp_start + capacity - shipped_before + np.minimum.accumulate(refill, axis=0)
+        # Orders only all ship whole when no factory was asked for more than it held
+        if (stock < 0).any():
+            return None, None
+        shipped = shipped.reshape(horizon, n_fp)
+        produced = stock + shipped - np.vstack([model.fp_start, stock[:-1]])
+        return stock, produced
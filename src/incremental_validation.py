@@ -0,0 +1,137 @@
+import pandas as pd
+
+from src.simulation_check import REPORT_COLUMNS, SimulationExecutionCheck, sort_report
+
+# Levels whose checks must pass before a level's own results are meaningful
+LEVEL_DEPENDENCIES = {
+    "Factory Level": [],
+    "Warehouse Level": [],
+    "Factory Product Level": ["Factory Level"],
+    "Warehouse Factory Level": ["Factory Level", "Warehouse Level", "Factory Product Level"],
+    "Warehouse Product Level": ["Warehouse Level", "Factory Product Level", "Warehouse Factory Level"],
+}
+
+# Key columns checked for duplicates within a level
+LEVEL_KEYS = {
+    "Factory Level": [["Factory"]],
+    "Factory Product Level": [["Factory", "Product"]],
+    "Warehouse Level": [["Warehouse"]],
+    "Warehouse Factory Level": [["Warehouse", "Factory"]],
+    "Warehouse Product Level": [["Warehouse", "Product"]],
+}
+
+# (column, referencing level, referencing column) - rows of the referencing level
+# whose value matches an edited key are rechecked (orphans & lane coverage)
+REFERENCES = {
+    "Factory Level": [
+        ("Factory", "Factory Product Level", "Factory"),
+        ("Factory", "Warehouse Factory Level", "Factory"),
+    ],
+    "Warehouse Level": [
+        ("Warehouse", "Warehouse Factory Level", "Warehouse"),
+        ("Warehouse", "Warehouse Product Level", "Warehouse"),
+    ],
+    "Factory Product Level": [("Product", "Warehouse Product Level", "Product")],
+    "Warehouse Factory Level": [("Warehouse", "Warehouse Product Level", "Warehouse")],
+}
+
+
+def has_edits(editor_state):
+    """True when a data_editor state holds any edited, added or deleted rows."""
+    return isinstance(editor_state, dict) and any(
+        editor_state.get(k) for k in ["edited_rows", "added_rows", "deleted_rows"]
+    )
+
+
+def report_statuses(report):
+    """
+    Validation result per level read from the issue report, following the dependency order.
+
+    A level is "Not-checked" when a level it depends on did not pass, "Passed"
+    when the report holds none of its issues, otherwise its first issue.
+    """
+    statuses = {}
+    for level, dependencies in LEVEL_DEPENDENCIES.items():
+        issues = report[report["Level"] == level]
+        if any(statuses[d] != "Passed" for d in dependencies):
+            statuses[level] = "Not-checked"
+        elif issues.empty:
+            statuses[level] = "Passed"
+        else:
+            first = issues.iloc[0]
+            where = f"row {first['Row']}, " if pd.notna(first["Row"]) else ""
+            statuses[level] = f"{first['Message']} ({where}column '{first['Column']}')"
+            if len(issues) > 1:
+                statuses[level] += f" and {len(issues) - 1} more issue(s)"
+    return statuses
+
+
+def _rows_matching(df, keys, values):
+    """Index labels of rows whose key tuple appears in values."""
+    if df.empty or any(k not in df.columns for k in keys):
+        return pd.Index([])
+    values = values.dropna()
+    if len(keys) == 1:
+        mask = df[keys[0]].isin(values[keys[0]])
+    else:
+        mask = pd.MultiIndex.from_frame(df[keys]).isin(pd.MultiIndex.from_frame(values[keys]))
+    return df.index[mask]
+
+
+class IncrementalValidator:
+    """
+    Validation report kept across reruns and updated from data_editor deltas.
+
+    An edit only rechecks the touched rows, rows sharing their keys (duplicates)
+    and rows in other levels that reference those keys, instead of all tables.
+    """
+
+    def __init__(self):
+        self.checker = SimulationExecutionCheck(vectorized=True)
+        self.report = pd.DataFrame(columns=REPORT_COLUMNS)
+
+    def reset(self, report):
+        """Adopt a report computed by a full validation."""
+        self.report = report
+
+    def apply_edits(self, tables, level, previous_df, editor_state):
+        """Recheck the rows an editor delta touched and return the updated report."""
+        df = tables[level]
+        n_previous = len(previous_df)
+        edited = [p for p in editor_state.get("edited_rows", {}) if p < n_previous]
+        deleted = [p for p in editor_state.get("deleted_rows", []) if p < n_previous]
+        # Added rows are appended at the end of the table
+        n_added = len(editor_state.get("added_rows", []))
+        added = df.index[len(df) - n_added :] if n_added else df.index[:0]
+        touched = df.index.intersection(previous_df.index[edited]).append(added)
+
+        # Old values of edited & deleted rows, new values of edited & added rows
+        before = previous_df.iloc[edited + deleted]
+        after = df.loc[touched]
+        # Empty frames are left out, concat warns about their dtypes
+        values = pd.concat([f for f in [before, after] if not f.empty] or [after])
+
+        scope = {level: touched}
+        for keys in LEVEL_KEYS[level]:
+            if all(k in values.columns for k in keys):
+                scope[level] = scope[level].union(_rows_matching(df, keys, values[keys]))
+        for col, other_level, other_col in REFERENCES.get(level, []):
+            if col in values.columns:
+                rows = _rows_matching(
+                    tables.get(other_level, pd.DataFrame()),
+                    [other_col],
+                    values[[col]].rename(columns={col: other_col}),
+                )
+                scope[other_level] = scope.get(other_level, pd.Index([])).union(rows)
+
+        # Drop issues of rechecked rows & rows that no longer exist
+        stale = pd.Series(False, index=self.report.index)
+        for scoped_level, rows in scope.items():
+            stale |= (self.report["Level"] == scoped_level) & self.report["Row"].isin(rows)
+        removed = previous_df.index[deleted].difference(df.index)
+        stale |= (self.report["Level"] == level) & self.report["Row"].isin(removed)
+
+        fresh = self.checker.validation_report(tables, scope)
+        kept = [f for f in [self.report[~stale], fresh] if not f.empty] or [fresh]
+        self.report = sort_report(pd.concat(kept, ignore_index=True))
+        return self.report
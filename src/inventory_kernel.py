@@ -0,0 +1,131 @@
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+def _min_max_days(
+    demand_paths,
+    lead_time_paths,
+    sku_start,
+    sku_min,
+    sku_max,
+    sku_holding,
+    sku_opportunity_cost,
+    fp_start,
+    fp_capacity,
+    fp_holding,
+    fp_unit_cost,
+    indptr,
+    edge_fp,
+    edge_lane,
+    edge_transport_cost,
+    daily,
+    series,
+):
+    """
+    The daily engine's day loop with greedy sourcing, written as plain loops for Numba.
+
+    daily -> (9, horizon) output rows in DAILY_TOTALS order
+    series -> (5, horizon, n_sku) output in SKU_SERIES order, or (5, 0, 0) to skip it
+    """
+    horizon, n_sku = demand_paths.shape
+    n_fp = fp_start.shape[0]
+    record = series.shape[1] > 0
+    on_hand = sku_start.copy()
+    in_transit = np.zeros(n_sku)
+    fp_stock = fp_start.copy()
+    pipeline = np.zeros((horizon + 1, n_sku))
+    remaining = np.zeros(n_sku)
+    requested = np.zeros(n_fp)
+    fill = np.ones(n_fp)
+    sent_by_fp = np.zeros(n_fp)
+    max_degree = 0
+    for i in range(n_sku):
+        max_degree = max(max_degree, indptr[i + 1] - indptr[i])
+
+    for t in range(horizon):
+        production_cost = 0.0
+        holding_cost = 0.0
+        for f in range(n_fp):
+            # Factories produce back up to their starting inventory, within capacity
+            produced = min(fp_capacity[f], max(fp_start[f] - fp_stock[f], 0.0))
+            fp_stock[f] += produced
+            production_cost += produced * fp_unit_cost[f]
+
+        total_demand = 0.0
+        total_fulfilled = 0.0
+        total_lost = 0.0
+        opportunity_cost = 0.0
+        for i in range(n_sku):
+            # Receive shipments due today
+            on_hand[i] += pipeline[t, i]
+            in_transit[i] -= pipeline[t, i]
+            # Serve demand, unmet demand is lost
+            demand = demand_paths[t, i]
+            fulfilled = min(on_hand[i], demand)
+            on_hand[i] -= fulfilled
+            total_demand += demand
+            total_fulfilled += fulfilled
+            total_lost += demand - fulfilled
+            opportunity_cost += (demand - fulfilled) * sku_opportunity_cost[i]
+            # Min/Max review on inventory position
+            position = on_hand[i] + in_transit[i]
+            remaining[i] = sku_max[i] - position if position <= sku_min[i] else 0.0
+            if record:
+                series[1, t, i] = demand
+                series[2, t, i] = fulfilled
+                series[3, t, i] = demand - fulfilled
+
+        # Greedy sourcing: round k sends open orders to their k-th cheapest source
+        total_shipped = 0.0
+        transportation_cost = 0.0
+        for k in range(max_degree):
+            requested[:] = 0.0
+            for i in range(n_sku):
+                if remaining[i] > 0 and indptr[i] + k < indptr[i + 1]:
+                    requested[edge_fp[indptr[i] + k]] += remaining[i]
+            for f in range(n_fp):
+                fill[f] = fp_stock[f] / requested[f] if requested[f] > fp_stock[f] else 1.0
+            sent_by_fp[:] = 0.0
+            for i in range(n_sku):
+                edge = indptr[i] + k
+                if remaining[i] > 0 and edge < indptr[i + 1]:
+                    sent = np.floor(remaining[i] * fill[edge_fp[edge]])
+                    remaining[i] -= sent
+                    sent_by_fp[edge_fp[edge]] += sent
+                    if sent != 0:
+                        arrival = min(t + lead_time_paths[t, edge_lane[edge]], horizon)
+                        pipeline[arrival, i] += sent
+                        in_transit[i] += sent
+                        total_shipped += sent
+                        transportation_cost += sent * edge_transport_cost[edge]
+                        if record:
+                            series[4, t, i] += sent
+            for f in range(n_fp):
+                fp_stock[f] -= sent_by_fp[f]
+
+        total_on_hand = 0.0
+        for i in range(n_sku):
+            total_on_hand += on_hand[i]
+            holding_cost += on_hand[i] * sku_holding[i]
+            if record:
+                series[0, t, i] = on_hand[i]
+        for f in range(n_fp):
+            holding_cost += fp_stock[f] * fp_holding[f]
+
+        daily[0, t] = total_demand
+        daily[1, t] = total_fulfilled
+        daily[2, t] = total_lost
+        daily[3, t] = total_shipped
+        daily[4, t] = total_on_hand
+        daily[5, t] = holding_cost
+        daily[6, t] = transportation_cost
+        daily[7, t] = production_cost
+        daily[8, t] = opportunity_cost
+
+
+# Compiled kernel, None when Numba is not installed and the NumPy day loop runs instead
+min_max_kernel = njit(cache=True, nogil=True)(_min_max_days) if njit is not None else None
@@ -0,0 +1,128 @@
+import os
+import threading
+import time
+import uuid
+from concurrent.futures import CancelledError, ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+
+
+@dataclass
+class Job:
+    """A background run, its progress and its result once finished."""
+
+    id: str
+    label: str
+    status: str = "queued"
+    done: int = 0
+    total: int = 0
+    # Latest interim result the job published while running
+    partial: object = None
+    result: object = None
+    error: BaseException = None
+    submitted_at: float = field(default_factory=time.time)
+    finished_at: float = None
+    _cancel: threading.Event = field(default_factory=threading.Event, repr=False)
+
+    @property
+    def finished(self):
+        return self.status in ("done", "failed", "cancelled")
+
+    @property
+    def progress(self):
+        """Fraction of the work done, 0 until the job reports its total."""
+        return min(self.done / self.total, 1.0) if self.total else 0.0
+
+    def report(self, done, total):
+        self.done, self.total = done, total
+
+    def publish(self, partial):
+        self.partial = partial
+
+    def cancel(self):
+        self._cancel.set()
+
+    def cancelled(self):
+        return self._cancel.is_set()
+
+
+class JobManager:
+    """
+    Registry of background simulation jobs, shared by every session.
+
+    Jobs run on a bounded pool of threads so they outlive the Streamlit rerun
+    that submitted them, and their heavy work goes to one shared process pool,
+    so concurrent users queue for a fixed number of workers instead of each
+    starting their own. A job function is called with the shared `executor`,
+    a `progress(done, total)` callback, a `partial(result)` callback for interim
+    results and a `cancelled()` poll on top of its own arguments; raising
+    CancelledError marks the job cancelled.
+    """
+
+    def __init__(self, max_workers=None, max_jobs=4, keep_finished=100):
+        # max_workers -> Processes shared by all jobs
+        # max_jobs -> Jobs running at once, later ones wait as queued
+        # keep_finished -> Finished jobs kept for their sessions to collect
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.keep_finished = keep_finished
+        self.executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        self._threads = ThreadPoolExecutor(max_workers=max_jobs, thread_name_prefix="simulation-job")
+        self._jobs = {}
+        self._lock = threading.Lock()
+
+    def submit(self, label, fn, *args, **kwargs):
+        job = Job(id=uuid.uuid4().hex, label=label)
+        with self._lock:
+            self._jobs[job.id] = job
+            self._prune()
+        self._threads.submit(self._run, job, fn, args, kwargs)
+        return job
+
+    def get(self, job_id):
+        """Job `job_id`, or None once it was collected or pruned."""
+        return self._jobs.get(job_id)
+
+    def collect(self, job_id):
+        """Remove a finished job from the registry and return it."""
+        with self._lock:
+            job = self._jobs.get(job_id)
+            if job is None or not job.finished:
+                return None
+            return self._jobs.pop(job_id)
+
+    def _run(self, job, fn, args, kwargs):
+        if job.cancelled():
+            job.status, job.finished_at = "cancelled", time.time()
+            return
+        job.status = "running"
+        executor = self.executor
+        try:
+            job.result = fn(
+                *args,
+                executor=executor,
+                progress=job.report,
+                partial=job.publish,
+                cancelled=job.cancelled,
+                **kwargs,
+            )
+            job.status = "done"
+        except CancelledError:
+            job.status = "cancelled"
+        except Exception as e:
+            if isinstance(e, BrokenProcessPool):
+                self._replace_executor(executor)
+            job.error = e
+            job.status = "failed"
+        job.finished_at = time.time()
+
+    def _replace_executor(self, broken):
+        """Start a new process pool after a worker died, unless another job already did."""
+        with self._lock:
+            if self.executor is broken:
+                self.executor = ProcessPoolExecutor(max_workers=self.max_workers)
+
+    def _prune(self):
+        """Drop the oldest finished jobs nobody collected beyond `keep_finished`."""
+        finished = [job for job in self._jobs.values() if job.finished]
+        for job in finished[: max(len(finished) - self.keep_finished, 0)]:
+            del self._jobs[job.id]
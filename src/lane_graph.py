@@ -0,0 +1,100 @@
+import numpy as np
+import pandas as pd
+
+
+def _codes(*columns):
+    """Integer codes shared across columns, missing values become -1."""
+    values = pd.concat([col.astype(object) for col in columns], ignore_index=True)
+    codes, _ = pd.factorize(values)
+    return np.split(codes, np.cumsum([len(col) for col in columns])[:-1])
+
+
+def _numbers(df, column):
+    if column not in df.columns:
+        return np.full(len(df), np.nan)
+    return pd.to_numeric(df[column], errors="coerce").to_numpy(float)
+
+
+class LaneGraph:
+    """
+    Sourcing lanes of every warehouse-product as a CSR adjacency.
+
+    Row i of the Warehouse Product Level owns the edges indptr[i]:indptr[i + 1];
+    each edge is a feasible (factory product row, lane row) pair, i.e. a lane
+    into the warehouse from a factory making the product. Edges of a row are
+    sorted by unit cost (production + transportation), so the cheapest source
+    is the first edge and every lookup costs O(degree) instead of a table scan.
+    """
+
+    def __init__(self, fp_factory, fp_product, fp_cost, lane_warehouse, lane_factory, lane_cost, sku_warehouse, sku_product):
+        # fp_* -> Factory Product Level rows: factory id, product id, production cost per unit
+        # lane_* -> Warehouse Factory Level rows: warehouse id, factory id, transportation cost per unit
+        # sku_* -> Warehouse Product Level rows: warehouse id, product id
+        # Ids are integer codes shared across levels, -1 marks a missing name
+        self.n_rows = len(sku_product)
+        skus = pd.DataFrame({"row": np.arange(self.n_rows), "warehouse": sku_warehouse, "product": sku_product})
+        fps = pd.DataFrame({"fp": np.arange(len(fp_product)), "factory": fp_factory, "product": fp_product})
+        lanes = pd.DataFrame({"lane": np.arange(len(lane_factory)), "warehouse": lane_warehouse, "factory": lane_factory})
+        edges = (
+            skus[(skus["warehouse"] >= 0) & (skus["product"] >= 0)]
+            .merge(fps[fps["factory"] >= 0], on="product")
+            .merge(lanes, on=["warehouse", "factory"])
+        )
+        edges["transport_cost"] = np.asarray(lane_cost, float)[edges["lane"].to_numpy()]
+        edges["production_cost"] = np.asarray(fp_cost, float)[edges["fp"].to_numpy()]
+        edges["unit_cost"] = edges["transport_cost"] + edges["production_cost"]
+        edges = edges.sort_values(["row", "unit_cost", "lane"], kind="stable")
+
+        degree = np.bincount(edges["row"].to_numpy(), minlength=self.n_rows)
+        self.indptr = np.concatenate([[0], np.cumsum(degree)])
+        self.edge_row = edges["row"].to_numpy(int)
+        self.fp_row = edges["fp"].to_numpy(int)
+        self.lane_row = edges["lane"].to_numpy(int)
+        self.transport_cost = edges["transport_cost"].to_numpy(float)
+        self.production_cost = edges["production_cost"].to_numpy(float)
+        self.unit_cost = edges["unit_cost"].to_numpy(float)
+
+    @classmethod
+    def from_tables(cls, factory_product_level, warehouse_factory_level, warehouse_product_level):
+        """Graph of raw (unvalidated) tables, names are matched as they are stored."""
+        fp, wf, wp = factory_product_level, warehouse_factory_level, warehouse_product_level
+        fp_factory, lane_factory = _codes(fp["Factory"], wf["Factory"])
+        fp_product, sku_product = _codes(fp["Product"], wp["Product"])
+        lane_warehouse, sku_warehouse = _codes(wf["Warehouse"], wp["Warehouse"])
+        # Costs are NaN where a value is missing or not a number
+        lane_cost = _numbers(wf, "Transporatation Cost Per Unit Per Km") * _numbers(
+            wf, "Distance Between Warehouse & Factory"
+        )
+        fp_cost = _numbers(fp, "Production Cost Per Unit")
+        return cls(fp_factory, fp_product, fp_cost, lane_warehouse, lane_factory, lane_cost, sku_warehouse, sku_product)
+
+    @property
+    def degree(self):
+        """Number of feasible sources per warehouse-product row."""
+        return np.diff(self.indptr)
+
+    @property
+    def covered(self):
+        """True where a warehouse-product row has at least one feasible source."""
+        return self.degree > 0
+
+    def sources(self, row):
+        """Edge slice of one warehouse-product row, cheapest first."""
+        return slice(self.indptr[row], self.indptr[row + 1])
+
+    def edges(self, rows):
+        """Edges of every row in `rows`, row by row and cheapest first within a row."""
+        starts = self.indptr[rows]
+        counts = self.indptr[np.asarray(rows) + 1] - starts
+        ends = np.cumsum(counts)
+        return np.repeat(starts - (ends - counts), counts) + np.arange(ends[-1] if len(ends) else 0)
+
+    def cheapest(self):
+        """(factory product row, lane row) of the cheapest source per row, -1 where none."""
+        first = self.indptr[:-1]
+        fp_row = np.full(self.n_rows, -1)
+        lane_row = np.full(self.n_rows, -1)
+        covered = self.covered
+        fp_row[covered] = self.fp_row[first[covered]]
+        lane_row[covered] = self.lane_row[first[covered]]
+        return fp_row, lane_row
@@ -0,0 +1,170 @@
+import numpy as np
+import pandas as pd
+
+from src.lane_graph import LaneGraph
+from src.simulation_check import (
+    parse_distribution_parameters,
+    parse_min_max_inventory_policy,
+)
+
+
+def _ids(values, id_map):
+    """Map names to integer ids, unknown or missing names become -1."""
+    return values.astype(str).map(id_map).fillna(-1).to_numpy(int)
+
+
+def _numbers(values):
+    return pd.to_numeric(values, errors="coerce").to_numpy(float)
+
+
+class DistributionSpec:
+    """
+    A parsed distribution column as typed NumPy arrays, one entry per row.
+
+    Parameters that do not apply to a row's family are NaN. Categorical rows
+    keep their support and probabilities padded to a common width.
+    """
+
+    def __init__(self, distributions, parameters, column_name):
+        # distributions -> Normal, Exponential, Categorical per row
+        # parameters -> Parameter dictionary string per row
+        # column_name -> Column the parameters belong to, used in messages
+        self.family = distributions.astype(str).to_numpy()
+        n = len(self.family)
+        self.mean = np.full(n, np.nan)
+        self.std_dev = np.full(n, np.nan)
+        self.lambda_ = np.full(n, np.nan)
+        self.messages = np.full(n, None, dtype=object)
+        self.valid = np.zeros(n, dtype=bool)
+
+        categorical = {}
+        for i, (family, value_string) in enumerate(zip(self.family, parameters)):
+            value, message = parse_distribution_parameters(value_string, family, column_name)
+            self.messages[i] = message
+            if value is None:
+                continue
+            self.valid[i] = True
+            if family == "Normal":
+                self.mean[i] = value["mean"]
+                self.std_dev[i] = value["std_dev"]
+            elif family == "Exponential":
+                self.lambda_[i] = value["lambda"]
+            elif family == "Categorical":
+                categorical[i] = value
+
+        # Categorical support sorted ascending & padded with the last value
+        width = max((len(v) for v in categorical.values()), default=0)
+        self.cat_support = np.zeros((n, width))
+        self.cat_prob = np.zeros((n, width))
+        for i, value in categorical.items():
+            keys = sorted(value)
+            self.cat_support[i, : len(keys)] = keys
+            self.cat_support[i, len(keys) :] = keys[-1]
+            self.cat_prob[i, : len(keys)] = [value[k] for k in keys]
+
+    def rows(self, family):
+        """Row positions of a family whose parameters parsed successfully."""
+        return np.flatnonzero((self.family == family) & self.valid)
+
+
+class NetworkModel:
+    """
+    Compiled view of the five network tables.
+
+    Built once from the tables, it holds integer ids for factories, warehouses
+    and products and every numeric & parsed parameter column as NumPy arrays.
+    Validation reads the parameter parse results from here and the simulation
+    engines read everything else, so parameter strings are parsed only once.
+    """
+
+    def __init__(self, tables):
+        factory_level = tables["Factory Level"]
+        warehouse_level = tables["Warehouse Level"]
+        factory_product_level = tables["Factory Product Level"]
+        warehouse_factory_level = tables["Warehouse Factory Level"]
+        warehouse_product_level = tables["Warehouse Product Level"]
+
+        # Integer id maps
+        self.factory_names = pd.unique(factory_level["Factory"].astype(str).to_numpy())
+        self.warehouse_names = pd.unique(warehouse_level["Warehouse"].astype(str).to_numpy())
+        self.product_names = pd.unique(factory_product_level["Product"].astype(str).to_numpy())
+        self.factory_ids = {name: i for i, name in enumerate(self.factory_names)}
+        self.warehouse_ids = {name: i for i, name in enumerate(self.warehouse_names)}
+        self.product_ids = {name: i for i, name in enumerate(self.product_names)}
+
+        # Factory & warehouse level
+        factory_holding = np.full(len(self.factory_names), np.nan)
+        factory_holding[_ids(factory_level["Factory"], self.factory_ids)] = _numbers(
+            factory_level["Holding Cost Per Unit Per Day"]
+        )
+        warehouse_holding = np.full(len(self.warehouse_names), np.nan)
+        warehouse_holding[_ids(warehouse_level["Warehouse"], self.warehouse_ids)] = _numbers(
+            warehouse_level["Holding Cost Per Unit Per Day"]
+        )
+        self.factory_holding = factory_holding
+        self.warehouse_holding = warehouse_holding
+
+        # Factory product level
+        fp = factory_product_level
+        self.fp_factory = _ids(fp["Factory"], self.factory_ids)
+        self.fp_product = _ids(fp["Product"], self.product_ids)
+        self.fp_capacity = _numbers(fp["Production Capacity"])
+        self.fp_start = _numbers(fp["Starting Inventory"])
+        self.fp_unit_cost = _numbers(fp["Production Cost Per Unit"])
+
+        # Warehouse factory level (lanes)
+        wf = warehouse_factory_level
+        self.lane_warehouse = _ids(wf["Warehouse"], self.warehouse_ids)
+        self.lane_factory = _ids(wf["Factory"], self.factory_ids)
+        self.lane_cost_per_km = _numbers(wf["Transporatation Cost Per Unit Per Km"])
+        self.lane_distance = _numbers(wf["Distance Between Warehouse & Factory"])
+        self.lane_unit_cost = self.lane_cost_per_km * self.lane_distance
+        self.lead_time = DistributionSpec(
+            wf["Lead Time Distribution"], wf["Lead Time Parameters"], "Lead Time Parameters"
+        )
+
+        # Warehouse product level (SKU-locations)
+        wp = warehouse_product_level
+        self.sku_warehouse = _ids(wp["Warehouse"], self.warehouse_ids)
+        self.sku_product = _ids(wp["Product"], self.product_ids)
+        self.sku_safety_stock = _numbers(wp["Safety Stock"])
+        self.sku_start = _numbers(wp["Starting Inventory"])
+        self.sku_opportunity_cost = _numbers(wp["Opportunity Cost Per Unit"])
+        self.demand = DistributionSpec(
+            wp["Daily Demand Distribution"],
+            wp["Demand Distribution Parameters"],
+            "Demand Distribution Parameters",
+        )
+        self.sku_policy = wp["Inventory Policy"].astype(str).to_numpy()
+        self.sku_min = np.full(len(wp), np.nan)
+        self.sku_max = np.full(len(wp), np.nan)
+        self.policy_messages = np.full(len(wp), None, dtype=object)
+        for i in np.flatnonzero(self.sku_policy == "Min/Max"):
+            value, message = parse_min_max_inventory_policy(
+                wp["Inventory Policy Parameters"].iat[i], "Inventory Policy Parameters"
+            )
+            self.policy_messages[i] = message
+            if value is not None:
+                self.sku_min[i] = value["min"]
+                self.sku_max[i] = value["max"]
+
+        # Feasible sourcing lanes of every SKU-location, cheapest first
+        self.lane_graph = LaneGraph(
+            self.fp_factory,
+            self.fp_product,
+            self.fp_unit_cost,
+            self.lane_warehouse,
+            self.lane_factory,
+            self.lane_unit_cost,
+            self.sku_warehouse,
+            self.sku_product,
+        )
+
+    @property
+    def n_sku(self):
+        return len(self.sku_product)
+
+    @property
+    def sku_names(self):
+        """(warehouse, product) names for every SKU-location row."""
+        return self.warehouse_names[self.sku_warehouse], self.product_names[self.sku_product]
@@ -0,0 +1,291 @@
+import os
+import pickle
+import tempfile
+import threading
+import uuid
+from concurrent.futures import FIRST_COMPLETED, CancelledError, ProcessPoolExecutor, TimeoutError, wait
+from dataclasses import dataclass
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+
+from src.simulation_engine import SimulationEngine
+
+KPI_NAMES = [
+    "fill_rate",
+    "holding_cost",
+    "transportation_cost",
+    "production_cost",
+    "opportunity_cost",
+    "total_cost",
+]
+
+# Engine compiled once per worker process by the pool initializer
+_worker_engine = None
+# Engines of jobs sharing a pool, by run key, most recently used last
+_worker_engines = {}
+_MAX_WORKER_ENGINES = 4
+
+
+@dataclass
+class ReplicationResult:
+    """Monte Carlo replications of one scenario."""
+
+    # One row per replication, one column per KPI
+    replications: pd.DataFrame
+    # One row per KPI with mean, std dev and confidence interval
+    summary: pd.DataFrame
+    # True when the confidence intervals reached their tolerances before n_replications
+    stopped_early: bool = False
+
+
+def _init_worker(model, sourcing="greedy", engine=SimulationEngine):
+    global _worker_engine
+    _worker_engine = engine(model, sourcing)
+
+
+def _run_batch(seeds, horizon):
+    """Run a batch of replications in the worker and return their KPIs."""
+    return [_worker_engine.run(horizon=horizon, seed=seed, record=False).kpis for seed in seeds]
+
+
+def _run_keyed_batch(key, model_path, sourcing, engine_class, seeds, horizon):
+    """Run a batch on a shared pool, loading each run's model & building its engine once per worker."""
+    engine = _worker_engines.pop(key, None)
+    if engine is None:
+        with open(model_path, "rb") as f:
+            engine = engine_class(pickle.load(f), sourcing)
+    _worker_engines[key] = engine
+    while len(_worker_engines) > _MAX_WORKER_ENGINES:
+        del _worker_engines[next(iter(_worker_engines))]
+    return [engine.run(horizon=horizon, seed=seed, record=False).kpis for seed in seeds]
+
+
+def _dump_model(model):
+    """Pickle `model` to a temporary file once, for shared pool workers to load."""
+    fd, path = tempfile.mkstemp(prefix="network_model_", suffix=".pkl")
+    with os.fdopen(fd, "wb") as f:
+        pickle.dump(model, f, protocol=pickle.HIGHEST_PROTOCOL)
+    return path
+
+
+def _remove_when_done(futures, path):
+    """Delete `path` once every future finished, ran or was cancelled."""
+    remaining = len(futures)
+    lock = threading.Lock()
+
+    def release(_):
+        nonlocal remaining
+        with lock:
+            remaining -= 1
+            if remaining == 0:
+                os.remove(path)
+
+    for future in futures:
+        future.add_done_callback(release)
+
+
+def _run_recorded(model, sourcing, engine, horizon, seed):
+    return engine(model, sourcing).run(horizon=horizon, seed=seed)
+
+
+def run_recorded(model, horizon=365, seed=None, sourcing="greedy", engine=SimulationEngine, executor=None, cancelled=None):
+    """
+    One run recorded with its per-SKU-location series.
+
+    executor -> Process pool to run it on, so it does not hold the calling process
+    cancelled -> Polled while waiting on the executor, once it returns True the
+                 run is dropped and CancelledError is raised
+    """
+    if executor is None:
+        return _run_recorded(model, sourcing, engine, horizon, seed)
+    future = executor.submit(_run_recorded, model, sourcing, engine, horizon, seed)
+    while True:
+        try:
+            return future.result(timeout=0.5)
+        except TimeoutError:
+            if cancelled is not None and cancelled():
+                future.cancel()
+                raise CancelledError()
+
+
+def _summary_frame(mean, std, n, confidence):
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    half_width = z * std / np.sqrt(n)
+    return pd.DataFrame(
+        {
+            "Mean": mean,
+            "Std Dev": std,
+            "CI Lower": mean - half_width,
+            "CI Upper": mean + half_width,
+            "Half Width": half_width,
+        }
+    )
+
+
+def summarize_replications(replications, confidence=0.95):
+    """Mean and normal-approximation confidence interval for every KPI column."""
+    n = len(replications)
+    std = replications.std(ddof=1) if n > 1 else replications.std(ddof=0)
+    return _summary_frame(replications.mean(), std, n, confidence)
+
+
+class RunningStats:
+    """Mean & variance of every KPI, updated one replication at a time (Welford's algorithm)."""
+
+    def __init__(self, names=KPI_NAMES):
+        self.names = list(names)
+        self.n = 0
+        self.mean = np.zeros(len(self.names))
+        # Sum of squared deviations from the current mean
+        self._m2 = np.zeros(len(self.names))
+
+    def add(self, kpis):
+        x = np.array([kpis[name] for name in self.names], dtype=float)
+        self.n += 1
+        delta = x - self.mean
+        self.mean += delta / self.n
+        self._m2 += delta * (x - self.mean)
+
+    @property
+    def std(self):
+        return np.sqrt(self._m2 / (self.n - 1 if self.n > 1 else 1))
+
+    def summary(self, confidence=0.95):
+        """Same layout as summarize_replications over the replications added so far."""
+        return _summary_frame(
+            pd.Series(self.mean, index=self.names), pd.Series(self.std, index=self.names), max(self.n, 1), confidence
+        )
+
+    def within(self, tolerances, confidence=0.95):
+        """
+        Whether every KPI's confidence interval is as tight as its tolerance.
+
+        tolerances -> {KPI: half width as a fraction of the KPI's mean}
+        """
+        if self.n < 2:
+            return False
+        half_width = self.summary(confidence)["Half Width"]
+        return all(
+            half_width[name] <= tolerance * abs(self.mean[self.names.index(name)])
+            for name, tolerance in tolerances.items()
+        )
+
+
+def run_replications(
+    model,
+    n_replications,
+    horizon=365,
+    master_seed=0,
+    n_workers=None,
+    batch_size=None,
+    confidence=0.95,
+    sourcing="greedy",
+    engine=SimulationEngine,
+    executor=None,
+    progress=None,
+    cancelled=None,
+    tolerances=None,
+    min_replications=10,
+    partial=None,
+):
+    """
+    Run `n_replications` seeded replications of a scenario across a process pool.
+
+    Every replication gets its own child of `SeedSequence(master_seed)`, so results
+    only depend on the master seed and not on how replications are batched or
+    how many workers run them. Finished batches are folded into running
+    statistics in seed order, so a run with `tolerances` stops at the same
+    replication whatever order the workers finish in.
+
+    executor -> Shared process pool to run the batches on, instead of a pool of its own
+    progress -> Called with (replications done, n_replications) as batches are folded in
+    cancelled -> Polled between batches, once it returns True the outstanding
+                 batches are dropped and CancelledError is raised
+    tolerances -> {KPI: half width as a fraction of its mean}, stop as soon as every
+                  KPI is within its tolerance after at least `min_replications`
+    partial -> Called with the running summary each time batches are folded in
+    """
+    n_workers = n_workers or os.cpu_count() or 1
+    seeds = np.random.SeedSequence(master_seed).spawn(n_replications)
+    if batch_size is None:
+        # A few batches per worker keeps all cores busy without per-task overhead
+        batch_size = max(1, -(-n_replications // (n_workers * 4)))
+        if tolerances:
+            # Small batches let the stopping check run often
+            batch_size = min(batch_size, max(min_replications, 1))
+    batches = [seeds[i : i + batch_size] for i in range(0, n_replications, batch_size)]
+    batch_kpis = [None] * len(batches)
+    stats = RunningStats()
+    kept = []
+    next_batch = 0
+    stopped = False
+
+    def finish(i, kpis):
+        """Fold every batch finished in seed order into the stats, True once within tolerance."""
+        nonlocal next_batch, stopped
+        batch_kpis[i] = kpis
+        while not stopped and next_batch < len(batches) and batch_kpis[next_batch] is not None:
+            for k in batch_kpis[next_batch]:
+                kept.append(k)
+                stats.add(k)
+                if tolerances and stats.n >= min_replications and stats.within(tolerances, confidence):
+                    stopped = True
+                    break
+            next_batch += 1
+        if progress is not None:
+            progress(stats.n, n_replications)
+        if partial is not None and stats.n:
+            partial(stats.summary(confidence))
+        return stopped
+
+    if executor is None and (n_workers == 1 or len(batches) == 1):
+        _init_worker(model, sourcing, engine)
+        for i, batch in enumerate(batches):
+            if cancelled is not None and cancelled():
+                raise CancelledError()
+            if finish(i, _run_batch(batch, horizon)):
+                break
+    else:
+        own_executor = executor is None
+        if own_executor:
+            executor = ProcessPoolExecutor(
+                max_workers=min(n_workers, len(batches)),
+                initializer=_init_worker,
+                initargs=(model, sourcing, engine),
+            )
+            futures = {executor.submit(_run_batch, batch, horizon): i for i, batch in enumerate(batches)}
+        else:
+            # Workers of a shared pool serve other runs too: the key picks this run's engine,
+            # and the model is pickled once to a file instead of with every batch
+            key = uuid.uuid4().hex
+            model_path = _dump_model(model)
+            futures = {
+                executor.submit(_run_keyed_batch, key, model_path, sourcing, engine, batch, horizon): i
+                for i, batch in enumerate(batches)
+            }
+            # Batches already in the pool's call queue cannot be cancelled and still load it
+            _remove_when_done(list(futures), model_path)
+        pending = set(futures)
+        try:
+            while pending and not stopped:
+                finished, pending = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    finish(futures[future], future.result())
+                if pending and not stopped and cancelled is not None and cancelled():
+                    raise CancelledError()
+        finally:
+            for future in pending:
+                future.cancel()
+            if own_executor:
+                executor.shutdown(cancel_futures=True)
+
+    # Replications are kept in seed order, so replication i always lines up with seed i
+    replications = pd.DataFrame(kept, columns=KPI_NAMES)
+    replications.index.name = "Replication"
+    return ReplicationResult(
+        replications=replications,
+        summary=summarize_replications(replications, confidence),
+        stopped_early=len(kept) < n_replications,
+    )
@@ -0,0 +1,67 @@
+import os
+import pickle
+import tempfile
+
+DEFAULT_CACHE_PATH = os.path.join(os.path.dirname(__file__), "..", "run_cache")
+
+
+class RunCache:
+    """
+    Simulation results on local disk keyed by run input hash, shared by every session.
+
+    One pickle file per run; reading a run refreshes its modification time, so
+    when the files outgrow `max_bytes` the least recently used runs are deleted
+    first. Files are written to a temporary name and renamed into place, so
+    concurrent sessions never read a partial run.
+    """
+
+    def __init__(self, root=DEFAULT_CACHE_PATH, max_bytes=2 * 1024**3):
+        # max_bytes -> Size cap of all cached runs together
+        self.root = os.path.abspath(root)
+        self.max_bytes = max_bytes
+
+    def _path(self, key):
+        return os.path.join(self.root, f"{key}.pkl")
+
+    def get(self, key):
+        """Cached value or None."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+            os.utime(path)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            return None
+        return value
+
+    def put(self, key, value):
+        os.makedirs(self.root, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.root, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._path(key))
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+        self._evict()
+
+    def _evict(self):
+        """Delete least recently used runs until the cache fits in max_bytes."""
+        entries = []
+        for entry in os.scandir(self.root):
+            if entry.name.endswith(".pkl"):
+                try:
+                    stat = entry.stat()
+                except FileNotFoundError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
@@ -0,0 +1,112 @@
+import hashlib
+
+import numpy as np
+from scipy.special import ndtri
+
+DISTRIBUTIONS = ["Normal", "Exponential", "Categorical"]
+
+
+class DistributionSampler:
+    """
+    Pre-samples a column of per-row distributions for the whole horizon.
+
+    Rows are grouped by distribution family and each family is drawn as one
+    (horizon, rows) matrix with a single numpy.random.Generator call, instead of
+    one scalar draw per row per day.
+    """
+
+    def __init__(self, spec):
+        # spec -> DistributionSpec with the parsed parameters of every row
+        self.n_rows = len(spec.family)
+        self.families = {}
+        for family in DISTRIBUTIONS:
+            rows = spec.rows(family)
+            if len(rows) == 0:
+                continue
+            if family == "Normal":
+                params = {"mean": spec.mean[rows], "std_dev": spec.std_dev[rows]}
+            elif family == "Exponential":
+                params = {"lambda": spec.lambda_[rows]}
+            else:
+                # Probabilities only sum to 1 within rounding: cap every row at 1 so it
+                # stays within [r, r + 1] of the offset lookup, and close the last bucket
+                cum_prob = np.minimum(np.cumsum(spec.cat_prob[rows], axis=1), 1.0)
+                cum_prob[:, -1] = 1.0
+                params = {"support": spec.cat_support[rows], "cum_prob": cum_prob}
+            self.families[family] = (rows, params)
+
+    @staticmethod
+    def _categorical_lookup(params, u):
+        """Map uniforms (horizon, rows) to categorical values in one searchsorted."""
+        support, cum_prob = params["support"], params["cum_prob"]
+        n, width = cum_prob.shape
+        # Shift row r into [r, r + 1] so all rows form one sorted array
+        offsets = np.arange(n)
+        flat = (cum_prob + offsets[:, None]).ravel()
+        position = np.searchsorted(flat, u + offsets, side="right") - offsets * width
+        position = np.clip(position, 0, width - 1)
+        return support[offsets, position]
+
+    def sample(self, rng, horizon):
+        """Return a (horizon, n_rows) matrix of draws."""
+        values = np.zeros((horizon, self.n_rows))
+        for family, (rows, params) in self.families.items():
+            size = (horizon, len(rows))
+            if family == "Normal":
+                values[:, rows] = rng.normal(params["mean"], params["std_dev"], size=size)
+            elif family == "Exponential":
+                values[:, rows] = rng.exponential(1.0 / params["lambda"], size=size)
+            else:
+                values[:, rows] = self._categorical_lookup(params, rng.random(size))
+        return values
+
+    def transform(self, u):
+        """Map uniforms in (0, 1) of shape (horizon, n_rows) to draws by inverse transform."""
+        values = np.zeros(u.shape)
+        for family, (rows, params) in self.families.items():
+            if family == "Normal":
+                values[:, rows] = params["mean"] + params["std_dev"] * ndtri(u[:, rows])
+            elif family == "Exponential":
+                values[:, rows] = -np.log1p(-u[:, rows]) / params["lambda"]
+            else:
+                values[:, rows] = self._categorical_lookup(params, u[:, rows])
+        return values
+
+
+def stream_keys(stream, *names):
+    """
+    Stable 64-bit key per row for common random numbers.
+
+    stream -> Name of the random stream, e.g. "demand"
+    names -> Equal length arrays naming each row, e.g. warehouses & products
+    """
+    keys = np.zeros(len(names[0]), dtype=np.uint64)
+    for i, row in enumerate(zip(*names)):
+        label = "\x1f".join([stream, *map(str, row)]).encode()
+        keys[i] = int.from_bytes(hashlib.blake2b(label, digest_size=8).digest(), "little")
+    return keys
+
+
+def _splitmix64(x):
+    x = x + np.uint64(0x9E3779B97F4A7C15)
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+
+def keyed_uniforms(seed, keys, horizon, antithetic=False):
+    """
+    Uniforms in (0, 1) of shape (horizon, len(keys)) that only depend on seed, key & day.
+
+    A row draws the same numbers whatever other rows the network has, so two
+    scenarios sharing a warehouse-product see the same demand (common random
+    numbers). `antithetic` returns 1 - u for the mirrored replication.
+
+    seed -> 64-bit integer seed of the replication
+    """
+    days = np.arange(horizon, dtype=np.uint64)[:, None]
+    with np.errstate(over="ignore"):
+        x = _splitmix64(_splitmix64(keys ^ np.uint64(seed)) + days)
+    # 53 random bits, offset half a step so neither 0 nor 1 is drawn
+    u = ((x >> np.uint64(11)).astype(float) + 0.5) / 2.0**53
+    return 1.0 - u if antithetic else u
@@ -0,0 +1,213 @@
+import os
+import pickle
+import uuid
+from concurrent.futures import FIRST_COMPLETED, CancelledError, ProcessPoolExecutor, wait
+from dataclasses import dataclass
+from statistics import NormalDist
+
+import numpy as np
+import pandas as pd
+
+from src.replication_runner import KPI_NAMES, _dump_model, _remove_when_done, summarize_replications
+
+# Engines of the compared scenarios, compiled once per worker process by the pool initializer
+_worker_engines = None
+# Engine pairs of comparisons sharing a pool, by comparison key, most recently used last
+_keyed_engines = {}
+_MAX_KEYED_ENGINES = 2
+
+
+@dataclass
+class ComparisonResult:
+    """Paired replications of a baseline & an alternative scenario."""
+
+    # One row per replication, one column per KPI
+    baseline: pd.DataFrame
+    alternative: pd.DataFrame
+    # alternative - baseline, averaged over each antithetic pair when used
+    differences: pd.DataFrame
+    # One row per KPI with both means and the paired difference's confidence interval
+    summary: pd.DataFrame
+
+
+def _init_worker(scenarios):
+    # scenarios -> (model, sourcing, engine class) of the baseline & the alternative
+    global _worker_engines
+    _worker_engines = [
+        engine(model, sourcing, common_random_numbers=True) for model, sourcing, engine in scenarios
+    ]
+
+
+def _run_batch(runs, horizon, engines=None):
+    """Run both scenarios on the same random numbers for every (seed, antithetic) run."""
+    return [
+        [
+            engine.run(horizon=horizon, seed=seed, record=False, antithetic=antithetic).kpis
+            for engine in engines or _worker_engines
+        ]
+        for seed, antithetic in runs
+    ]
+
+
+def _run_keyed_batch(key, scenarios_path, runs, horizon):
+    """Run a batch on a shared pool, loading the comparison's scenarios & building their engines once per worker."""
+    engines = _keyed_engines.pop(key, None)
+    if engines is None:
+        with open(scenarios_path, "rb") as f:
+            engines = [
+                engine(model, sourcing, common_random_numbers=True)
+                for model, sourcing, engine in pickle.load(f)
+            ]
+    _keyed_engines[key] = engines
+    while len(_keyed_engines) > _MAX_KEYED_ENGINES:
+        del _keyed_engines[next(iter(_keyed_engines))]
+    return _run_batch(runs, horizon, engines)
+
+
+def summarize_comparison(baseline, alternative, differences, confidence=0.95):
+    """Scenario means, the paired difference's confidence interval and the interval independent runs would give."""
+    paired = summarize_replications(differences, confidence)
+    z = NormalDist().inv_cdf(0.5 + confidence / 2)
+    # Half width of the same difference from independently sampled scenarios
+    independent = z * np.sqrt(
+        (baseline.var(ddof=1) + alternative.var(ddof=1)) / max(len(baseline), 1)
+    )
+    return pd.DataFrame(
+        {
+            "Baseline": baseline.mean(),
+            "Alternative": alternative.mean(),
+            "Difference": paired["Mean"],
+            "CI Lower": paired["CI Lower"],
+            "CI Upper": paired["CI Upper"],
+            "Half Width": paired["Half Width"],
+            "Independent Half Width": independent,
+        }
+    )
+
+
+def _comparison_result(kpis, antithetic, confidence):
+    """ComparisonResult of the (baseline, alternative) KPI pairs of replications in seed order."""
+    baseline_kpis = pd.DataFrame([pair[0] for pair in kpis], columns=KPI_NAMES)
+    alternative_kpis = pd.DataFrame([pair[1] for pair in kpis], columns=KPI_NAMES)
+    baseline_kpis.index.name = alternative_kpis.index.name = "Replication"
+    differences = alternative_kpis - baseline_kpis
+    if antithetic:
+        differences = differences.groupby(differences.index // 2).mean()
+        differences.index.name = "Pair"
+        # Pair means are the independent observations of each scenario too
+        pair_baseline = baseline_kpis.groupby(baseline_kpis.index // 2).mean()
+        pair_alternative = alternative_kpis.groupby(alternative_kpis.index // 2).mean()
+    else:
+        pair_baseline, pair_alternative = baseline_kpis, alternative_kpis
+    summary = summarize_comparison(pair_baseline, pair_alternative, differences, confidence)
+    summary["Baseline"] = baseline_kpis.mean()
+    summary["Alternative"] = alternative_kpis.mean()
+    return ComparisonResult(
+        baseline=baseline_kpis,
+        alternative=alternative_kpis,
+        differences=differences,
+        summary=summary,
+    )
+
+
+def compare_scenarios(
+    baseline,
+    alternative,
+    n_replications,
+    horizon=365,
+    master_seed=0,
+    antithetic=False,
+    n_workers=None,
+    confidence=0.95,
+    executor=None,
+    progress=None,
+    cancelled=None,
+    partial=None,
+):
+    """
+    Run two scenarios on common random numbers and compare them replication by replication.
+
+    Demand is drawn per warehouse-product and lead times per lane from streams
+    keyed by their names, so both scenarios see the same demand wherever they
+    share a SKU-location and their differences are not swamped by sampling
+    noise. With `antithetic`, replications come in pairs on mirrored random
+    numbers and each pair counts as one observation.
+
+    baseline, alternative -> (NetworkModel, sourcing method, engine class)
+    executor -> Shared process pool to run the batches on, instead of a pool of its own
+    progress -> Called with (replications done, n_replications) as batches finish
+    cancelled -> Polled between batches, once it returns True the outstanding
+                 batches are dropped and CancelledError is raised
+    partial -> Called with the summary of the replications finished in seed order so far
+    """
+    n_workers = n_workers or os.cpu_count() or 1
+    if antithetic:
+        seeds = np.random.SeedSequence(master_seed).spawn(-(-n_replications // 2))
+        runs = [(seed, mirrored) for seed in seeds for mirrored in (False, True)][:n_replications]
+    else:
+        seeds = np.random.SeedSequence(master_seed).spawn(n_replications)
+        runs = [(seed, False) for seed in seeds]
+    # Keep antithetic pairs in one batch
+    batch_size = max(2, -(-n_replications // (n_workers * 4)) // 2 * 2)
+    batches = [runs[i : i + batch_size] for i in range(0, n_replications, batch_size)]
+    batch_kpis = [None] * len(batches)
+    scenarios = (baseline, alternative)
+    done = 0
+    next_batch = 0
+
+    def finish(i, kpis):
+        nonlocal done, next_batch
+        batch_kpis[i] = kpis
+        done += len(kpis)
+        if progress is not None:
+            progress(done, n_replications)
+        # The summary only grows with the batches finished in seed order
+        if partial is None or next_batch == len(batches) or batch_kpis[next_batch] is None:
+            return
+        while next_batch < len(batches) and batch_kpis[next_batch] is not None:
+            next_batch += 1
+        folded = [k for batch in batch_kpis[:next_batch] for k in batch]
+        if len(folded) >= (4 if antithetic else 2):
+            partial(_comparison_result(folded, antithetic, confidence).summary)
+
+    if executor is None and (n_workers == 1 or len(batches) == 1):
+        _init_worker(scenarios)
+        for i, batch in enumerate(batches):
+            if cancelled is not None and cancelled():
+                raise CancelledError()
+            finish(i, _run_batch(batch, horizon))
+    else:
+        own_executor = executor is None
+        if own_executor:
+            executor = ProcessPoolExecutor(
+                max_workers=min(n_workers, len(batches)),
+                initializer=_init_worker,
+                initargs=(scenarios,),
+            )
+            futures = {executor.submit(_run_batch, batch, horizon): i for i, batch in enumerate(batches)}
+        else:
+            # Workers of a shared pool serve other runs too: the key picks this comparison's
+            # engines, and the scenarios are pickled once to a file instead of with every batch
+            key = uuid.uuid4().hex
+            scenarios_path = _dump_model(scenarios)
+            futures = {
+                executor.submit(_run_keyed_batch, key, scenarios_path, batch, horizon): i
+                for i, batch in enumerate(batches)
+            }
+            _remove_when_done(list(futures), scenarios_path)
+        pending = set(futures)
+        try:
+            while pending:
+                finished, pending = wait(pending, timeout=0.5, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    finish(futures[future], future.result())
+                if pending and cancelled is not None and cancelled():
+                    raise CancelledError()
+        finally:
+            for future in pending:
+                future.cancel()
+            if own_executor:
+                executor.shutdown(cancel_futures=True)
+
+    # Batches are joined in seed order, so replication i always lines up with run i
+    return _comparison_result([k for kpis in batch_kpis for k in kpis], antithetic, confidence)
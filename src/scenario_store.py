@@ -0,0 +1,221 @@
+import hashlib
+import json
+import os
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.fs as pafs
+
+from src.table_store import table_hashes
+
+DEFAULT_STORE_PATH = os.path.join(os.path.dirname(__file__), "..", "scenario_store")
+
+# Every dataset is partitioned by scenario & input hash, hive style (scenario=.../input_hash=...)
+PARTITIONING = ds.partitioning(
+    pa.schema([("scenario", pa.string()), ("input_hash", pa.string())]), flavor="hive"
+)
+
+
+def run_input_hash(tables, params):
+    """
+    Hash of everything a run's results depend on.
+
+    tables -> Network tables the run was simulated from
+    params -> JSON-serializable run parameters (horizon, seed, sourcing, engine, ...)
+    """
+    digest = hashlib.blake2b(digest_size=8)
+    digest.update(json.dumps(table_hashes(tables, sorted(tables)), sort_keys=True).encode())
+    digest.update(json.dumps(params, sort_keys=True, default=str).encode())
+    return digest.hexdigest()
+
+
+def _partition_filter(runs):
+    """Filter expression selecting the (scenario, input hash) partitions of `runs`."""
+    expression = None
+    for scenario, input_hash in runs:
+        match = (ds.field("scenario") == scenario) & (ds.field("input_hash") == input_hash)
+        expression = match if expression is None else expression | match
+    return expression
+
+
+class ScenarioStore:
+    """
+    Simulation runs persisted as hive-partitioned Parquet datasets on local disk.
+
+    Each run writes three datasets under the store root, partitioned by scenario
+    and input hash: `kpis` (one row), `daily` (one row per day) and `series` (one
+    row per day & SKU-location). Readers open them through memory-mapped Arrow
+    and only touch the partitions & columns they ask for, so comparing many
+    large runs streams record batches instead of loading every run into memory.
+    """
+
+    def __init__(self, root=DEFAULT_STORE_PATH):
+        self.root = os.path.abspath(root)
+        self.filesystem = pafs.LocalFileSystem(use_mmap=True)
+
+    def _path(self, name):
+        return os.path.join(self.root, name)
+
+    def _write(self, name, table, scenario, input_hash):
+        n = len(table)
+        table = table.append_column("scenario", pa.array([scenario] * n, pa.string()))
+        table = table.append_column("input_hash", pa.array([input_hash] * n, pa.string()))
+        ds.write_dataset(
+            table,
+            self._path(name),
+            format="parquet",
+            partitioning=PARTITIONING,
+            existing_data_behavior="delete_matching",
+            filesystem=self.filesystem,
+        )
+
+    def _dataset(self, name):
+        """Dataset `name`, or None while no run wrote it."""
+        if not os.path.isdir(self._path(name)):
+            return None
+        return ds.dataset(
+            self._path(name), format="parquet", partitioning=PARTITIONING, filesystem=self.filesystem
+        )
+
+    def save_run(self, scenario, input_hash, result, params):
+        """
+        Write one SimulationResult, replacing an earlier run of the same scenario & inputs.
+
+        result -> SimulationResult recorded with its per-SKU-location series
+        params -> Run parameters kept next to the KPIs
+        """
+        horizon, n_sku = result.horizon, len(result.warehouses)
+        kpis = {
+            "saved_at": datetime.now().isoformat(timespec="seconds"),
+            **{key: str(value) for key, value in params.items()},
+            **result.kpis,
+        }
+        self._write("kpis", pa.Table.from_pylist([kpis]), scenario, input_hash)
+
+        daily = pa.table({"day": np.arange(1, horizon + 1, dtype=np.int32), **result.daily})
+        self._write("daily", daily, scenario, input_hash)
+
+        if result.series:
+            # Day-major rows, the same layout as the (horizon, n_sku) series arrays
+            warehouses, warehouse_names = pd.factorize(result.warehouses)
+            products, product_names = pd.factorize(result.products)
+            series = {
+                "day": np.repeat(np.arange(1, horizon + 1, dtype=np.int32), n_sku),
+                "warehouse": pa.DictionaryArray.from_arrays(
+                    np.tile(warehouses.astype(np.int32), horizon), pa.array(warehouse_names.astype(str))
+                ),
+                "product": pa.DictionaryArray.from_arrays(
+                    np.tile(products.astype(np.int32), horizon), pa.array(product_names.astype(str))
+                ),
+            }
+            for name, values in result.series.items():
+                series[name] = values.ravel()
+            self._write("series", pa.table(series), scenario, input_hash)
+
+    def runs(self):
+        """One row per stored run with its parameters & KPIs, newest first."""
+        dataset = self._dataset("kpis")
+        if dataset is None:
+            return pd.DataFrame()
+        df = dataset.to_table().to_pandas()
+        for col in ["scenario", "input_hash"]:
+            df[col] = df[col].astype(str)
+        return df.sort_values("saved_at", ascending=False, ignore_index=True)
+
+    def daily(self, runs, columns):
+        """
+        Per-day totals of `runs` with one row per run & day.
+
+        runs -> (scenario, input hash) pairs
+        """
+        dataset = self._dataset("daily")
+        if dataset is None or not runs:
+            return pd.DataFrame()
+        table = dataset.to_table(
+            columns=["scenario", "input_hash", "day", *columns], filter=_partition_filter(runs)
+        )
+        return table.to_pandas()
+
+    def series_totals(self, runs, columns, batch_size=1 << 20):
+        """
+        Sum series `columns` per run, warehouse & product, streaming record batches.
+
+        Only the requested columns of one run's partition at a time are read
+        from the memory-mapped files, and each batch is reduced into a warehouse
+        by product grid before the next one is read, so memory stays bounded by
+        the network size instead of the number of stored rows.
+        """
+        dataset = self._dataset("series")
+        if dataset is None or not runs:
+            return pd.DataFrame()
+        frames = []
+        for scenario, input_hash in runs:
+            scanner = dataset.scanner(
+                columns=["warehouse", "product", *columns],
+                filter=_partition_filter([(scenario, input_hash)]),
+                batch_size=batch_size,
+                batch_readahead=2,
+                fragment_readahead=1,
+            )
+            grid = _Grid(columns)
+            for batch in scanner.to_batches():
+                grid.add(batch)
+            df = grid.to_frame()
+            df.insert(0, "scenario", scenario)
+            df.insert(1, "input_hash", input_hash)
+            frames.append(df)
+        return pd.concat(frames, ignore_index=True)
+
+
+class _Grid:
+    """Running sums of columns over a warehouse by product grid."""
+
+    def __init__(self, columns):
+        self.columns = columns
+        self.warehouses = {}
+        self.products = {}
+        self.sums = np.zeros((len(columns) + 1, 0, 0))
+
+    @staticmethod
+    def _ids(names, values):
+        """Grid ids of a batch's dictionary values, new names are appended."""
+        return np.array([names.setdefault(value, len(names)) for value in values], dtype=np.int64)
+
+    def add(self, batch):
+        if batch.num_rows == 0:
+            return
+        keys = []
+        for name, names in [("warehouse", self.warehouses), ("product", self.products)]:
+            array = batch.column(name)
+            if not pa.types.is_dictionary(array.type):
+                array = array.dictionary_encode()
+            keys.append((array.indices.to_numpy(), self._ids(names, array.dictionary.to_pylist())))
+        (w_index, w_ids), (p_index, p_ids) = keys
+        shape = self.sums.shape
+        if len(self.warehouses) > shape[1] or len(self.products) > shape[2]:
+            sums = np.zeros((shape[0], len(self.warehouses), len(self.products)))
+            sums[:, : shape[1], : shape[2]] = self.sums
+            self.sums = sums
+        # Reduce the batch on its own (small) dictionaries first, then place it on the grid
+        local = w_index.astype(np.int64) * len(p_ids) + p_index
+        size = len(w_ids) * len(p_ids)
+        weights = [None] + [batch.column(col).to_numpy(zero_copy_only=False) for col in self.columns]
+        for i, values in enumerate(weights):
+            sums = np.bincount(local, weights=values, minlength=size).reshape(len(w_ids), len(p_ids))
+            self.sums[i][np.ix_(w_ids, p_ids)] += sums
+
+    def to_frame(self):
+        """One row per warehouse & product seen in any batch."""
+        w, p = np.nonzero(self.sums[0])
+        df = pd.DataFrame(
+            {
+                "warehouse": np.array(list(self.warehouses), dtype=object)[w],
+                "product": np.array(list(self.products), dtype=object)[p],
+            }
+        )
+        for i, col in enumerate(self.columns, start=1):
+            df[col] = self.sums[i][w, p]
+        return df
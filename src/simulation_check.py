@@ -1,10 +1,71 @@
 import ast
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from src.lane_graph import LaneGraph
+
+# Columns of every network level and the type each one is validated as
+LEVEL_COLUMNS = {
+    "Factory Level": {
+        "Factory": str,
+        "Holding Cost Per Unit Per Day": float,
+    },
+    "Factory Product Level": {
+        "Factory": str,
+        "Product": str,
+        "Production Capacity": float,
+        "Starting Inventory": float,
+        "Production Cost Per Unit": float,
+    },
+    "Warehouse Level": {
+        "Warehouse": str,
+        "Holding Cost Per Unit Per Day": float,
+    },
+    "Warehouse Factory Level": {
+        "Warehouse": str,
+        "Factory": str,
+        "Transporatation Cost Per Unit Per Km": float,
+        "Distance Between Warehouse & Factory": float,
+        "Lead Time Distribution": str,
+        "Lead Time Parameters": str,
+    },
+    "Warehouse Product Level": {
+        "Warehouse": str,
+        "Product": str,
+        "Daily Demand Distribution": str,
+        "Demand Distribution Parameters": str,
+        "Inventory Policy": str,
+        "Inventory Policy Parameters": str,
+        "Safety Stock": float,
+        "Starting Inventory": float,
+        "Opportunity Cost Per Unit": float,
+    },
+}
+
+REPORT_COLUMNS = ["Level", "Row", "Column", "Check", "Message"]
 
 
 class SimulationExecutionCheck:
 
-    def __init__(self):
-        pass
+    def __init__(self, model=None, vectorized=False):
+        # model -> Optional NetworkModel of the same tables, parameter checks read its parse results
+        # vectorized -> Use merges / isin / set lookups instead of row loops, messages are identical
+        self.model = model
+        self.vectorized = vectorized
+
+    def _not_available(self, values, available_values):
+        """Unique values (in order of appearance) missing from available_values."""
+        if self.vectorized:
+            unique_values = pd.Series(pd.unique(values))
+            return unique_values[~unique_values.isin(available_values)].to_list()
+        available_list = available_values.unique()
+        not_available = []
+        for i in values.unique():
+            if i not in available_list:
+                not_available.append(i)
+        return not_available
 
     def factory_level_check(self, df):
         # Check if values are null
@@ -72,24 +133,13 @@ class SimulationExecutionCheck:
             return f"Factory-Product values '{', '.join(['-'.join(i) for i in duplicate_values])}' are duplicated"
 
         # Check if factory are present
-        factory_list = factory_level_df["Factory"].unique()
-        not_available = []
-        for i in df["Factory"].unique():
-            if i not in factory_list:
-                not_available.append(i)
+        not_available = self._not_available(df["Factory"], factory_level_df["Factory"])
         if len(not_available) > 0:
             if len(not_available) == 1:
                 return f"Data for factory '{', '.join(not_available)}' is not available in Factory Level data"
             else:
                 return f"Data for factories '{', '.join(not_available)}' are not available in Factory Level data"
 
-        # Check for duplicate products
-        duplicate_products = list(
-            df.loc[df["Product"].duplicated(), "Product"].unique()
-        )
-        if len(duplicate_products) > 0:
-            return f"Duplicates product(s) '{', '.join(duplicate_products)}' in Factory Product Level data"
-
         # Check if values are appropriate
         for col in ["Factory", "Product"]:
             try:
@@ -129,11 +179,7 @@ class SimulationExecutionCheck:
             return f"Warehouse-Factory values '{', '.join(['-'.join(i) for i in duplicate_values])}' are duplicated"
 
         # Check if warehouse is present
-        warehouse_list = warehouse_level_df["Warehouse"].unique()
-        not_available = []
-        for i in df["Warehouse"].unique():
-            if i not in warehouse_list:
-                not_available.append(i)
+        not_available = self._not_available(df["Warehouse"], warehouse_level_df["Warehouse"])
         if len(not_available) > 0:
             if len(not_available) == 1:
                 return f"Data for warehouse '{', '.join(not_available)}' is not available in Warehouse Level data"
@@ -141,11 +187,7 @@ class SimulationExecutionCheck:
                 return f"Data for warehouses '{', '.join(not_available)}' are not available in Warehouse Level data"
 
         # Check if factory is present
-        factory_list = factory_level_df["Factory"].unique()
-        not_available = []
-        for i in df["Factory"].unique():
-            if i not in factory_list:
-                not_available.append(i)
+        not_available = self._not_available(df["Factory"], factory_level_df["Factory"])
         if len(not_available) > 0:
             if len(not_available) == 1:
                 return f"Data for factory '{', '.join(not_available)}' is not available in Factory Level data"
@@ -167,11 +209,16 @@ class SimulationExecutionCheck:
             except Exception as e:
                 return f"Warehouse Factory Level: '{col}' column - {e}"
         # Check if value is appropriate
-        for _, row in df.iterrows():
+        if self.model is not None:
+            for message in self.model.lead_time.messages:
+                if message is not None:
+                    return f"Warehouse Factory Level: {message}"
+            return "Passed"
+        for value, distribution in zip(
+            df["Lead Time Parameters"], df["Lead Time Distribution"]
+        ):
             message = self.check_parameters_for_distribution(
-                row["Lead Time Parameters"],
-                row["Lead Time Distribution"],
-                "Lead Time Parameters",
+                value, distribution, "Lead Time Parameters"
             )
             if message is not None:
                 return f"Warehouse Factory Level: {message}"
@@ -202,11 +249,7 @@ class SimulationExecutionCheck:
             return f"Warehouse-Product values '{', '.join(['-'.join(i) for i in duplicate_values])}' are duplicated"
 
         # Check if warehouse is present in the warehouse data
-        warehouse_list = warehouse_level_df["Warehouse"].unique()
-        not_available = []
-        for i in df["Warehouse"].unique():
-            if i not in warehouse_list:
-                not_available.append(i)
+        not_available = self._not_available(df["Warehouse"], warehouse_level_df["Warehouse"])
         if len(not_available) > 0:
             if len(not_available) == 1:
                 return f"Data for warehouse '{', '.join(not_available)}' is not available in Warehouse Level data"
@@ -214,41 +257,21 @@ class SimulationExecutionCheck:
                 return f"Data for warehouses '{', '.join(not_available)}' are not available in Warehouse Level data"
 
         # Check if product is present in factory product
-        product_list = factory_product_level_df["Product"].unique()
-        not_available = []
-        for i in df["Product"].unique():
-            if i not in product_list:
-                not_available.append(i)
+        not_available = self._not_available(df["Product"], factory_product_level_df["Product"])
         if len(not_available) > 0:
             if len(not_available) == 1:
                 return f"Data for product '{', '.join(not_available)}' is not available in Factory Product Level data"
             else:
                 return f"Data for products '{', '.join(not_available)}' are not available in Factory Product Level data"
 
-        # Iterate through each row
         # Check for each warehouse product, what all factories produce that product and whether distance between that factory and warehouse is available
         # Atleast one factory-warehouse combination must be available for a product
-        available_warehouse_factory_combination = warehouse_factory_level_df[
-            ["Warehouse", "Factory"]
-        ].values.tolist()
-        for _, row in df.iterrows():
-            factory_list = factory_product_level_df.loc[
-                factory_product_level_df["Product"] == row["Product"], "Factory"
-            ].to_list()
-            warehouse_factory_combination = [
-                [row["Warehouse"], i] for i in factory_list
-            ]
-            available_atleast_one = []
-            for i in warehouse_factory_combination:
-                if i in available_warehouse_factory_combination:
-                    available_atleast_one.append(i)
-            if len(available_atleast_one) == 0:
-                if len(factory_list) == 0:
-                    return f"For Warehouse '{row['Warehouse']}' & Product '{row['Product']}', data is not available in Warehouse Factory Level. No factories available for Product '{row['Product']}'"
-                elif len(factory_list) == 1:
-                    return f"For Warehouse '{row['Warehouse']}' & Product '{row['Product']}', data is not available in Warehouse Factory Level. Available factory for Product '{row['Product']}' is {factory_list[0]}"
-                else:
-                    return f"For Warehouse '{row['Warehouse']}' & Product '{row['Product']}', data is not available in Warehouse Factory Level. Available factories for Product '{row['Product']}' are {', '.join(factory_list)}"
+        uncovered = self._uncovered_warehouse_product(
+            df, factory_product_level_df, warehouse_factory_level_df
+        )
+        if uncovered is not None:
+            row, factory_list = uncovered
+            return missing_lane_message(row["Warehouse"], row["Product"], factory_list)
 
         # Check if values are appropriate
         for col in [
@@ -266,152 +289,496 @@ class SimulationExecutionCheck:
                 df[col] = df[col].astype(float)
             except Exception as e:
                 return f"Warehouse Product Level: '{col}' column - {e}"
-        for _, row in df.iterrows():
-            message = self.check_parameters_for_distribution(
-                row["Demand Distribution Parameters"],
-                row["Daily Demand Distribution"],
-                "Demand Distribution Parameters",
-            )
+        if self.model is not None:
+            demand_messages = self.model.demand.messages
+            policy_messages = self.model.policy_messages
+        else:
+            demand_messages = [
+                self.check_parameters_for_distribution(
+                    value, distribution, "Demand Distribution Parameters"
+                )
+                for value, distribution in zip(
+                    df["Demand Distribution Parameters"], df["Daily Demand Distribution"]
+                )
+            ]
+            policy_messages = [
+                self.check_parameters_for_min_max_inventory_policy(
+                    value, "Inventory Policy Parameters"
+                )
+                if policy == "Min/Max"
+                else None
+                for value, policy in zip(
+                    df["Inventory Policy Parameters"], df["Inventory Policy"]
+                )
+            ]
+        for message in demand_messages:
             if message is not None:
                 return f"Warehouse Product Level: {message}"
-        for _, row in df.iterrows():
-            if row["Inventory Policy"] == "Min/Max":
-                message = self.check_parameters_for_min_max_inventory_policy(
-                    row["Inventory Policy Parameters"],
-                    "Inventory Policy Parameters",
-                )
+        for policy, message in zip(df["Inventory Policy"], policy_messages):
+            if policy == "Min/Max":
                 if message is not None:
                     return f"Warehouse Product Level: {message}"
             else:
-                return f"Warehouse Product Level:  Invalid inventory policy '{row['Inventory Policy']}, Available inventory policy - Min/Max"
+                return f"Warehouse Product Level:  Invalid inventory policy '{policy}, Available inventory policy - Min/Max"
         return "Passed"
 
-    def check_parameters_for_distribution(
-        self, value_string_dict, distribution, column_name
+    def _uncovered_warehouse_product(
+        self, df, factory_product_level_df, warehouse_factory_level_df
     ):
+        """First warehouse-product row with no lane to any factory making the product."""
+        if self.vectorized:
+            covered = self._lane_coverage(
+                df, factory_product_level_df, warehouse_factory_level_df
+            )
+            if covered.all():
+                return None
+            row = df.iloc[covered.argmin()]
+        else:
+            # Iterate through each row
+            available_warehouse_factory_combination = warehouse_factory_level_df[
+                ["Warehouse", "Factory"]
+            ].values.tolist()
+            for _, row in df.iterrows():
+                factory_list = factory_product_level_df.loc[
+                    factory_product_level_df["Product"] == row["Product"], "Factory"
+                ].to_list()
+                warehouse_factory_combination = [
+                    [row["Warehouse"], i] for i in factory_list
+                ]
+                available_atleast_one = []
+                for i in warehouse_factory_combination:
+                    if i in available_warehouse_factory_combination:
+                        available_atleast_one.append(i)
+                if len(available_atleast_one) == 0:
+                    break
+            else:
+                return None
+        factory_list = factory_product_level_df.loc[
+            factory_product_level_df["Product"] == row["Product"], "Factory"
+        ].to_list()
+        return row, factory_list
+
+    @staticmethod
+    def _lane_coverage(df, factory_product_level_df, warehouse_factory_level_df):
+        """Boolean array, True where a warehouse-product row has a lane to a producing factory."""
+        graph = LaneGraph.from_tables(factory_product_level_df, warehouse_factory_level_df, df)
+        return graph.covered
+
+    # ---------- Validation report ----------
+    def validation_report(self, tables, scope=None):
+        """
+        Collect every issue across the five levels in one pass.
+
+        Returns a DataFrame with one row per issue (Level, Row, Column, Check,
+        Message), where Row is the index label of the offending row. Checks are
+        only skipped when a missing column makes them meaningless.
+
+        scope -> Optional {level: row labels} to recheck only those rows, levels
+        not in scope are skipped and a level mapped to None is checked whole.
+        Key checks still compare against whole tables.
+        """
+        issues = []
+        present = {}
+        in_scope = {}
+        for level, columns in LEVEL_COLUMNS.items():
+            df = tables.get(level, pd.DataFrame())
+            present[level] = [col for col in columns if col in df.columns]
+            if scope is None or (level in scope and scope[level] is None):
+                in_scope[level] = np.ones(len(df), dtype=bool)
+                for col in columns:
+                    if col not in df.columns:
+                        issues.append(
+                            _issue_frame(level, [None], col, "Missing Column", f"Column '{col}' is missing")
+                        )
+            else:
+                in_scope[level] = df.index.isin(scope.get(level, []))
+            rows = df.loc[in_scope[level], present[level]]
+            # Nulls
+            null_rows, null_cols = np.nonzero(rows.isnull().to_numpy())
+            issues.append(
+                _issue_frame(
+                    level,
+                    rows.index[null_rows],
+                    np.array(present[level], dtype=object)[null_cols],
+                    "Null",
+                    [f"Null value in column '{present[level][c]}'" for c in null_cols],
+                )
+            )
+            # Numbers
+            for col, dtype in columns.items():
+                if dtype is float and col in rows.columns:
+                    values = rows[col]
+                    invalid = values.notnull() & pd.to_numeric(values, errors="coerce").isnull()
+                    issues.append(
+                        _issue_frame(
+                            level,
+                            rows.index[invalid.to_numpy()],
+                            col,
+                            "Invalid Value",
+                            [f"Value '{v}' must be a number" for v in values[invalid]],
+                        )
+                    )
+
+        def has(level, *cols):
+            return all(col in present[level] for col in cols)
+
+        def scoped(level):
+            return tables[level].loc[in_scope[level]]
+
+        factory_product_level = tables.get("Factory Product Level", pd.DataFrame())
+        warehouse_factory_level = tables.get("Warehouse Factory Level", pd.DataFrame())
+
+        # Duplicate keys
+        for level, keys in [
+            ("Factory Level", ["Factory"]),
+            ("Warehouse Level", ["Warehouse"]),
+            ("Factory Product Level", ["Factory", "Product"]),
+            ("Warehouse Factory Level", ["Warehouse", "Factory"]),
+            ("Warehouse Product Level", ["Warehouse", "Product"]),
+        ]:
+            if has(level, *keys):
+                issues.append(_duplicate_issues(level, tables[level], keys, in_scope[level]))
+        # Orphan keys
+        for level, col, parent, noun in [
+            ("Factory Product Level", "Factory", "Factory Level", "factory"),
+            ("Warehouse Factory Level", "Warehouse", "Warehouse Level", "warehouse"),
+            ("Warehouse Factory Level", "Factory", "Factory Level", "factory"),
+            ("Warehouse Product Level", "Warehouse", "Warehouse Level", "warehouse"),
+            ("Warehouse Product Level", "Product", "Factory Product Level", "product"),
+        ]:
+            if has(level, col) and has(parent, col):
+                issues.append(_orphan_issues(level, scoped(level), col, tables[parent][col], parent, noun))
+
+        # Lanes for every warehouse-product, only for rows whose keys resolve
+        if (
+            has("Warehouse Product Level", "Warehouse", "Product")
+            and has("Factory Product Level", "Factory", "Product")
+            and has("Warehouse Factory Level", "Warehouse", "Factory")
+        ):
+            df = scoped("Warehouse Product Level")
+            checkable = (
+                df["Warehouse"].notnull()
+                & df["Product"].notnull()
+                & df["Product"].isin(factory_product_level["Product"])
+            ).to_numpy()
+            covered = self._lane_coverage(df, factory_product_level, warehouse_factory_level)
+            uncovered = df[checkable & ~covered]
+            factories = factory_product_level.groupby("Product", sort=False, observed=True)["Factory"].agg(list)
+            issues.append(
+                _issue_frame(
+                    "Warehouse Product Level",
+                    uncovered.index,
+                    "Warehouse",
+                    "Missing Lane",
+                    [
+                        missing_lane_message(w, p, factories.get(p, []))
+                        for w, p in zip(uncovered["Warehouse"], uncovered["Product"])
+                    ],
+                )
+            )
 
-        # value_string_dict -> Dictionary with key as parameters and value as parameter values of distribution
-        # distribution -> Normal, Exponential, Categorical
-        # column_name -> Column which value belongs to
-        # Assuming all parameters available
-        message = None
-        try:
-            # Extract dictionary
-            value = ast.literal_eval(value_string_dict)
-            # Normal distribution
-            if distribution == "Normal":
-                # Check mean
-                if "mean" not in value:
-                    message = f"For column '{column_name}', value '{value_string_dict}' is invalid. 'mean' key is not present"
-                    return message
-
-                else:
-                    # Check if value is float
-                    try:
-                        mean_float = float(value["mean"])
-                    except:
-                        message = f"For column '{column_name}', value '{value_string_dict}' is invalid. 'mean' value is invalid, it must be float"
-                        return message
-                # Check std dev
-                if "std_dev" not in value:
-                    message = f"For column '{column_name}', value '{value_string_dict}' is invalid. 'std_dev' key is not present"
-                    return message
-                else:
-                    # Check if value is float
-                    try:
-                        std_dev_float = float(value["std_dev"])
-                    except:
-                        message = f"For column '{column_name}', value '{value_string_dict}' is invalid. 'std_dev' value is invalid, it must be float"
-                        return message
-            # Exponential
-            elif distribution == "Exponential":
-                if "lambda" not in value:
-                    message = f"For column '{column_name}', value '{value_string_dict}' is invalid. 'lambda' key is not present"
-                    return message
-                else:
-                    # Check if value is float
-                    try:
-                        lambda_float = float(value["lambda"])
-                    except:
-                        message = f"For column '{column_name}', value '{value_string_dict}' is invalid. 'lambda' value is invalid, it must be float"
-                        return message
-                    # All parameters available
-                    return message
-            # Categorical
-            elif distribution == "Categorical":
-                for k in value:
-                    try:
-                        key_int = int(k)
-                    except:
-                        message = f"For column '{column_name}', value '{value_string_dict}' is invalid. 'lead_time' key is invalid, it must be integer"
-                        return message
-                    try:
-                        value_int = float(value[k])
-                    except:
-                        message = f"For column '{column_name}', value '{value_string_dict}' is invalid. 'lead_time' value is invalid, it must be float"
-                        return message
-                # Check if sum of probability score is 1
-                if round(sum(value.values()), 2) != 1:
-                    message = f"For column '{column_name}', value '{value_string_dict}' is invalid. The sum of probability '{round(sum(value.values()), 2)}' is not equal to 1"
-                    return message
-        except:
-            # Message for Normal distribution
-            if distribution == "Normal":
-                message = (
-                    f"For column '{column_name}', value '{value_string_dict}' is invalid. "
-                    + "For normal distribution provide in following json format: {'mean': mean_value, 'std_dev': std_dev_value}. The mean_value & std_dev_value must be float"
+        # Distribution & policy parameters
+        if has("Warehouse Factory Level", "Lead Time Distribution", "Lead Time Parameters"):
+            issues.append(
+                self._parameter_issues(
+                    "Warehouse Factory Level",
+                    scoped("Warehouse Factory Level"),
+                    "Lead Time Distribution",
+                    "Lead Time Parameters",
+                    self._model_messages("lead_time", in_scope["Warehouse Factory Level"]),
                 )
-            elif distribution == "Exponential":
-                message = (
-                    f"For column '{column_name}', value '{value_string_dict}' is invalid. "
-                    + "For exponential distribution provide in following json format: {'lambda': lambda_value}. The lambda_value must be float"
+            )
+        if has("Warehouse Product Level", "Daily Demand Distribution", "Demand Distribution Parameters"):
+            issues.append(
+                self._parameter_issues(
+                    "Warehouse Product Level",
+                    scoped("Warehouse Product Level"),
+                    "Daily Demand Distribution",
+                    "Demand Distribution Parameters",
+                    self._model_messages("demand", in_scope["Warehouse Product Level"]),
                 )
-            elif distribution == "Categorical":
-                message = (
-                    f"For column '{column_name}', value '{value_string_dict}' is invalid. "
-                    + "For categorical distribution provide in following json format: {lead_time_1 : probability_score, lead_time_2 : probability_score, ...}. Lead time must be integer & probability score must be float. The sum of probability must be 1"
+            )
+        if has("Warehouse Product Level", "Inventory Policy", "Inventory Policy Parameters"):
+            df = scoped("Warehouse Product Level")
+            policy = df["Inventory Policy"]
+            invalid = (policy.notnull() & (policy.astype(str) != "Min/Max")).to_numpy()
+            issues.append(
+                _issue_frame(
+                    "Warehouse Product Level",
+                    df.index[invalid],
+                    "Inventory Policy",
+                    "Invalid Value",
+                    [
+                        f"Invalid inventory policy '{v}', Available inventory policy - Min/Max"
+                        for v in policy[invalid]
+                    ],
                 )
-        return message
+            )
+            checkable = (
+                (policy.astype(str) == "Min/Max") & df["Inventory Policy Parameters"].notnull()
+            ).to_numpy()
+            messages = self._model_messages("policy", in_scope["Warehouse Product Level"])
+            if messages is not None:
+                messages = messages[checkable]
+            else:
+                messages = np.array(
+                    [
+                        self.check_parameters_for_min_max_inventory_policy(
+                            v, "Inventory Policy Parameters"
+                        )
+                        for v in df.loc[checkable, "Inventory Policy Parameters"]
+                    ],
+                    dtype=object,
+                )
+            failed = np.array([m is not None for m in messages], dtype=bool)
+            issues.append(
+                _issue_frame(
+                    "Warehouse Product Level",
+                    df.index[checkable][failed],
+                    "Inventory Policy Parameters",
+                    "Invalid Parameters",
+                    messages[failed],
+                )
+            )
+
+        report = pd.concat(issues, ignore_index=True)
+        return sort_report(report)
+
+    def _model_messages(self, column, mask):
+        """Parse messages already held by the NetworkModel for the masked rows."""
+        if self.model is None:
+            return None
+        if column == "policy":
+            return self.model.policy_messages[mask]
+        return getattr(self.model, column).messages[mask]
+
+    def _parameter_issues(self, level, df, distribution_col, parameter_col, messages=None):
+        """Invalid distribution parameters for every non-null row."""
+        checkable = (df[distribution_col].notnull() & df[parameter_col].notnull()).to_numpy()
+        if messages is not None:
+            messages = messages[checkable]
+        else:
+            rows = df.loc[checkable]
+            messages = np.array(
+                [
+                    self.check_parameters_for_distribution(v, str(d), parameter_col)
+                    for v, d in zip(rows[parameter_col], rows[distribution_col])
+                ],
+                dtype=object,
+            )
+        failed = np.array([m is not None for m in messages], dtype=bool)
+        return _issue_frame(
+            level,
+            df.index[checkable][failed],
+            parameter_col,
+            "Invalid Parameters",
+            messages[failed],
+        )
+
+    def check_parameters_for_distribution(
+        self, value_string_dict, distribution, column_name
+    ):
+        return parse_distribution_parameters(value_string_dict, distribution, column_name)[1]
 
     def check_parameters_for_min_max_inventory_policy(
         self, value_string_dict, column_name
     ):
-        # value_string_dict -> Dictionary with key as parameters (min/max) and value as parameter values
-        message = None
-        try:
-            # Extract dictionary
-            value = ast.literal_eval(value_string_dict)
-            # Check min value
-            if "min" not in value:
-                message = f"For column '{column_name}', value '{value_string_dict}' is invalid. 'min' key is not present"
-                return message
+        return parse_min_max_inventory_policy(value_string_dict, column_name)[1]
+
+
+def missing_lane_message(warehouse, product, factory_list):
+    if len(factory_list) == 0:
+        return f"For Warehouse '{warehouse}' & Product '{product}', data is not available in Warehouse Factory Level. No factories available for Product '{product}'"
+    elif len(factory_list) == 1:
+        return f"For Warehouse '{warehouse}' & Product '{product}', data is not available in Warehouse Factory Level. Available factory for Product '{product}' is {factory_list[0]}"
+    else:
+        return f"For Warehouse '{warehouse}' & Product '{product}', data is not available in Warehouse Factory Level. Available factories for Product '{product}' are {', '.join(factory_list)}"
+
+
+def _issue_frame(level, rows, column, check, messages):
+    """Issue records in the validation report layout."""
+    rows = list(rows)
+    return pd.DataFrame(
+        {
+            "Level": level,
+            "Row": pd.Series(rows, dtype=object),
+            "Column": column if isinstance(column, str) else list(column),
+            "Check": check,
+            "Message": messages if isinstance(messages, str) else list(messages),
+        },
+        index=range(len(rows)),
+        columns=REPORT_COLUMNS,
+    )
+
+
+def sort_report(report):
+    """Order issues by level, then by row."""
+    report["Level"] = pd.Categorical(report["Level"], categories=list(LEVEL_COLUMNS))
+    report = report.sort_values(["Level", "Row"], kind="stable", na_position="first")
+    report["Level"] = report["Level"].astype(str)
+    return report.reset_index(drop=True)
+
+
+def _duplicate_issues(level, df, keys, mask):
+    # Duplicates are judged on the whole column, mask only picks which rows to report
+    notnull = df[keys].notnull().all(axis=1).to_numpy()
+    keyed = df.loc[notnull, keys]
+    duplicated = keyed.duplicated(keep="first").to_numpy() & mask[notnull]
+    label = "-".join(keys)
+    values = keyed.loc[duplicated].astype(str)
+    return _issue_frame(
+        level,
+        values.index,
+        keys[-1],
+        "Duplicate",
+        [f"{label} value '{'-'.join(v)}' is duplicated" for v in values.to_numpy()],
+    )
+
+
+def _orphan_issues(level, df, col, parent_values, parent_level, noun):
+    values = df[col]
+    orphan = (values.notnull() & ~values.isin(parent_values)).to_numpy()
+    return _issue_frame(
+        level,
+        df.index[orphan],
+        col,
+        "Missing Reference",
+        [f"Data for {noun} '{v}' is not available in {parent_level} data" for v in values[orphan]],
+    )
+
+
+@lru_cache(maxsize=65536)
+def parse_distribution_parameters(value_string_dict, distribution, column_name):
+    """Parse & validate distribution parameters, returning (parameters, message)."""
+
+    # value_string_dict -> Dictionary with key as parameters and value as parameter values of distribution
+    # distribution -> Normal, Exponential, Categorical
+    # column_name -> Column which value belongs to
+    # Assuming all parameters available
+    message = None
+    value = None
+    try:
+        # Extract dictionary
+        value = ast.literal_eval(value_string_dict)
+        # Normal distribution
+        if distribution == "Normal":
+            # Check mean
+            if "mean" not in value:
+                message = f"For column '{column_name}', value '{value_string_dict}' is invalid. 'mean' key is not present"
+                return None, message
 
             else:
-                # Check if value is int
+                # Check if value is float
                 try:
-                    min_int = int(value["min"])
+                    mean_float = float(value["mean"])
                 except:
-                    message = f"For column '{column_name}', value '{value_string_dict}' is invalid. 'min' value is invalid, it must be integer"
-                    return message
-            # Check max value
-            if "max" not in value:
-                message = f"For column '{column_name}', value '{value_string_dict}' is invalid. 'max' key is not present"
-                return message
-
+                    message = f"For column '{column_name}', value '{value_string_dict}' is invalid. 'mean' value is invalid, it must be float"
+                    return None, message
+            # Check std dev
+            if "std_dev" not in value:
+                message = f"For column '{column_name}', value '{value_string_dict}' is invalid. 'std_dev' key is not present"
+                return None, message
             else:
-                # Check if value is int
+                # Check if value is float
+                try:
+                    std_dev_float = float(value["std_dev"])
+                except:
+                    message = f"For column '{column_name}', value '{value_string_dict}' is invalid. 'std_dev' value is invalid, it must be float"
+                    return None, message
+            value = {"mean": mean_float, "std_dev": std_dev_float}
+        # Exponential
+        elif distribution == "Exponential":
+            if "lambda" not in value:
+                message = f"For column '{column_name}', value '{value_string_dict}' is invalid. 'lambda' key is not present"
+                return None, message
+            else:
+                # Check if value is float
+                try:
+                    lambda_float = float(value["lambda"])
+                except:
+                    message = f"For column '{column_name}', value '{value_string_dict}' is invalid. 'lambda' value is invalid, it must be float"
+                    return None, message
+                # All parameters available
+                return {"lambda": lambda_float}, message
+        # Categorical
+        elif distribution == "Categorical":
+            for k in value:
+                try:
+                    key_int = int(k)
+                except:
+                    message = f"For column '{column_name}', value '{value_string_dict}' is invalid. 'lead_time' key is invalid, it must be integer"
+                    return None, message
                 try:
-                    max_int = int(value["max"])
+                    value_int = float(value[k])
                 except:
-                    message = f"For column '{column_name}', value '{value_string_dict}' is invalid. 'max' value is invalid, it must be integer"
-                    return message
-            # Check if max is less than min
-            if max_int < min_int:
-                message = f"For column '{column_name}', max value '{max_int}' is less than min value '{min_int}'. 'max' value must be greater than or equal to 'min' value"
-                return message
-        except:
+                    message = f"For column '{column_name}', value '{value_string_dict}' is invalid. 'lead_time' value is invalid, it must be float"
+                    return None, message
+            # Check if sum of probability score is 1
+            if round(sum(value.values()), 2) != 1:
+                message = f"For column '{column_name}', value '{value_string_dict}' is invalid. The sum of probability '{round(sum(value.values()), 2)}' is not equal to 1"
+                return None, message
+            value = {int(k): float(p) for k, p in value.items()}
+    except:
+        # Message for Normal distribution
+        if distribution == "Normal":
             message = (
                 f"For column '{column_name}', value '{value_string_dict}' is invalid. "
-                + "For min/max inventory policy provide in following json format: {'min': min_value, 'max': max_value}. The min_value & max_value must be integer"
+                + "For normal distribution provide in following json format: {'mean': mean_value, 'std_dev': std_dev_value}. The mean_value & std_dev_value must be float"
             )
-        return message
+        elif distribution == "Exponential":
+            message = (
+                f"For column '{column_name}', value '{value_string_dict}' is invalid. "
+                + "For exponential distribution provide in following json format: {'lambda': lambda_value}. The lambda_value must be float"
+            )
+        elif distribution == "Categorical":
+            message = (
+                f"For column '{column_name}', value '{value_string_dict}' is invalid. "
+                + "For categorical distribution provide in following json format: {lead_time_1 : probability_score, lead_time_2 : probability_score, ...}. Lead time must be integer & probability score must be float. The sum of probability must be 1"
+            )
+    return (value if message is None else None), message
+
+
+@lru_cache(maxsize=65536)
+def parse_min_max_inventory_policy(value_string_dict, column_name):
+    """Parse & validate min/max policy parameters, returning (parameters, message)."""
+    # value_string_dict -> Dictionary with key as parameters (min/max) and value as parameter values
+    message = None
+    value = None
+    try:
+        # Extract dictionary
+        value = ast.literal_eval(value_string_dict)
+        # Check min value
+        if "min" not in value:
+            message = f"For column '{column_name}', value '{value_string_dict}' is invalid. 'min' key is not present"
+            return None, message
+
+        else:
+            # Check if value is int
+            try:
+                min_int = int(value["min"])
+            except:
+                message = f"For column '{column_name}', value '{value_string_dict}' is invalid. 'min' value is invalid, it must be integer"
+                return None, message
+        # Check max value
+        if "max" not in value:
+            message = f"For column '{column_name}', value '{value_string_dict}' is invalid. 'max' key is not present"
+            return None, message
+
+        else:
+            # Check if value is int
+            try:
+                max_int = int(value["max"])
+            except:
+                message = f"For column '{column_name}', value '{value_string_dict}' is invalid. 'max' value is invalid, it must be integer"
+                return None, message
+        # Check if max is less than min
+        if max_int < min_int:
+            message = f"For column '{column_name}', max value '{max_int}' is less than min value '{min_int}'. 'max' value must be greater than or equal to 'min' value"
+            return None, message
+        value = {"min": min_int, "max": max_int}
+    except:
+        message = (
+            f"For column '{column_name}', value '{value_string_dict}' is invalid. "
+            + "For min/max inventory policy provide in following json format: {'min': min_value, 'max': max_value}. The min_value & max_value must be integer"
+        )
+    return (value if message is None else None), message
@@ -0,0 +1,251 @@
+from dataclasses import dataclass, field
+
+import numpy as np
+import pandas as pd
+
+from src.inventory_kernel import min_max_kernel
+from src.samplers import DistributionSampler, keyed_uniforms, stream_keys
+from src.sourcing import allocate_orders
+
+# Per-day network totals of every run
+DAILY_TOTALS = [
+    "demand",
+    "fulfilled",
+    "lost",
+    "shipped",
+    "on_hand",
+    "holding_cost",
+    "transportation_cost",
+    "production_cost",
+    "opportunity_cost",
+]
+# Per-day, per SKU-location series of recorded runs
+SKU_SERIES = ["on_hand", "demand", "fulfilled", "lost", "shipped"]
+
+
+@dataclass
+class SimulationResult:
+    """Outputs of one simulation run, indexed by day and SKU-location."""
+
+    warehouses: np.ndarray
+    products: np.ndarray
+    horizon: int
+    # Totals over the whole horizon
+    kpis: dict
+    # Per-day network totals (horizon,)
+    daily: dict
+    # Per-day, per SKU-location series (horizon, n_sku) - only when recorded
+    series: dict = field(default_factory=dict)
+
+    def daily_totals(self):
+        """Per-day network totals as a DataFrame."""
+        df = pd.DataFrame(self.daily)
+        df.insert(0, "Day", np.arange(1, self.horizon + 1))
+        return df
+
+    def sku_summary(self):
+        """Per warehouse-product totals over the horizon."""
+        if not self.series:
+            return pd.DataFrame()
+        demand = self.series["demand"].sum(axis=0)
+        fulfilled = self.series["fulfilled"].sum(axis=0)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            fill_rate = np.where(demand > 0, fulfilled / demand, 1.0)
+        return pd.DataFrame(
+            {
+                "Warehouse": self.warehouses,
+                "Product": self.products,
+                "Demand": demand,
+                "Fulfilled": fulfilled,
+                "Lost Sales": self.series["lost"].sum(axis=0),
+                "Fill Rate": fill_rate,
+                "Average On Hand": self.series["on_hand"].mean(axis=0),
+                "Units Ordered": self.series["shipped"].sum(axis=0),
+            }
+        )
+
+
+class SimulationEngine:
+    """
+    Daily-step inventory simulation over the five validated network tables.
+
+    All state is kept in dense arrays with one slot per Warehouse Product Level
+    row (SKU-location), so each simulated day is a handful of vectorized
+    operations over the whole network instead of a loop over rows.
+    """
+
+    def __init__(self, model, sourcing="greedy", common_random_numbers=False):
+        # model -> NetworkModel compiled from the validated tables
+        # sourcing -> allocate_orders method splitting orders over factories
+        # common_random_numbers -> Draw demand per warehouse-product & lead times per lane
+        # from keyed streams, so scenarios sharing them see the same random numbers
+        self.model = model
+        self.sourcing = sourcing
+        self.common_random_numbers = common_random_numbers
+        self.fp_holding = model.factory_holding[model.fp_factory]
+        self.sku_holding = model.warehouse_holding[model.sku_warehouse]
+        self.sku_demand = DistributionSampler(model.demand)
+        self.lane_lead_time = DistributionSampler(model.lead_time)
+        if common_random_numbers:
+            self.demand_keys = stream_keys("demand", *model.sku_names)
+            self.lead_time_keys = stream_keys(
+                "lead_time",
+                model.warehouse_names[model.lane_warehouse],
+                model.factory_names[model.lane_factory],
+            )
+
+    # ---------- Run ----------
+    def run(self, horizon=365, seed=None, record=True, antithetic=False):
+        """
+        Simulate `horizon` days and return a SimulationResult.
+
+        antithetic -> Mirror the random numbers of `seed`, only with common random numbers
+        """
+        demand_paths, lead_time_paths = self._sample_paths(seed, horizon, antithetic)
+        return self._run_days(horizon, demand_paths, lead_time_paths, record)
+
+    def _run_days(self, horizon, demand_paths, lead_time_paths, record):
+        """Step through every day of sampled paths, in the compiled kernel when available."""
+        if min_max_kernel is not None and self.sourcing == "greedy":
+            return self._run_kernel(min_max_kernel, horizon, demand_paths, lead_time_paths, record)
+        model = self.model
+        n_sku = len(model.sku_product)
+        n_fp = len(model.fp_product)
+
+        on_hand = model.sku_start.copy()
+        in_transit = np.zeros(n_sku)
+        fp_stock = model.fp_start.copy()
+        # Arrivals by day; the extra last slot collects anything landing after the horizon
+        pipeline = np.zeros((horizon + 1, n_sku))
+        graph = model.lane_graph
+
+        daily = {name: np.zeros(horizon) for name in DAILY_TOTALS}
+        series = {}
+        if record:
+            series = {name: np.zeros((horizon, n_sku)) for name in SKU_SERIES}
+
+        for t in range(horizon):
+            # Receive shipments due today
+            on_hand += pipeline[t]
+            in_transit -= pipeline[t]
+
+            # Factories produce back up to their starting inventory, within capacity
+            produced = np.minimum(model.fp_capacity, np.maximum(model.fp_start - fp_stock, 0))
+            fp_stock += produced
+
+            # Serve demand, unmet demand is lost
+            demand = demand_paths[t]
+            fulfilled = np.minimum(on_hand, demand)
+            lost = demand - fulfilled
+            on_hand -= fulfilled
+
+            # Min/Max review on inventory position
+            position = on_hand + in_transit
+            order = np.where(position <= model.sku_min, model.sku_max - position, 0.0)
+
+            # All of today's orders are allocated at once over the lane graph
+            edge_shipped = allocate_orders(graph, order, fp_stock, self.sourcing)
+            edges = np.flatnonzero(edge_shipped)
+            shipped = np.bincount(graph.edge_row[edges], weights=edge_shipped[edges], minlength=n_sku)
+            fp_stock -= np.bincount(graph.fp_row[edges], weights=edge_shipped[edges], minlength=n_fp)
+
+            lead_time = lead_time_paths[t, graph.lane_row[edges]]
+            arrival = np.minimum(t + lead_time, horizon)
+            np.add.at(pipeline, (arrival, graph.edge_row[edges]), edge_shipped[edges])
+            in_transit += shipped
+
+            # Costs
+            daily["demand"][t] = demand.sum()
+            daily["fulfilled"][t] = fulfilled.sum()
+            daily["lost"][t] = lost.sum()
+            daily["shipped"][t] = shipped.sum()
+            daily["on_hand"][t] = on_hand.sum()
+            daily["holding_cost"][t] = on_hand @ self.sku_holding + fp_stock @ self.fp_holding
+            daily["transportation_cost"][t] = edge_shipped[edges] @ graph.transport_cost[edges]
+            daily["production_cost"][t] = produced @ model.fp_unit_cost
+            daily["opportunity_cost"][t] = lost @ model.sku_opportunity_cost
+            if record:
+                series["on_hand"][t] = on_hand
+                series["demand"][t] = demand
+                series["fulfilled"][t] = fulfilled
+                series["lost"][t] = lost
+                series["shipped"][t] = shipped
+
+        return self._result(horizon, daily, series)
+
+    def _run_kernel(self, kernel, horizon, demand_paths, lead_time_paths, record):
+        """Run the day loop in a compiled kernel from src.inventory_kernel."""
+        model = self.model
+        graph = model.lane_graph
+        daily = np.zeros((len(DAILY_TOTALS), horizon))
+        shape = (horizon, model.n_sku) if record else (0, 0)
+        series = np.zeros((len(SKU_SERIES),) + shape)
+        kernel(
+            demand_paths,
+            lead_time_paths,
+            model.sku_start,
+            model.sku_min,
+            model.sku_max,
+            self.sku_holding,
+            model.sku_opportunity_cost,
+            model.fp_start,
+            model.fp_capacity,
+            self.fp_holding,
+            model.fp_unit_cost,
+            graph.indptr,
+            graph.fp_row,
+            graph.lane_row,
+            graph.transport_cost,
+            daily,
+            series,
+        )
+        daily = dict(zip(DAILY_TOTALS, daily))
+        series = dict(zip(SKU_SERIES, series)) if record else {}
+        return self._result(horizon, daily, series)
+
+    def _sample_paths(self, seed, horizon, antithetic=False):
+        """Pre-sample every random stream for the whole horizon up front."""
+        if self.common_random_numbers:
+            if not isinstance(seed, np.random.SeedSequence):
+                seed = np.random.SeedSequence(seed)
+            state = seed.generate_state(1, np.uint64)[0]
+            demand = self.sku_demand.transform(
+                keyed_uniforms(state, self.demand_keys, horizon, antithetic)
+            )
+            lead_time = self.lane_lead_time.transform(
+                keyed_uniforms(state, self.lead_time_keys, horizon, antithetic)
+            )
+        else:
+            rng = np.random.default_rng(seed)
+            demand = self.sku_demand.sample(rng, horizon)
+            lead_time = self.lane_lead_time.sample(rng, horizon)
+        demand_paths = np.maximum(np.rint(demand), 0)
+        lead_time_paths = np.maximum(np.rint(lead_time), 1).astype(int)
+        return demand_paths, lead_time_paths
+
+    def _result(self, horizon, daily, series):
+        """SimulationResult with the horizon KPIs of the per-day totals."""
+        total_demand = daily["demand"].sum()
+        kpis = {
+            "fill_rate": float(daily["fulfilled"].sum() / total_demand)
+            if total_demand > 0
+            else 1.0,
+            "holding_cost": float(daily["holding_cost"].sum()),
+            "transportation_cost": float(daily["transportation_cost"].sum()),
+            "production_cost": float(daily["production_cost"].sum()),
+            "opportunity_cost": float(daily["opportunity_cost"].sum()),
+        }
+        kpis["total_cost"] = (
+            kpis["holding_cost"]
+            + kpis["transportation_cost"]
+            + kpis["production_cost"]
+            + kpis["opportunity_cost"]
+        )
+        return SimulationResult(
+            warehouses=self.model.sku_names[0],
+            products=self.model.sku_names[1],
+            horizon=horizon,
+            kpis=kpis,
+            daily=daily,
+            series=series,
+        )
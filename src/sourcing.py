@@ -0,0 +1,108 @@
+import numpy as np
+
+
+def _allocate_greedy(graph, rows, order, stock):
+    """
+    Cheapest-first allocation in vectorized rounds.
+
+    Round k sends every open order to its k-th cheapest source; factories that
+    are asked for more than they hold ship pro-rata, and whatever an order did
+    not get moves on to its next source in the following round.
+    """
+    remaining = order.astype(float)
+    stock = stock.copy()
+    starts = graph.indptr[rows]
+    degree = graph.indptr[rows + 1] - starts
+    shipped_edges, shipped = [], []
+    open_orders = np.arange(len(rows))
+    for k in range(int(degree.max(initial=0))):
+        open_orders = open_orders[(remaining[open_orders] > 0) & (degree[open_orders] > k)]
+        if len(open_orders) == 0:
+            break
+        edges = starts[open_orders] + k
+        fp = graph.fp_row[edges]
+        requested = np.bincount(fp, weights=remaining[open_orders], minlength=len(stock))
+        with np.errstate(divide="ignore", invalid="ignore"):
+            fill = np.where(requested > stock, stock / requested, 1.0)
+        sent = np.floor(remaining[open_orders] * fill[fp])
+        shipped_edges.append(edges)
+        shipped.append(sent)
+        remaining[open_orders] -= sent
+        stock -= np.bincount(fp, weights=sent, minlength=len(stock))
+    if not shipped_edges:
+        return np.zeros(0, dtype=int), np.zeros(0)
+    edges = np.concatenate(shipped_edges)
+    shipped = np.concatenate(shipped)
+    by_edge = np.argsort(edges)
+    return edges[by_edge], shipped[by_edge]
+
+
+def _allocate_linprog(graph, rows, order, stock):
+    """Minimum cost allocation of the most units the stock allows, as one sparse LP."""
+    from scipy.optimize import linprog
+    from scipy.sparse import csr_matrix
+
+    edges = graph.edges(rows)
+    if len(edges) == 0:
+        return edges, np.zeros(0)
+    n = len(edges)
+    fp = graph.fp_row[edges]
+    cost = np.nan_to_num(graph.unit_cost[edges])
+    # Every unit shipped is worth more than the dearest source costs, so the LP
+    # ships as much as it can and then picks the cheapest way to do it
+    reward = np.abs(cost).max() + 1.0
+    row_pos = np.repeat(np.arange(len(rows)), graph.indptr[rows + 1] - graph.indptr[rows])
+    fp_ids, fp_pos = np.unique(fp, return_inverse=True)
+    columns = np.arange(n)
+    constraints = csr_matrix(
+        (
+            np.ones(2 * n),
+            (np.concatenate([row_pos, len(rows) + fp_pos]), np.concatenate([columns, columns])),
+        ),
+        shape=(len(rows) + len(fp_ids), n),
+    )
+    bounds = np.concatenate([order, np.maximum(stock[fp_ids], 0)])
+    solution = linprog(cost - reward, A_ub=constraints, b_ub=bounds, bounds=(0, None), method="highs")
+    if solution.status != 0:
+        raise RuntimeError(f"Sourcing LP failed: {solution.message}")
+    # Transportation LPs have integral optima for integral orders & stock
+    return edges, np.floor(solution.x + 1e-6)
+
+
+def allocate_sources(graph, rows, order, stock, method="greedy"):
+    """
+    Allocate the replenishment orders of some SKU-locations to sources with limited stock.
+
+    Only the edges of `rows` are visited, so the cost follows the number of
+    orders rather than the size of the network. Returns (edges, units shipped
+    on each edge) in ascending edge order.
+
+    graph -> LaneGraph of the network
+    rows -> Ordering SKU-locations in ascending order
+    order -> Units ordered by each of `rows`
+    stock -> Units available per Factory Product Level row
+    method -> "greedy" (cheapest source first) or "linprog" (minimum total cost)
+    """
+    rows = np.asarray(rows, dtype=int)
+    if method == "linprog":
+        return _allocate_linprog(graph, rows, order, stock)
+    return _allocate_greedy(graph, rows, order, stock)
+
+
+def allocate_orders(graph, order, stock, method="greedy"):
+    """
+    Allocate a day's replenishment orders to sources with limited stock.
+
+    Returns units shipped per lane graph edge; every order is split over its
+    feasible sources and no factory product ships more than its stock.
+
+    graph -> LaneGraph of the network
+    order -> Units ordered per SKU-location
+    stock -> Units available per Factory Product Level row
+    method -> "greedy" (cheapest source first) or "linprog" (minimum total cost)
+    """
+    rows = np.flatnonzero(order > 0)
+    edges, sent = allocate_sources(graph, rows, order[rows], stock, method)
+    shipped = np.zeros(len(graph.lane_row))
+    shipped[edges] = sent
+    return shipped
@@ -0,0 +1,80 @@
+import threading
+import zipfile
+from collections import OrderedDict
+from io import BytesIO
+
+import pandas as pd
+
+from src.table_store import table_hashes
+
+# Export format -> (file extension, mime type)
+EXPORT_FORMATS = {
+    "Excel": ("xlsx", "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"),
+    "CSV": ("zip", "application/zip"),
+    "Parquet": ("zip", "application/zip"),
+}
+
+# Exported bytes keyed by format & table hashes, shared by every session
+_exports = OrderedDict()
+_MAX_EXPORTS = 16
+# Sessions run on their own threads, every access to _exports holds the lock
+_exports_lock = threading.Lock()
+
+
+def _file_name(sheet):
+    return sheet.replace(" ", "_")
+
+
+def _excel_bytes(tables):
+    buf = BytesIO()
+    with pd.ExcelWriter(buf, engine="xlsxwriter") as writer:
+        for sheet, df in tables.items():
+            df.to_excel(writer, sheet_name=sheet[:31], index=False)
+    return buf.getvalue()
+
+
+def _zip_bytes(tables, fmt):
+    buf = BytesIO()
+    with zipfile.ZipFile(buf, "w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for sheet, df in tables.items():
+            if fmt == "CSV":
+                archive.writestr(f"{_file_name(sheet)}.csv", df.to_csv(index=False))
+            else:
+                # Edited object columns can mix strings & numbers, Parquet needs one type
+                text_columns = {col: "string" for col in df.columns if df[col].dtype == object}
+                data = df.astype(text_columns).to_parquet(index=False)
+                # Parquet is already compressed
+                archive.writestr(f"{_file_name(sheet)}.parquet", data, compress_type=zipfile.ZIP_STORED)
+    return buf.getvalue()
+
+
+def export_tables(tables, fmt="Excel", sheets=None):
+    """
+    Serialize tables to bytes in one of EXPORT_FORMATS.
+
+    Excel writes one sheet per table, CSV & Parquet write one file per table into
+    a zip. Results are memoized by table content hash, so exporting unchanged
+    tables again returns the same bytes without serializing.
+
+    sheets -> Optional names of the tables to export, all tables by default
+    """
+    sheets = list(tables) if sheets is None else sheets
+    key = (fmt, tuple(table_hashes(tables, sheets).items()))
+    with _exports_lock:
+        if key in _exports:
+            _exports.move_to_end(key)
+            return _exports[key]
+    # Serialized outside the lock, so one large export does not hold up the others
+    tables = {sheet: tables.get(sheet, pd.DataFrame()) for sheet in sheets}
+    data = _excel_bytes(tables) if fmt == "Excel" else _zip_bytes(tables, fmt)
+    with _exports_lock:
+        _exports[key] = data
+        while len(_exports) > _MAX_EXPORTS:
+            _exports.popitem(last=False)
+    return data
+
+
+def export_file_name(name, fmt):
+    """File name & mime type for an export of `name`."""
+    extension, mime = EXPORT_FORMATS[fmt]
+    return f"{_file_name(name)}.{extension}", mime
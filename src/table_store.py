@@ -0,0 +1,80 @@
+import hashlib
+from collections.abc import MutableMapping
+
+import pandas as pd
+
+from src.compact_tables import compact_table
+
+
+def table_hash(df):
+    """Content hash of a table covering values, index, row order, columns and dtypes."""
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr([(str(col), str(dtype)) for col, dtype in df.dtypes.items()]).encode())
+    digest.update(pd.util.hash_pandas_object(df, index=True).to_numpy().tobytes())
+    return digest.hexdigest()
+
+
+class TableStore(MutableMapping):
+    """
+    Network tables of a session, versioned per table.
+
+    Stored frames are compact snapshots that are never modified in place, so
+    stores, snapshots and readers share them without copying. Assigning a table
+    only replaces it (and bumps its version) when its content hash changed.
+    """
+
+    def __init__(self, tables=None):
+        self._tables = {}
+        self._hashes = {}
+        self._versions = {}
+        for name, df in (tables or {}).items():
+            self[name] = df
+
+    def __getitem__(self, name):
+        return self._tables[name]
+
+    def __setitem__(self, name, df):
+        df = compact_table(df, name)
+        content_hash = table_hash(df)
+        if self._hashes.get(name) == content_hash:
+            return
+        self._tables[name] = df
+        self._hashes[name] = content_hash
+        self._versions[name] = self._versions.get(name, 0) + 1
+
+    def __delitem__(self, name):
+        del self._tables[name]
+        del self._hashes[name]
+
+    def __iter__(self):
+        return iter(self._tables)
+
+    def __len__(self):
+        return len(self._tables)
+
+    def version(self, name):
+        """Number of content changes of a table, 0 when it was never stored."""
+        return self._versions.get(name, 0) if name in self._tables else 0
+
+    def content_hash(self, name):
+        return self._hashes[name]
+
+    def snapshot(self):
+        """A store sharing the current frames, later writes to either store are not shared."""
+        snapshot = TableStore()
+        snapshot._tables = dict(self._tables)
+        snapshot._hashes = dict(self._hashes)
+        snapshot._versions = dict(self._versions)
+        return snapshot
+
+    copy = snapshot
+
+
+def table_hashes(tables, names):
+    """Content hash per name, reusing the hashes a TableStore already holds."""
+    return {
+        name: tables.content_hash(name)
+        if isinstance(tables, TableStore) and name in tables
+        else table_hash(tables.get(name, pd.DataFrame()))
+        for name in names
+    }
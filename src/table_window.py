@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+
+# Columns a table window can be filtered by
+FILTER_COLUMNS = ["Factory", "Warehouse", "Product"]
+
+
+def filter_options(table):
+    """Distinct values of every filter column present in the table."""
+    options = {}
+    for col in FILTER_COLUMNS:
+        if col in table.columns:
+            values = table[col]
+            if isinstance(values.dtype, pd.CategoricalDtype):
+                # Categories can outlive the rows that used them
+                values = values.cat.remove_unused_categories().cat.categories
+            options[col] = sorted(pd.unique(values.dropna()).tolist(), key=str)
+    return options
+
+
+def filter_labels(table, filters=None):
+    """
+    Row labels of the rows matching every filter.
+
+    filters -> Optional {column: values}, columns with no values are not filtered
+    """
+    mask = np.ones(len(table), dtype=bool)
+    for col, values in (filters or {}).items():
+        if values:
+            mask &= table[col].isin(values).to_numpy()
+    return table.index[mask]
+
+
+def merge_window(table, labels, window):
+    """
+    Write an edited window back into the full table.
+
+    window -> The data editor's result for the rows at `labels`, given to it with
+    a RangeIndex: surviving rows keep their position, deleted rows are missing
+    and added rows follow with positions past the window. Rows are matched to
+    the table by label, added rows are appended with new labels.
+    """
+    positions = window.index.to_numpy()
+    kept = positions < len(labels)
+    edited = window[kept].set_axis(labels[positions[kept]])
+    start = table.index.max() + 1 if len(table) else 0
+    added = window[~kept].set_axis(pd.RangeIndex(start, start + int((~kept).sum())))
+    deleted = labels.difference(edited.index)
+    order = table.index[~table.index.isin(deleted)].append(added.index)
+    outside = table[~table.index.isin(labels)]
+    frames = [df for df in [outside, edited, added] if len(df)]
+    merged = pd.concat(frames) if frames else window.iloc[:0]
+    return merged.loc[order]
@@ -0,0 +1,58 @@
+from collections import OrderedDict
+
+from src.incremental_validation import LEVEL_DEPENDENCIES
+from src.table_store import table_hashes
+
+
+def _upstream(level):
+    """The level and every level its checks depend on, directly or not."""
+    levels = {level}
+    for dependency in LEVEL_DEPENDENCIES[level]:
+        levels |= _upstream(dependency)
+    return levels
+
+
+# Tables each level's result is computed from
+LEVEL_INPUTS = {
+    level: [other for other in LEVEL_DEPENDENCIES if other in _upstream(level)]
+    for level in LEVEL_DEPENDENCIES
+}
+
+# Cache entry for the compiled NetworkModel, which reads all tables
+NETWORK = "Network"
+
+
+class ValidationCache:
+    """
+    Validation results keyed by the content hashes of the tables they were computed from.
+
+    A level's key covers its own table and every level it depends on, so editing
+    the Factory Level invalidates every level below it while an edit to the
+    Warehouse Product Level leaves the other four levels cached.
+    """
+
+    def __init__(self, maxsize=64):
+        # maxsize -> Entries kept, least recently used are dropped first
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+
+    @staticmethod
+    def keys(tables):
+        """Cache key per level, plus one for the whole network, of the current tables."""
+        hashes = table_hashes(tables, LEVEL_DEPENDENCIES)
+        keys = {level: "-".join(hashes[other] for other in LEVEL_INPUTS[level]) for level in LEVEL_INPUTS}
+        keys[NETWORK] = "-".join(hashes.values())
+        return keys
+
+    def get(self, name, key):
+        """Cached value or None."""
+        value = self._entries.get((name, key))
+        if value is not None:
+            self._entries.move_to_end((name, key))
+        return value
+
+    def put(self, name, key, value):
+        self._entries[(name, key)] = value
+        self._entries.move_to_end((name, key))
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
@@ -0,0 +1,101 @@
+import importlib.util
+
+import numpy as np
+import pandas as pd
+
+from src.simulation_check import LEVEL_COLUMNS
+
+
+def excel_engine():
+    """calamine (Rust) when python-calamine is installed, else openpyxl in read-only mode."""
+    if importlib.util.find_spec("python_calamine") is not None:
+        return "calamine"
+    return "openpyxl"
+
+
+def _typed_column(values, dtype):
+    """Column array of the type the validator checks, values that do not fit are kept as is."""
+    if dtype is str:
+        return np.array([value if value is None else str(value) for value in values], dtype=object)
+    try:
+        numbers = np.array(values, dtype="float64")
+    except (TypeError, ValueError):
+        # A non-numeric cell, validation reports it
+        return np.array(values, dtype=object)
+    # Whole numbers without blanks stay int64 like pd.read_excel reads them, so the
+    # editor, exports & compact_table's integer downcast see the same types
+    if len(numbers) and np.isfinite(numbers).all() and (numbers == np.round(numbers)).all():
+        return numbers.astype("int64")
+    return numbers
+
+
+def _openpyxl_frames(source, sheets):
+    """Stream the selected sheets row by row, keeping only the level columns."""
+    import openpyxl
+
+    workbook = openpyxl.load_workbook(source, read_only=True, data_only=True, keep_links=False)
+    try:
+        frames = {}
+        for sheet, level in sheets(workbook.sheetnames).items():
+            rows = workbook[sheet].iter_rows(values_only=True)
+            header = next(rows, ())
+            positions = [i for i, col in enumerate(header) if col in LEVEL_COLUMNS[level]]
+            records = [
+                tuple(row[i] if i < len(row) else None for i in positions)
+                for row in rows
+                # Skip blank rows like pandas does
+                if any(value is not None for value in row)
+            ]
+            # Typed column arrays straight from the records, no object frame to cast afterwards
+            columns = list(zip(*records)) if records else [()] * len(positions)
+            frames[level] = pd.DataFrame(
+                {
+                    header[i]: _typed_column(values, LEVEL_COLUMNS[level][header[i]])
+                    for i, values in zip(positions, columns)
+                }
+            )
+        return frames
+    finally:
+        workbook.close()
+
+
+def _calamine_frames(source, sheets):
+    """Parse the selected sheets with the level column types applied while parsing."""
+    with pd.ExcelFile(source, engine="calamine") as excel:
+        frames = {}
+        for sheet, level in sheets(excel.sheet_names).items():
+            columns = LEVEL_COLUMNS[level]
+            df = excel.parse(
+                sheet,
+                usecols=lambda col: col in columns,
+                # Empty cells come through as "" and still end up null
+                converters={col: str for col, dtype in columns.items() if dtype is str},
+            )
+            # The parser already reads numeric columns as int64 or float64, only columns
+            # with text cells are left to convert, values that do not fit are kept as is
+            for col, dtype in columns.items():
+                if dtype is float and col in df.columns and df[col].dtype == object:
+                    df[col] = _typed_column(df[col].to_numpy(), dtype)
+            frames[level] = df
+        return frames
+
+
+def _read(source, sheets):
+    # sheets -> Picks {sheet: level} to read from the workbook's sheet names
+    read = _calamine_frames if excel_engine() == "calamine" else _openpyxl_frames
+    return read(source, sheets)
+
+
+def read_network_workbook(source):
+    """
+    Read the network levels present in a workbook.
+
+    Only the five level sheets are parsed and only the level columns are kept.
+    Returns {level: DataFrame}, empty when no sheet matches.
+    """
+    return _read(source, lambda names: {name: name for name in names if name in LEVEL_COLUMNS})
+
+
+def read_level_table(source, level):
+    """Read one level from its own sheet, or from the first sheet when none is named after it."""
+    return _read(source, lambda names: {level if level in names else names[0]: level})[level]
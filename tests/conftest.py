@@ -0,0 +1,82 @@
+import os
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.network_model import NetworkModel
+
+SAMPLE_FILE = os.path.join(os.path.dirname(__file__), "..", "sample_data", "Input_Data.xlsx")
+
+
+@pytest.fixture(scope="session")
+def sample_tables():
+    """The five level tables of the sample workbook, as read from the file."""
+    return pd.read_excel(SAMPLE_FILE, sheet_name=None)
+
+
+@pytest.fixture(scope="session")
+def sample_model(sample_tables):
+    return NetworkModel(sample_tables)
+
+
+def make_network(n_warehouses=4, n_products=5, n_factories=3, sources=1, seed=0, stock=1.0, lead_times=None):
+    """
+    Random level tables of a fully connected network.
+
+    sources -> Factories making each product, more than one gives SKU-locations several lanes
+    stock -> Scale of factory starting inventory & capacity, below 1 factories run short
+    lead_times -> Categorical lead time parameter string of every lane
+    """
+    rng = np.random.default_rng(seed)
+    factories = [f"F{i}" for i in range(n_factories)]
+    warehouses = [f"W{i}" for i in range(n_warehouses)]
+    products = [f"P{i}" for i in range(n_products)]
+    factory_products = [
+        (factory, product)
+        for i, product in enumerate(products)
+        for factory in np.roll(factories, -i)[:sources]
+    ]
+    lanes = [(w, f) for w in warehouses for f in factories]
+    skus = [(w, p) for w in warehouses for p in products]
+    means = rng.uniform(5, 20, len(skus))
+    return {
+        "Factory Level": pd.DataFrame(
+            {"Factory": factories, "Holding Cost Per Unit Per Day": rng.uniform(0.1, 1, n_factories)}
+        ),
+        "Warehouse Level": pd.DataFrame(
+            {"Warehouse": warehouses, "Holding Cost Per Unit Per Day": rng.uniform(0.1, 1, n_warehouses)}
+        ),
+        "Factory Product Level": pd.DataFrame(
+            {
+                "Factory": [f for f, _ in factory_products],
+                "Product": [p for _, p in factory_products],
+                "Production Capacity": np.rint(rng.integers(50, 150, len(factory_products)) * stock),
+                "Starting Inventory": np.rint(rng.integers(300, 900, len(factory_products)) * stock),
+                "Production Cost Per Unit": rng.integers(1, 10, len(factory_products)),
+            }
+        ),
+        "Warehouse Factory Level": pd.DataFrame(
+            {
+                "Warehouse": [w for w, _ in lanes],
+                "Factory": [f for _, f in lanes],
+                "Transporatation Cost Per Unit Per Km": rng.uniform(0.01, 0.1, len(lanes)),
+                "Distance Between Warehouse & Factory": rng.integers(10, 500, len(lanes)),
+                "Lead Time Distribution": "Categorical",
+                "Lead Time Parameters": lead_times or "{1: 0.2, 2: 0.5, 3: 0.3}",
+            }
+        ),
+        "Warehouse Product Level": pd.DataFrame(
+            {
+                "Warehouse": [w for w, _ in skus],
+                "Product": [p for _, p in skus],
+                "Daily Demand Distribution": "Normal",
+                "Demand Distribution Parameters": [f"{{'mean': {m:.1f}, 'std_dev': {m / 4:.1f}}}" for m in means],
+                "Inventory Policy": "Min/Max",
+                "Inventory Policy Parameters": "{'min': 40, 'max': 120}",
+                "Safety Stock": 10,
+                "Starting Inventory": 100,
+                "Opportunity Cost Per Unit": 1.5,
+            }
+        ),
+    }
@@ -0,0 +1,98 @@
+import hashlib
+import json
+import os
+import struct
+
+import pytest
+
+from src.chunked_upload import ChunkedUploadReceiver, parse_frame
+
+
+def _frame(chunk, **header):
+    encoded = json.dumps(header).encode("utf-8")
+    return struct.pack(">I", len(encoded)) + encoded + chunk
+
+
+def _frames(upload_id, data, chunk_size, filename="network.xlsx"):
+    chunks = [data[i : i + chunk_size] for i in range(0, len(data), chunk_size)] or [b""]
+    return [
+        _frame(chunk, upload_id=upload_id, filename=filename, index=i, total_chunks=len(chunks), size=len(data))
+        for i, chunk in enumerate(chunks)
+    ]
+
+
+@pytest.fixture
+def receiver():
+    receiver = ChunkedUploadReceiver()
+    yield receiver
+    receiver.discard()
+
+
+def _read(upload):
+    with open(upload["path"], "rb") as f:
+        data = f.read()
+    os.remove(upload["path"])
+    return data
+
+
+def test_parse_frame_splits_header_and_chunk():
+    header, chunk = parse_frame(_frame(b"\x00\xffdata", upload_id="u", filename="a.xlsx", index=3, total_chunks=5))
+    assert header == {"upload_id": "u", "filename": "a.xlsx", "index": 3, "total_chunks": 5}
+    assert bytes(chunk) == b"\x00\xffdata"
+
+
+@pytest.mark.parametrize(
+    "frame",
+    [
+        b"\x00\x00",
+        struct.pack(">I", 100) + b"{}",
+        struct.pack(">I", 2) + b"\xff\xfe",
+        struct.pack(">I", 5) + b"nope!",
+        _frame(b"data", upload_id="u", filename="a.xlsx", index=0),
+        struct.pack(">I", 2) + b"[]",
+    ],
+    ids=["short", "overrun", "not-utf8", "not-json", "missing-key", "not-object"],
+)
+def test_bad_headers_raise_value_error(frame):
+    with pytest.raises(ValueError):
+        parse_frame(frame)
+
+
+def test_frames_are_reassembled_and_acknowledged(receiver):
+    data = os.urandom(10_000)
+    frames = _frames("u1", data, 3000)
+    for i, frame in enumerate(frames[:-1]):
+        assert receiver.receive(frame) is None
+        assert receiver.ack == {"upload_id": "u1", "index": i}
+    # A frame seen again on a rerun is ignored
+    assert receiver.receive(frames[1]) is None
+    upload = receiver.receive(frames[-1])
+    assert upload["filename"] == "network.xlsx"
+    assert upload["size"] == len(data)
+    assert upload["md5"] == hashlib.md5(data).hexdigest()
+    assert _read(upload) == data
+    assert receiver.receive(frames[-1]) is None
+
+
+def test_out_of_order_frames_are_ignored(receiver):
+    frames = _frames("u2", b"abcdefgh", 3)
+    assert receiver.receive(frames[1]) is None
+    assert receiver.upload is None
+    receiver.receive(frames[0])
+    assert receiver.receive(frames[2]) is None
+    assert receiver.ack["index"] == 0
+
+
+def test_new_upload_replaces_an_interrupted_one(receiver):
+    receiver.receive(_frames("old", b"x" * 10, 4)[0])
+    interrupted = receiver.upload.path
+    frames = _frames("new", b"fresh", 10)
+    upload = receiver.receive(frames[0])
+    assert not os.path.exists(interrupted)
+    assert _read(upload) == b"fresh"
+
+
+def test_empty_file_is_one_empty_frame(receiver):
+    upload = receiver.receive(_frames("empty", b"", 10)[0])
+    assert upload["size"] == 0
+    assert _read(upload) == b""
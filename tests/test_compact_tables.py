@@ -0,0 +1,42 @@
+import pandas as pd
+
+from src.compact_tables import compact_table, compact_tables, expand_table
+from src.simulation_check import LEVEL_COLUMNS
+
+
+def test_compact_tables_round_trip(sample_tables):
+    originals = {name: df.copy() for name, df in sample_tables.items()}
+    compact = compact_tables(sample_tables)
+    for name, df in sample_tables.items():
+        pd.testing.assert_frame_equal(expand_table(compact[name]), df)
+        # Compacting never touches the frames it was given
+        pd.testing.assert_frame_equal(df, originals[name])
+
+
+def test_text_becomes_categorical_and_integers_shrink(sample_tables):
+    for name in LEVEL_COLUMNS:
+        df = sample_tables[name]
+        compact = compact_table(df, name)
+        for col in df.columns:
+            dtype = compact[col].dtype
+            if LEVEL_COLUMNS[name].get(col) is str and df[col].dtype == object:
+                assert isinstance(dtype, pd.CategoricalDtype), col
+            elif df[col].dtype == "int64":
+                assert pd.api.types.is_integer_dtype(dtype) and dtype.itemsize < 8, col
+            else:
+                assert dtype == df[col].dtype, col
+
+
+def test_large_tables_take_less_memory(sample_tables):
+    name = "Warehouse Product Level"
+    df = pd.concat([sample_tables[name]] * 200, ignore_index=True)
+    compact = compact_table(df, name)
+    assert compact.memory_usage(deep=True).sum() < df.memory_usage(deep=True).sum() / 4
+    pd.testing.assert_frame_equal(expand_table(compact), df)
+
+
+def test_other_sheets_are_shared_unchanged():
+    notes = pd.DataFrame({"Note": ["a", "b"], "Count": [1, 2]})
+    shared = compact_tables({"Notes": notes})["Notes"]
+    assert shared is not notes
+    pd.testing.assert_frame_equal(shared, notes)
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+
+from src.decimation import decimate, lttb_indices, minmax_indices, quantile_bands
+
+
+@pytest.fixture(scope="module")
+def line():
+    rng = np.random.default_rng(0)
+    y = np.cumsum(rng.normal(size=10_000))
+    # One day far off the walk, a chart that loses it hides a stockout
+    y[4321] += 500
+    return np.arange(len(y)), y
+
+
+@pytest.mark.parametrize("n_out", [3, 10, 500, 9_999])
+def test_lttb_keeps_endpoints_within_budget(line, n_out):
+    x, y = line
+    indices = lttb_indices(x, y, n_out)
+    assert len(indices) == n_out
+    assert indices[0] == 0 and indices[-1] == len(y) - 1
+    assert (np.diff(indices) > 0).all()
+
+
+def test_lttb_keeps_a_spike(line):
+    x, y = line
+    assert 4321 in lttb_indices(x, y, 200)
+
+
+@pytest.mark.parametrize("n_out", [2, 10, 501])
+def test_minmax_keeps_extremes_within_budget(line, n_out):
+    _, y = line
+    indices = minmax_indices(y, n_out)
+    assert len(indices) <= n_out
+    assert (np.diff(indices) > 0).all()
+    assert {np.argmin(y), np.argmax(y)} <= set(indices)
+
+
+@pytest.mark.parametrize("method", ["lttb", "minmax"])
+def test_short_lines_are_drawn_whole(method):
+    x, y = np.arange(5), np.array([3.0, 1.0, 4.0, 1.0, 5.0])
+    x_out, y_out = decimate(x, y, 10, method)
+    np.testing.assert_array_equal(x_out, x)
+    np.testing.assert_array_equal(y_out, y)
+
+
+def test_unknown_method_raises(line):
+    with pytest.raises(ValueError):
+        decimate(*line, 100, method="every_nth")
+
+
+def test_quantile_bands_per_step():
+    values = np.arange(12, dtype=float).reshape(3, 4)
+    bands = quantile_bands(values, [0.0, 0.5, 1.0])
+    np.testing.assert_allclose(bands, [[0, 4, 8], [1.5, 5.5, 9.5], [3, 7, 11]])
+    assert np.isnan(quantile_bands(np.zeros((3, 0)), [0.5])).all()
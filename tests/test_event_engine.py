@@ -0,0 +1,67 @@
+import numpy as np
+import pytest
+
+from src.event_engine import EventDrivenEngine
+from src.network_model import NetworkModel
+from src.simulation_engine import SimulationEngine
+
+from conftest import make_network
+
+HORIZON = 730
+
+
+def _sparse_model(seed=0, stock=100, lead_times=None):
+    """A network whose SKU-locations reorder every few weeks, from factories that never run short by default."""
+    tables = make_network(n_warehouses=6, n_products=4, seed=seed, stock=stock, lead_times=lead_times)
+    tables["Warehouse Product Level"]["Inventory Policy Parameters"] = "{'min': 40, 'max': 2000}"
+    return NetworkModel(tables)
+
+
+@pytest.fixture
+def day_loop_calls(monkeypatch):
+    """Runs of EventDrivenEngine that stepped through the days."""
+    calls = []
+
+    def run_days(self, *args):
+        calls.append(args[0])
+        return SimulationEngine._run_days(self, *args)
+
+    monkeypatch.setattr(EventDrivenEngine, "_run_days", run_days)
+    return calls
+
+
+def _assert_same_run(model, sourcing="greedy", record=True, seed=7):
+    daily = SimulationEngine(model, sourcing).run(horizon=HORIZON, seed=seed, record=record)
+    event = EventDrivenEngine(model, sourcing).run(horizon=HORIZON, seed=seed, record=record)
+    assert event.kpis == pytest.approx(daily.kpis)
+    assert event.daily.keys() == daily.daily.keys()
+    for name in daily.daily:
+        np.testing.assert_allclose(event.daily[name], daily.daily[name], atol=1e-6, err_msg=name)
+    assert event.series.keys() == daily.series.keys()
+    for name in daily.series:
+        np.testing.assert_allclose(event.series[name], daily.series[name], atol=1e-6, err_msg=name)
+
+
+@pytest.mark.parametrize("record", [False, True])
+@pytest.mark.parametrize("seed", [0, 1])
+def test_sparse_runs_match_daily_engine(day_loop_calls, seed, record):
+    _assert_same_run(_sparse_model(seed), record=record, seed=seed)
+    assert day_loop_calls == []
+
+
+def test_stockouts_between_arrivals_match_daily_engine(day_loop_calls):
+    # Long lead times leave warehouses empty until their order arrives
+    model = _sparse_model(lead_times="{20: 0.5, 40: 0.5}")
+    assert EventDrivenEngine(model, "greedy").run(horizon=HORIZON, seed=3).daily["lost"].sum() > 0
+    _assert_same_run(model, seed=3)
+    assert day_loop_calls == []
+
+
+def test_factory_shortage_falls_back_to_days(day_loop_calls):
+    _assert_same_run(_sparse_model(stock=0.05))
+    assert day_loop_calls == [HORIZON]
+
+
+@pytest.mark.parametrize("sourcing", ["greedy", "linprog"])
+def test_dense_runs_match_daily_engine(sample_model, sourcing):
+    _assert_same_run(sample_model, sourcing)
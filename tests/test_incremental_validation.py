@@ -0,0 +1,84 @@
+import numpy as np
+import pandas as pd
+import pytest
+import streamlit as st
+
+from components.network_design_tab import revalidate_edits, run_validations
+from components.ui_helpers import get_default_network_tables
+from src.table_store import TableStore
+
+
+def _statuses_after_edit(level, edit):
+    """Statuses after an incremental edit, and after a full validation of the edited tables."""
+    st.session_state.clear()
+    st.session_state.tables = TableStore(get_default_network_tables())
+    run_validations()
+
+    previous_df = st.session_state.tables[level]
+    df = previous_df.copy()
+    editor_state = {"edited_rows": {}, "added_rows": [], "deleted_rows": []}
+    for position, column, value in edit:
+        df.iloc[position, df.columns.get_loc(column)] = value
+        editor_state["edited_rows"].setdefault(position, {})[column] = value
+    st.session_state.tables[level] = df
+    revalidate_edits(level, previous_df, editor_state)
+    incremental = dict(st.session_state.validation_results)
+
+    tables = st.session_state.tables
+    st.session_state.clear()
+    st.session_state.tables = tables
+    run_validations()
+    return incremental, dict(st.session_state.validation_results)
+
+
+@pytest.mark.parametrize(
+    "level, edit",
+    [
+        ("Warehouse Product Level", [(0, "Safety Stock", np.nan)]),
+        ("Warehouse Product Level", [(1, "Starting Inventory", -5)]),
+        ("Factory Product Level", [(0, "Product", None)]),
+        ("Factory Level", [(0, "Factory", None)]),
+        ("Warehouse Level", [(0, "Warehouse", np.nan), (1, "Warehouse", np.nan)]),
+    ],
+)
+def test_statuses_after_edit_match_full_validation(level, edit):
+    incremental, full = _statuses_after_edit(level, edit)
+    assert incremental == full
+
+
+def test_statuses_after_reverting_edit_pass_again():
+    level = "Warehouse Product Level"
+    st.session_state.clear()
+    st.session_state.tables = TableStore(get_default_network_tables())
+    run_validations()
+    passed = dict(st.session_state.validation_results)
+
+    original = st.session_state.tables[level]
+    edited = original.copy()
+    edited.iloc[0, edited.columns.get_loc("Safety Stock")] = np.nan
+    st.session_state.tables[level] = edited
+    revalidate_edits(level, original, {"edited_rows": {0: {"Safety Stock": None}}})
+    assert st.session_state.validation_results != passed
+
+    st.session_state.tables[level] = original
+    revalidate_edits(level, edited, {"edited_rows": {0: {"Safety Stock": 1}}})
+    assert st.session_state.validation_results == passed
+
+
+def test_statuses_follow_the_report():
+    st.session_state.clear()
+    st.session_state.tables = TableStore(get_default_network_tables())
+    tables = st.session_state.tables
+    df = tables["Factory Product Level"].copy()
+    df["Production Capacity"] = df["Production Capacity"].astype(object)
+    df.iloc[[1, 2], df.columns.get_loc("Production Capacity")] = "many"
+    tables["Factory Product Level"] = df
+    run_validations()
+
+    statuses = st.session_state.validation_results
+    assert statuses["Factory Level"] == statuses["Warehouse Level"] == "Passed"
+    assert statuses["Factory Product Level"] == (
+        f"Value 'many' must be a number (row {df.index[1]}, column 'Production Capacity') and 1 more issue(s)"
+    )
+    # Levels depending on a failed level are not judged
+    assert statuses["Warehouse Factory Level"] == statuses["Warehouse Product Level"] == "Not-checked"
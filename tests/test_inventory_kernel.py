@@ -0,0 +1,57 @@
+import numpy as np
+import pytest
+
+import src.simulation_engine as simulation_engine
+from src.inventory_kernel import _min_max_days
+from src.network_model import NetworkModel
+from src.simulation_engine import DAILY_TOTALS, SKU_SERIES, SimulationEngine
+
+from conftest import make_network
+
+HORIZON = 120
+
+
+@pytest.fixture(scope="module")
+def short_model():
+    # Two sources per product & factories holding a fraction of the demand, so greedy
+    # sourcing goes past the first round and splits short stock
+    return NetworkModel(make_network(sources=2, stock=0.05))
+
+
+def _numpy_run(model, seed, monkeypatch):
+    monkeypatch.setattr(simulation_engine, "min_max_kernel", None)
+    return SimulationEngine(model).run(HORIZON, seed=seed)
+
+
+def _kernel_run(model, seed, kernel):
+    engine = SimulationEngine(model)
+    return engine._run_kernel(kernel, HORIZON, *engine._sample_paths(seed, HORIZON), record=True)
+
+
+def _assert_same(result, expected):
+    for name in DAILY_TOTALS:
+        np.testing.assert_allclose(result.daily[name], expected.daily[name], err_msg=name)
+    for name in SKU_SERIES:
+        np.testing.assert_allclose(result.series[name], expected.series[name], err_msg=name)
+    assert result.kpis == pytest.approx(expected.kpis)
+
+
+@pytest.mark.parametrize("model_fixture", ["sample_model", "short_model"])
+def test_kernel_loops_match_numpy_day_loop(model_fixture, request, monkeypatch):
+    model = request.getfixturevalue(model_fixture)
+    expected = _numpy_run(model, 7, monkeypatch)
+    _assert_same(_kernel_run(model, 7, _min_max_days), expected)
+
+
+def test_short_model_splits_orders_over_sources(short_model, monkeypatch):
+    result = _numpy_run(short_model, 7, monkeypatch)
+    assert result.daily["lost"].sum() > 0
+    assert result.daily["shipped"].sum() > 0
+
+
+def test_compiled_kernel_matches_numpy_day_loop(short_model, monkeypatch):
+    pytest.importorskip("numba")
+    from src.inventory_kernel import min_max_kernel
+
+    expected = _numpy_run(short_model, 11, monkeypatch)
+    _assert_same(_kernel_run(short_model, 11, min_max_kernel), expected)
@@ -0,0 +1,81 @@
+import os
+import threading
+import time
+from concurrent.futures import CancelledError
+
+import pytest
+
+from src.job_manager import JobManager
+
+
+@pytest.fixture
+def jobs():
+    manager = JobManager(max_workers=2, max_jobs=2)
+    yield manager
+    manager._threads.shutdown(wait=True)
+    manager.executor.shutdown(wait=True)
+
+
+def _wait(job, timeout=30):
+    deadline = time.time() + timeout
+    while not job.finished:
+        assert time.time() < deadline, f"job still {job.status}"
+        time.sleep(0.01)
+    return job
+
+
+def _squares(n, executor, progress, partial, cancelled):
+    results = []
+    for i, square in enumerate(executor.map(pow, range(n), [2] * n)):
+        results.append(square)
+        progress(i + 1, n)
+        partial(list(results))
+    return results
+
+
+def _until_cancelled(started, executor, progress, partial, cancelled):
+    started.set()
+    while not cancelled():
+        time.sleep(0.01)
+    raise CancelledError()
+
+
+def _kill_worker(executor, progress, partial, cancelled):
+    return executor.submit(os._exit, 1).result()
+
+
+def _fail(executor, progress, partial, cancelled):
+    raise ValueError("bad scenario")
+
+
+def test_job_reports_progress_partial_results_and_result(jobs):
+    job = _wait(jobs.submit("squares", _squares, 5))
+    assert job.status == "done"
+    assert job.result == [0, 1, 4, 9, 16]
+    assert (job.done, job.total, job.progress) == (5, 5, 1.0)
+    assert job.partial == job.result
+    assert jobs.collect(job.id) is job
+    assert jobs.get(job.id) is None
+
+
+def test_cancel_stops_a_running_job(jobs):
+    started = threading.Event()
+    job = jobs.submit("forever", _until_cancelled, started)
+    assert started.wait(10)
+    assert jobs.collect(job.id) is None
+    job.cancel()
+    assert _wait(job).status == "cancelled"
+
+
+def test_failed_job_keeps_its_error(jobs):
+    job = _wait(jobs.submit("failing", _fail))
+    assert job.status == "failed"
+    assert isinstance(job.error, ValueError)
+
+
+def test_broken_pool_is_replaced_for_later_jobs(jobs):
+    broken = jobs.executor
+    job = _wait(jobs.submit("crash", _kill_worker))
+    assert job.status == "failed"
+    assert jobs.executor is not broken
+    assert _wait(jobs.submit("squares", _squares, 3)).result == [0, 1, 4]
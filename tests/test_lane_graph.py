@@ -0,0 +1,55 @@
+import numpy as np
+import pytest
+
+from src.incremental_validation import report_statuses
+from src.lane_graph import LaneGraph
+from src.simulation_check import SimulationExecutionCheck
+
+from conftest import make_network
+
+
+@pytest.fixture(scope="module")
+def multi_source_tables():
+    return make_network(n_factories=4, sources=3, seed=3)
+
+
+def _graph(tables):
+    return LaneGraph.from_tables(
+        tables["Factory Product Level"], tables["Warehouse Factory Level"], tables["Warehouse Product Level"]
+    )
+
+
+def test_products_made_by_several_factories_pass_validation(multi_source_tables):
+    checker = SimulationExecutionCheck(vectorized=True)
+    report = checker.validation_report(multi_source_tables)
+    assert set(report_statuses(report).values()) == {"Passed"}
+    fp = multi_source_tables["Factory Product Level"]
+    assert checker.factory_product_level_check(fp.copy(), multi_source_tables["Factory Level"]) == "Passed"
+
+
+def test_duplicate_factory_product_pair_still_fails(multi_source_tables):
+    tables = dict(multi_source_tables)
+    fp = tables["Factory Product Level"]
+    tables["Factory Product Level"] = fp.iloc[np.r_[0 : len(fp), 0]].reset_index(drop=True)
+    report = SimulationExecutionCheck(vectorized=True).validation_report(tables)
+    assert (report["Check"] == "Duplicate").sum() == 1
+
+
+def test_sources_are_sorted_by_unit_cost(multi_source_tables):
+    tables = multi_source_tables
+    graph = _graph(tables)
+    wf = tables["Warehouse Factory Level"]
+    fp = tables["Factory Product Level"]
+    wp = tables["Warehouse Product Level"]
+    transport = wf.set_index(["Warehouse", "Factory"])
+    transport = transport["Transporatation Cost Per Unit Per Km"] * transport["Distance Between Warehouse & Factory"]
+    production = fp.set_index(["Factory", "Product"])["Production Cost Per Unit"]
+
+    assert (graph.degree == 3).all()
+    for row, (warehouse, product) in enumerate(zip(wp["Warehouse"], wp["Product"])):
+        edges = graph.sources(row)
+        factories = wf["Factory"].to_numpy()[graph.lane_row[edges]]
+        expected = [transport[warehouse, f] + production[f, product] for f in factories]
+        np.testing.assert_allclose(graph.unit_cost[edges], expected)
+        assert (np.diff(graph.unit_cost[edges]) >= 0).all()
+        assert sorted(factories) == sorted(fp.loc[fp["Product"] == product, "Factory"])
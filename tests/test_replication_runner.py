@@ -0,0 +1,76 @@
+import glob
+import os
+import tempfile
+import time
+from concurrent.futures import CancelledError, ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.replication_runner import KPI_NAMES, RunningStats, run_replications, summarize_replications
+
+
+class _RecordingExecutor(ProcessPoolExecutor):
+    """Process pool keeping every future it hands out."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.futures = []
+
+    def submit(self, *args, **kwargs):
+        future = super().submit(*args, **kwargs)
+        self.futures.append(future)
+        return future
+
+
+def _model_files():
+    return set(glob.glob(os.path.join(tempfile.gettempdir(), "network_model_*.pkl")))
+
+
+def test_cancelled_run_keeps_model_file_until_queued_batches_finish(sample_model):
+    before = _model_files()
+    executor = _RecordingExecutor(max_workers=2)
+    # Busy workers leave the first batches in the pool's call queue when the run is cancelled
+    for _ in range(2):
+        executor.submit(time.sleep, 1.0)
+    with pytest.raises(CancelledError):
+        run_replications(sample_model, 20, horizon=60, batch_size=1, executor=executor, cancelled=lambda: True)
+    executor.shutdown(wait=True)
+    errors = [f.exception() for f in executor.futures if not f.cancelled() and f.exception() is not None]
+    assert errors == []
+    assert _model_files() == before
+
+
+@pytest.fixture(scope="module")
+def inline(sample_model):
+    return run_replications(sample_model, 9, horizon=60, master_seed=11, n_workers=1, batch_size=4)
+
+
+def test_results_only_depend_on_master_seed(sample_model, inline):
+    pooled = run_replications(sample_model, 9, horizon=60, master_seed=11, n_workers=2, batch_size=2)
+    with ProcessPoolExecutor(max_workers=3) as executor:
+        shared = run_replications(sample_model, 9, horizon=60, master_seed=11, batch_size=1, executor=executor)
+    pd.testing.assert_frame_equal(pooled.replications, inline.replications)
+    pd.testing.assert_frame_equal(shared.replications, inline.replications)
+    pd.testing.assert_frame_equal(shared.summary, inline.summary)
+    other = run_replications(sample_model, 9, horizon=60, master_seed=12, n_workers=1)
+    assert not other.replications.equals(inline.replications)
+
+
+def test_running_stats_match_summarize_replications():
+    rng = np.random.default_rng(0)
+    replications = pd.DataFrame(rng.normal(1000, 50, (25, len(KPI_NAMES))), columns=KPI_NAMES)
+    stats = RunningStats()
+    for _, row in replications.iterrows():
+        stats.add(row)
+    pd.testing.assert_frame_equal(stats.summary(0.9), summarize_replications(replications, 0.9))
+
+
+def test_early_stop_lands_on_the_same_replication(sample_model):
+    kwargs = dict(horizon=60, master_seed=3, tolerances={"total_cost": 0.01}, min_replications=4)
+    inline = run_replications(sample_model, 40, n_workers=1, batch_size=1, **kwargs)
+    pooled = run_replications(sample_model, 40, n_workers=3, batch_size=3, **kwargs)
+    assert inline.stopped_early
+    assert 4 <= len(inline.replications) < 40
+    pd.testing.assert_frame_equal(pooled.replications, inline.replications)
@@ -0,0 +1,43 @@
+import os
+
+import numpy as np
+
+from src.run_cache import RunCache
+
+# Pickled size of one run below, give or take the pickle header
+RUN_BYTES = 8000
+
+
+def _put(cache, key, age):
+    """Cache a run and backdate it `age` seconds, so recency does not depend on timing."""
+    cache.put(key, np.full(RUN_BYTES // 8, len(key), dtype=float))
+    mtime = 1_000_000 - age
+    os.utime(cache._path(key), (mtime, mtime))
+
+
+def _keys(cache):
+    return sorted(name[: -len(".pkl")] for name in os.listdir(cache.root))
+
+
+def test_round_trip_and_missing_keys(tmp_path):
+    cache = RunCache(tmp_path)
+    cache.put("run", {"kpis": [1, 2]})
+    assert cache.get("run") == {"kpis": [1, 2]}
+    assert cache.get("other") is None
+    with open(cache._path("broken"), "wb") as f:
+        f.write(b"\x80")
+    assert cache.get("broken") is None
+
+
+def test_least_recently_used_runs_are_evicted_over_the_size_cap(tmp_path):
+    cache = RunCache(tmp_path, max_bytes=int(RUN_BYTES * 3.5))
+    for age, key in zip([40, 30, 20], ["a", "b", "c"]):
+        _put(cache, key, age)
+    assert _keys(cache) == ["a", "b", "c"]
+
+    # Reading a refreshes it, so b is now the least recently used
+    assert cache.get("a") is not None
+    _put(cache, "d", 10)
+    assert _keys(cache) == ["a", "c", "d"]
+    assert sum(os.path.getsize(cache._path(k)) for k in _keys(cache)) <= cache.max_bytes
+    assert not [name for name in os.listdir(cache.root) if name.endswith(".tmp")]
@@ -0,0 +1,59 @@
+import numpy as np
+import pandas as pd
+
+from src.network_model import DistributionSpec, NetworkModel
+from src.samplers import DistributionSampler, keyed_uniforms, stream_keys
+from src.simulation_engine import SimulationEngine
+
+from conftest import make_network
+
+
+def _sampler(parameters):
+    return DistributionSampler(
+        DistributionSpec(pd.Series(["Categorical"] * len(parameters)), parameters, "Lead Time Parameters")
+    )
+
+
+def test_categorical_row_summing_above_one_does_not_shift_the_next_row():
+    # The first row sums to 1.004, within the tolerance the validation allows. Padded to
+    # the widest row its cumulative probabilities used to reach into the next row's range
+    sampler = _sampler(
+        [
+            "{1: 0.882, 2: 0.122}",
+            "{10: 0.001, 20: 0.42, 30: 0.579}",
+            "{5: 0.25, 6: 0.25, 7: 0.25, 8: 0.25}",
+            "{1: 0.5, 2: 0.5}",
+            "{1: 0.5, 2: 0.5}",
+        ]
+    )
+    for u in [0.0015, 0.003, 0.0035]:
+        values = sampler.transform(np.array([[0.5, u, 0.1, 0.5, 0.5]]))
+        assert values.tolist() == [[1, 20, 5, 2, 2]]
+
+
+def test_categorical_draws_follow_their_probabilities():
+    sampler = _sampler(["{1: 0.2, 2: 0.8}", "{10: 0.5, 20: 0.25, 30: 0.25}"])
+    values = sampler.sample(np.random.default_rng(0), 20000)
+    assert np.isclose((values[:, 0] == 1).mean(), 0.2, atol=0.01)
+    assert np.isclose((values[:, 1] == 10).mean(), 0.5, atol=0.01)
+    assert set(np.unique(values[:, 1])) == {10, 20, 30}
+
+
+def test_keyed_uniforms_do_not_change_when_rows_are_added():
+    keys = stream_keys("demand", ["W0", "W0", "W1"], ["P0", "P1", "P0"])
+    more = stream_keys("demand", ["W2", "W1", "W0", "W0"], ["P3", "P0", "P1", "P0"])
+    u = keyed_uniforms(7, keys, 50)
+    np.testing.assert_array_equal(keyed_uniforms(7, more, 50)[:, [3, 2, 1]], u)
+    assert ((u > 0) & (u < 1)).all()
+    assert not np.array_equal(keyed_uniforms(8, keys, 50), u)
+    np.testing.assert_array_equal(keyed_uniforms(7, keys, 50, antithetic=True), 1 - u)
+
+
+def test_common_random_numbers_keep_demand_of_shared_warehouse_products():
+    tables = make_network(seed=4)
+    fewer = dict(tables)
+    fewer["Warehouse Product Level"] = tables["Warehouse Product Level"].iloc[3:].reset_index(drop=True)
+    seed = np.random.SeedSequence(1)
+    demand, _ = SimulationEngine(NetworkModel(tables), common_random_numbers=True)._sample_paths(seed, 90)
+    shared, _ = SimulationEngine(NetworkModel(fewer), common_random_numbers=True)._sample_paths(seed, 90)
+    np.testing.assert_array_equal(shared, demand[:, 3:])
@@ -0,0 +1,50 @@
+from concurrent.futures import CancelledError, ProcessPoolExecutor
+
+import pandas as pd
+import pytest
+
+from src.scenario_comparison import compare_scenarios
+from src.simulation_engine import SimulationEngine
+
+
+@pytest.fixture(scope="module")
+def scenarios(sample_model):
+    return (sample_model, "greedy", SimulationEngine), (sample_model, "linprog", SimulationEngine)
+
+
+@pytest.fixture(scope="module")
+def inline(scenarios):
+    return compare_scenarios(*scenarios, n_replications=6, horizon=60, master_seed=5, n_workers=1)
+
+
+def test_shared_pool_matches_inline_run(scenarios, inline):
+    progress, partials = [], []
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        shared = compare_scenarios(
+            *scenarios,
+            n_replications=6,
+            horizon=60,
+            master_seed=5,
+            n_workers=2,
+            executor=executor,
+            progress=lambda done, total: progress.append((done, total)),
+            partial=partials.append,
+        )
+    pd.testing.assert_frame_equal(shared.baseline, inline.baseline)
+    pd.testing.assert_frame_equal(shared.alternative, inline.alternative)
+    pd.testing.assert_frame_equal(shared.summary, inline.summary)
+    assert progress[-1] == (6, 6)
+    pd.testing.assert_frame_equal(partials[-1], inline.summary)
+
+
+def test_own_pool_matches_inline_run(scenarios, inline):
+    own = compare_scenarios(*scenarios, n_replications=6, horizon=60, master_seed=5, n_workers=2)
+    pd.testing.assert_frame_equal(own.summary, inline.summary)
+
+
+def test_cancelled_comparison_raises(scenarios):
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        with pytest.raises(CancelledError):
+            compare_scenarios(
+                *scenarios, n_replications=40, horizon=60, n_workers=2, executor=executor, cancelled=lambda: True
+            )
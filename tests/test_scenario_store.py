@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.scenario_store import ScenarioStore, run_input_hash
+from src.simulation_engine import SimulationEngine
+
+
+@pytest.fixture(scope="module")
+def results(sample_model):
+    engine = SimulationEngine(sample_model)
+    return {seed: engine.run(horizon=30, seed=seed) for seed in (1, 2)}
+
+
+@pytest.fixture
+def store(tmp_path, results):
+    store = ScenarioStore(tmp_path)
+    for seed, result in results.items():
+        store.save_run("Base", f"hash{seed}", result, {"seed": seed, "horizon": 30})
+    return store
+
+
+def test_runs_round_trip_through_the_store(store, results):
+    runs = store.runs()
+    assert sorted(runs["input_hash"]) == ["hash1", "hash2"]
+    row = runs.set_index("input_hash").loc["hash2"]
+    assert row["scenario"] == "Base"
+    assert row["seed"] == "2"
+    assert row["total_cost"] == pytest.approx(results[2].kpis["total_cost"])
+
+    daily = store.daily([("Base", "hash1")], ["demand", "lost"])
+    assert daily["day"].tolist() == list(range(1, 31))
+    np.testing.assert_allclose(daily["demand"], results[1].daily["demand"])
+    np.testing.assert_allclose(daily["lost"], results[1].daily["lost"])
+
+
+def test_series_totals_stream_each_run_in_batches(store, results):
+    # Batches smaller than a day split runs across many batches
+    totals = store.series_totals([("Base", "hash1"), ("Base", "hash2")], ["demand", "shipped"], batch_size=7)
+    for seed, result in results.items():
+        expected = pd.DataFrame(
+            {
+                "warehouse": result.warehouses,
+                "product": result.products,
+                "demand": result.series["demand"].sum(axis=0),
+                "shipped": result.series["shipped"].sum(axis=0),
+            }
+        ).groupby(["warehouse", "product"]).sum()
+        got = totals[totals["input_hash"] == f"hash{seed}"].set_index(["warehouse", "product"])
+        pd.testing.assert_frame_equal(
+            got[["demand", "shipped"]].sort_index(), expected.sort_index(), check_names=False
+        )
+
+
+def test_saving_the_same_inputs_replaces_the_run(store, results):
+    store.save_run("Base", "hash1", results[2], {"seed": 2, "horizon": 30})
+    runs = store.runs()
+    assert len(runs) == 2
+    daily = store.daily([("Base", "hash1")], ["demand"])
+    np.testing.assert_allclose(daily["demand"], results[2].daily["demand"])
+
+
+def test_input_hash_follows_tables_and_params(sample_tables):
+    params = {"seed": 1, "horizon": 30}
+    assert run_input_hash(sample_tables, params) == run_input_hash(dict(sample_tables), dict(params))
+    assert run_input_hash(sample_tables, {**params, "seed": 2}) != run_input_hash(sample_tables, params)
+    changed = dict(sample_tables)
+    level = next(iter(changed))
+    changed[level] = changed[level].iloc[1:]
+    assert run_input_hash(changed, params) != run_input_hash(sample_tables, params)
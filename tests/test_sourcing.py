@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+
+from src.network_model import NetworkModel
+from src.sourcing import allocate_orders, allocate_sources
+
+from conftest import make_network
+
+
+@pytest.fixture(scope="module")
+def model():
+    # Every product is made by three of four factories
+    return NetworkModel(make_network(n_warehouses=6, n_factories=4, sources=3, seed=3))
+
+
+@pytest.fixture(scope="module")
+def graph(model):
+    return model.lane_graph
+
+
+@pytest.fixture(scope="module")
+def n_fp(model):
+    return len(model.fp_product)
+
+
+def _day(graph, n_fp, seed):
+    """Random orders of about half the SKU-locations and factory stock short of them."""
+    rng = np.random.default_rng(seed)
+    order = np.where(rng.random(graph.n_rows) < 0.5, rng.integers(1, 60, graph.n_rows), 0).astype(float)
+    stock = rng.integers(0, 80, n_fp).astype(float)
+    return order, stock
+
+
+def _cost(graph, shipped):
+    return shipped @ graph.unit_cost
+
+
+@pytest.mark.parametrize("method", ["greedy", "linprog"])
+@pytest.mark.parametrize("seed", range(5))
+def test_no_factory_ships_more_than_its_stock(graph, n_fp, method, seed):
+    order, stock = _day(graph, n_fp, seed)
+    shipped = allocate_orders(graph, order, stock, method)
+    assert (shipped >= 0).all() and (shipped == np.floor(shipped)).all()
+    assert (np.bincount(graph.fp_row, weights=shipped, minlength=len(stock)) <= stock).all()
+    assert (np.bincount(graph.edge_row, weights=shipped, minlength=graph.n_rows) <= order).all()
+
+
+def test_greedy_ships_from_the_cheapest_source_while_it_has_stock(graph, n_fp):
+    order, _ = _day(graph, n_fp, 0)
+    stock = np.full(n_fp, 1e6)
+    shipped = allocate_orders(graph, order, stock)
+    first = graph.indptr[:-1]
+    np.testing.assert_array_equal(shipped[first], order)
+    assert shipped.sum() == order.sum()
+
+
+def test_greedy_moves_the_rest_of_an_order_to_the_next_cheapest_source(graph, n_fp):
+    row = 0
+    edges = graph.sources(row)
+    stock = np.zeros(n_fp)
+    stock[graph.fp_row[edges]] = [5, 4, 100]
+    got_edges, sent = allocate_sources(graph, [row], np.array([20.0]), stock)
+    np.testing.assert_array_equal(got_edges, np.arange(edges.start, edges.stop))
+    np.testing.assert_array_equal(sent, [5, 4, 11])
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_linprog_costs_no_more_than_greedy(graph, n_fp, seed):
+    order, stock = _day(graph, n_fp, seed)
+    greedy = allocate_orders(graph, order, stock, "greedy")
+    optimal = allocate_orders(graph, order, stock, "linprog")
+    # The LP first ships as many units as the stock allows, then picks the cheapest mix
+    assert optimal.sum() >= greedy.sum()
+    if optimal.sum() == greedy.sum():
+        assert _cost(graph, optimal) <= _cost(graph, greedy) + 1e-9
+
+
+def test_linprog_beats_greedy_when_cheapest_sources_compete(graph, n_fp):
+    # Two SKU-locations of one product whose cheapest source is the same factory:
+    # greedy splits that factory pro-rata, the LP gives it to whichever saves more
+    product_rows = np.flatnonzero(graph.fp_row[graph.indptr[:-1]] == graph.fp_row[graph.indptr[0]])[:2]
+    assert len(product_rows) == 2
+    order = np.zeros(graph.n_rows)
+    order[product_rows] = 10
+    stock = np.zeros(n_fp)
+    stock[graph.fp_row[graph.edges(product_rows)]] = 10
+    greedy = allocate_orders(graph, order, stock, "greedy")
+    optimal = allocate_orders(graph, order, stock, "linprog")
+    assert optimal.sum() == greedy.sum() == 20
+    assert _cost(graph, optimal) < _cost(graph, greedy)
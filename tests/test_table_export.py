@@ -0,0 +1,80 @@
+import zipfile
+from io import BytesIO
+
+import pandas as pd
+import pytest
+
+from src import table_export
+from src.table_export import export_file_name, export_tables
+from src.table_store import TableStore
+
+
+@pytest.fixture
+def tables():
+    return {
+        "Factory Level": pd.DataFrame({"Factory": ["F0", "F1"], "Holding Cost Per Unit Per Day": [0.5, 0.75]}),
+        "Warehouse Level": pd.DataFrame({"Warehouse": ["W0"], "Holding Cost Per Unit Per Day": [1.25]}),
+    }
+
+
+@pytest.fixture(autouse=True)
+def empty_memo():
+    table_export._exports.clear()
+    yield
+    table_export._exports.clear()
+
+
+def _unzip(data, read):
+    with zipfile.ZipFile(BytesIO(data)) as archive:
+        return {name: read(BytesIO(archive.read(name))) for name in archive.namelist()}
+
+
+def test_excel_round_trip(tables):
+    sheets = pd.read_excel(BytesIO(export_tables(tables, "Excel")), sheet_name=None)
+    assert list(sheets) == list(tables)
+    for name, df in tables.items():
+        pd.testing.assert_frame_equal(sheets[name], df)
+
+
+@pytest.mark.parametrize("fmt, read", [("CSV", pd.read_csv), ("Parquet", pd.read_parquet)])
+def test_zip_formats_write_one_file_per_table(tables, fmt, read):
+    extension = "csv" if fmt == "CSV" else "parquet"
+    files = _unzip(export_tables(tables, fmt), read)
+    assert sorted(files) == [f"Factory_Level.{extension}", f"Warehouse_Level.{extension}"]
+    # Parquet reads text back as the string dtype it was written with
+    pd.testing.assert_frame_equal(files[f"Factory_Level.{extension}"], tables["Factory Level"], check_dtype=False)
+
+
+def test_parquet_accepts_mixed_object_columns():
+    # An edited text cell can leave numbers next to strings
+    mixed = {"Factory Level": pd.DataFrame({"Factory": ["F0", 7]})}
+    files = _unzip(export_tables(mixed, "Parquet"), pd.read_parquet)
+    assert files["Factory_Level.parquet"]["Factory"].tolist() == ["F0", "7"]
+
+
+def test_exports_are_memoized_by_format_and_content(tables):
+    data = export_tables(tables, "CSV")
+    assert export_tables({name: df.copy() for name, df in tables.items()}, "CSV") is data
+    assert export_tables(TableStore(tables), "Excel") is export_tables(TableStore(tables), "Excel")
+    assert export_tables(tables, "Parquet") is not data
+
+    subset = export_tables(tables, "CSV", sheets=["Warehouse Level"])
+    assert list(_unzip(subset, pd.read_csv)) == ["Warehouse_Level.csv"]
+
+    changed = dict(tables)
+    changed["Warehouse Level"] = changed["Warehouse Level"].assign(**{"Holding Cost Per Unit Per Day": [2.0]})
+    assert export_tables(changed, "CSV") != data
+
+
+def test_memo_keeps_the_most_recent_exports(tables):
+    for i in range(table_export._MAX_EXPORTS + 3):
+        export_tables({"Factory Level": tables["Factory Level"].head(1).assign(Copy=i)}, "CSV")
+    assert len(table_export._exports) == table_export._MAX_EXPORTS
+
+
+def test_file_names():
+    assert export_file_name("Network Design", "Excel") == (
+        "Network_Design.xlsx",
+        "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    )
+    assert export_file_name("Network Design", "Parquet") == ("Network_Design.zip", "application/zip")
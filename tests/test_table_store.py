@@ -0,0 +1,59 @@
+import pandas as pd
+import pytest
+
+from src.table_store import TableStore, table_hash, table_hashes
+
+LEVEL = "Warehouse Level"
+
+
+@pytest.fixture
+def warehouses():
+    return pd.DataFrame({"Warehouse": ["W0", "W1", "W2"], "Holding Cost Per Unit Per Day": [0.5, 0.25, 1.0]})
+
+
+def test_versions_only_change_with_content(warehouses):
+    store = TableStore({LEVEL: warehouses})
+    stored = store[LEVEL]
+    assert store.version(LEVEL) == 1
+    store[LEVEL] = warehouses.copy()
+    assert store.version(LEVEL) == 1
+    assert store[LEVEL] is stored
+
+    edited = warehouses.copy()
+    edited.loc[1, "Holding Cost Per Unit Per Day"] = 0.3
+    store[LEVEL] = edited
+    assert store.version(LEVEL) == 2
+    assert store[LEVEL].loc[1, "Holding Cost Per Unit Per Day"] == 0.3
+    assert store.version("Factory Level") == 0
+    del store[LEVEL]
+    assert store.version(LEVEL) == 0
+
+
+def test_snapshots_share_frames_but_not_writes(warehouses):
+    store = TableStore({LEVEL: warehouses})
+    snapshot = store.snapshot()
+    assert snapshot[LEVEL] is store[LEVEL]
+    store[LEVEL] = warehouses.iloc[:2]
+    assert len(snapshot[LEVEL]) == 3
+    assert snapshot.version(LEVEL) == 1
+    assert snapshot.content_hash(LEVEL) != store.content_hash(LEVEL)
+
+
+def test_table_hash_covers_values_order_columns_and_dtypes(warehouses):
+    base = table_hash(warehouses)
+    assert table_hash(warehouses.copy()) == base
+    changed = [
+        warehouses.assign(**{"Holding Cost Per Unit Per Day": [0.5, 0.25, 1.5]}),
+        warehouses.iloc[::-1],
+        warehouses.rename(columns={"Warehouse": "Site"}),
+        warehouses.astype({"Holding Cost Per Unit Per Day": "float32"}),
+        warehouses.astype({"Warehouse": "category"}),
+    ]
+    assert len({base, *map(table_hash, changed)}) == len(changed) + 1
+
+
+def test_table_hashes_reuse_store_hashes(warehouses):
+    store = TableStore({LEVEL: warehouses})
+    hashes = table_hashes(store, [LEVEL, "Factory Level"])
+    assert hashes[LEVEL] == store.content_hash(LEVEL) == table_hash(store[LEVEL])
+    assert hashes == table_hashes(dict(store), [LEVEL, "Factory Level"])
@@ -0,0 +1,58 @@
+import pandas as pd
+import pytest
+
+from src.table_window import filter_labels, filter_options, merge_window
+
+
+@pytest.fixture
+def table():
+    # Labels with a gap, as left by an earlier deletion
+    return pd.DataFrame(
+        {
+            "Warehouse": ["W0", "W1", "W0", "W1", "W0", "W1", "W1"],
+            "Product": ["P0", "P0", "P1", "P1", "P2", "P2", "P3"],
+            "Starting Inventory": [10, 11, 12, 13, 14, 15, 16],
+        },
+        index=[0, 1, 2, 3, 5, 6, 7],
+    )
+
+
+def _window(table, labels):
+    """The page as the data editor gets it."""
+    return table.loc[labels].reset_index(drop=True)
+
+
+def test_filter_labels_and_options(table):
+    assert filter_labels(table, {"Warehouse": ["W1"], "Product": []}).tolist() == [1, 3, 6, 7]
+    assert filter_labels(table).tolist() == table.index.tolist()
+    categorical = table.astype({"Warehouse": "category"}).iloc[:1]
+    assert filter_options(categorical) == {"Warehouse": ["W0"], "Product": ["P0"]}
+
+
+def test_untouched_window_leaves_the_table_as_is(table):
+    labels = filter_labels(table, {"Warehouse": ["W1"]})[1:3]
+    pd.testing.assert_frame_equal(merge_window(table, labels, _window(table, labels)), table)
+
+
+def test_edits_deletions_and_additions_in_a_filtered_page(table):
+    # Second page of two W1 rows per page: labels 6 & 7
+    labels = filter_labels(table, {"Warehouse": ["W1"]})[2:4]
+    window = _window(table, labels)
+    window.loc[1, "Starting Inventory"] = 99
+    window = window.drop(index=0)
+    window.loc[2] = ["W1", "P9", 5]
+
+    merged = merge_window(table, labels, window)
+    assert merged.index.tolist() == [0, 1, 2, 3, 5, 7, 8]
+    assert merged.loc[7, "Starting Inventory"] == 99
+    assert merged.loc[8].tolist() == ["W1", "P9", 5]
+    # Rows outside the page keep their values & order
+    outside = [0, 1, 2, 3, 5]
+    pd.testing.assert_frame_equal(merged.loc[outside], table.loc[outside])
+
+
+def test_deleting_every_row_of_a_page(table):
+    labels = filter_labels(table, {"Warehouse": ["W0"]})
+    merged = merge_window(table, labels, _window(table, labels).iloc[:0])
+    assert merged.index.tolist() == [1, 3, 6, 7]
+    assert (merged["Warehouse"] == "W1").all()
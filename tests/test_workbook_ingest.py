@@ -0,0 +1,69 @@
+import pandas as pd
+import pytest
+
+from src import workbook_ingest
+from src.workbook_ingest import read_level_table, read_network_workbook
+
+needs_calamine = pytest.mark.skipif(
+    workbook_ingest.excel_engine() != "calamine", reason="python-calamine is not installed"
+)
+ENGINES = ["openpyxl", pytest.param("calamine", marks=needs_calamine)]
+
+
+@pytest.fixture
+def workbook(tmp_path):
+    path = tmp_path / "network.xlsx"
+    with pd.ExcelWriter(path) as writer:
+        pd.DataFrame(
+            {
+                "Factory": ["F1", "F2", 3],
+                "Product": ["P1", "P2", "P3"],
+                "Production Capacity": [100, 200, 300],
+                "Starting Inventory": [50, None, 70],
+                "Production Cost Per Unit": [2.5, 3, 4],
+                "Notes": ["a", "b", "c"],
+            }
+        ).to_excel(writer, sheet_name="Factory Product Level", index=False)
+        pd.DataFrame({"Warehouse": ["W1", "W2"], "Holding Cost Per Unit Per Day": [1, "bad"]}).to_excel(
+            writer, sheet_name="Warehouse Level", index=False
+        )
+        pd.DataFrame({"Anything": [1]}).to_excel(writer, sheet_name="Other", index=False)
+    return path
+
+
+@pytest.fixture(params=ENGINES)
+def engine(request, monkeypatch):
+    monkeypatch.setattr(workbook_ingest, "excel_engine", lambda: request.param)
+    return request.param
+
+
+def test_only_level_sheets_and_columns_are_read(workbook, engine):
+    tables = read_network_workbook(workbook)
+    assert set(tables) == {"Factory Product Level", "Warehouse Level"}
+    assert "Notes" not in tables["Factory Product Level"].columns
+
+
+def test_level_columns_are_typed(workbook, engine):
+    df = read_network_workbook(workbook)["Factory Product Level"]
+    # Whole numbers stay integers, blanks make a column float, like pd.read_excel
+    assert df["Production Capacity"].dtype == "int64"
+    assert df["Starting Inventory"].dtype == "float64"
+    assert df["Starting Inventory"].isna().tolist() == [False, True, False]
+    assert df["Production Cost Per Unit"].dtype == "float64"
+    # Text columns hold strings, a numeric key included
+    assert df["Factory"].tolist() == ["F1", "F2", "3"]
+
+
+def test_non_numeric_cell_is_kept_for_validation(workbook, engine):
+    df = read_network_workbook(workbook)["Warehouse Level"]
+    assert df["Holding Cost Per Unit Per Day"].tolist() == [1, "bad"]
+
+
+def test_level_table_falls_back_to_first_sheet(tmp_path, engine):
+    path = tmp_path / "factories.xlsx"
+    pd.DataFrame({"Factory": ["F1"], "Holding Cost Per Unit Per Day": [1.5]}).to_excel(
+        path, sheet_name="Sheet1", index=False
+    )
+    df = read_level_table(path, "Factory Level")
+    assert df["Factory"].tolist() == ["F1"]
+    assert df["Holding Cost Per Unit Per Day"].tolist() == [1.5]